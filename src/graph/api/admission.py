@@ -0,0 +1,205 @@
+# src/graph/api/admission.py
+
+import asyncio
+import heapq
+import itertools
+import time
+from typing import List, Optional, Tuple
+
+from loguru import logger
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from graph.infra.config import get_settings
+from graph.infra.config.schemas.api import AdmissionSettings
+from graph.infra.context import remaining_seconds
+from graph.infra.context.context_vars import get_tenant_id
+from graph.infra.observability.metrics.usage.api_metrics import (
+    API_ADMISSION_DECISIONS_TOTAL, API_ADMISSION_IN_FLIGHT,
+    API_ADMISSION_QUEUE_WAIT, API_ADMISSION_QUEUED)
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request is shed instead of admitted."""
+
+    def __init__(self, reason: str):
+        super().__init__(f"Request rejected: {reason}.")
+        self.reason = reason
+
+
+class AdmissionController:
+    """
+    Bounds the requests that run at once.
+
+    A request runs at once when a slot is free and nobody is waiting.
+    Otherwise it waits in a bounded queue, highest priority first and in
+    arrival order within a priority, for at most `max_queue_seconds`. When
+    the queue is full, a request displaces the newest queued request of a
+    lower priority or is rejected at once. Shedding early keeps the admitted
+    requests fast instead of letting every request queue until it times out.
+    """
+
+    def __init__(self, max_concurrency: int, max_queue: int, max_queue_seconds: float):
+        self._max_concurrency = max_concurrency
+        self._max_queue = max_queue
+        self._max_queue_seconds = max_queue_seconds
+        self._in_flight = 0
+        # Entries are (-priority, arrival, future); a slot is handed over by
+        # resolving the future.
+        self._queue: List[Tuple[int, int, asyncio.Future]] = []
+        self._arrivals = itertools.count()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    async def acquire(
+        self, priority: int = 0, max_wait: Optional[float] = None
+    ) -> None:
+        """
+        Waits for a slot, at most `max_queue_seconds` or `max_wait` when that
+        is shorter; raises `AdmissionRejected` if none comes in time.
+        """
+        if self._in_flight < self._max_concurrency and not self._queue:
+            self._in_flight += 1
+            self._decide("admitted", priority)
+            return
+
+        if len(self._queue) >= self._max_queue:
+            newest_lowest = max(self._queue, default=None)
+            if newest_lowest is None or newest_lowest[0] <= -priority:
+                self._decide("queue_full", priority)
+                raise AdmissionRejected("queue_full")
+            self._remove(newest_lowest)
+            newest_lowest[2].set_exception(AdmissionRejected("displaced"))
+            self._decide("displaced", -newest_lowest[0])
+
+        future = asyncio.get_running_loop().create_future()
+        entry = (-priority, next(self._arrivals), future)
+        heapq.heappush(self._queue, entry)
+        self._update_gauges()
+        timeout = self._max_queue_seconds
+        if max_wait is not None:
+            timeout = max(0.0, min(timeout, max_wait))
+        started = time.perf_counter()
+        try:
+            await asyncio.wait((future,), timeout=timeout)
+        except asyncio.CancelledError:
+            self._abandon(entry)
+            raise
+        finally:
+            API_ADMISSION_QUEUE_WAIT.observe(time.perf_counter() - started)
+
+        if not future.done():
+            self._abandon(entry)
+            self._decide("timeout", priority)
+            raise AdmissionRejected("timeout")
+        future.result()  # Raises when a higher-priority request displaced it.
+        self._decide("admitted", priority)
+
+    def release(self) -> None:
+        """Frees the slot of a finished request, handing it to the next one."""
+        while self._queue:
+            _, _, future = heapq.heappop(self._queue)
+            if not future.done():
+                future.set_result(None)
+                self._update_gauges()
+                return
+        self._in_flight -= 1
+        self._update_gauges()
+
+    def _abandon(self, entry: Tuple[int, int, asyncio.Future]) -> None:
+        future = entry[2]
+        if future.done() and not future.cancelled() and future.exception() is None:
+            # The slot was handed over just as the waiter gave up.
+            self.release()
+            return
+        self._remove(entry)
+        future.cancel()
+
+    def _remove(self, entry: Tuple[int, int, asyncio.Future]) -> None:
+        if entry in self._queue:
+            self._queue.remove(entry)
+            heapq.heapify(self._queue)
+        self._update_gauges()
+
+    def _decide(self, decision: str, priority: int) -> None:
+        API_ADMISSION_DECISIONS_TOTAL.labels(
+            decision=decision, priority=str(priority)
+        ).inc()
+        self._update_gauges()
+
+    def _update_gauges(self) -> None:
+        API_ADMISSION_IN_FLIGHT.set(self._in_flight)
+        API_ADMISSION_QUEUED.set(len(self._queue))
+
+
+class AdmissionMiddleware:
+    """
+    ASGI middleware that runs the requests of controlled paths through an
+    `AdmissionController` and answers shed ones with 503 and Retry-After.
+    Priorities come from the route (longest configured prefix) and the
+    request's tenant, set by `TenantMiddleware`; the higher of the two
+    applies.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        settings: Optional[AdmissionSettings] = None,
+        controller: Optional[AdmissionController] = None,
+    ):
+        self.app = app
+        self.settings = settings or get_settings().api.admission
+        self.controller = controller or AdmissionController(
+            self.settings.max_concurrency,
+            self.settings.max_queue,
+            self.settings.max_queue_seconds,
+        )
+        self._routes = sorted(
+            self.settings.route_priorities.items(),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(
+            tuple(self.settings.paths)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            # Time spent queueing counts against the request's deadline.
+            await self.controller.acquire(
+                self._priority(scope), max_wait=remaining_seconds()
+            )
+        except AdmissionRejected as e:
+            # Shedding happens under overload; logging each one would add to it.
+            logger.debug(f"Shed {scope['method']} {scope['path']}: {e.reason}.")
+            response = JSONResponse(
+                {"detail": "The server is overloaded; retry later."},
+                status_code=503,
+                headers={"Retry-After": str(self.settings.retry_after_seconds)},
+            )
+            await response(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release()
+
+    def _priority(self, scope: Scope) -> int:
+        priorities = []
+        for prefix, priority in self._routes:
+            if scope["path"].startswith(prefix):
+                priorities.append(priority)
+                break
+        tenant = get_tenant_id()
+        if tenant is not None and tenant in self.settings.tenant_priorities:
+            priorities.append(self.settings.tenant_priorities[tenant])
+        return max(priorities, default=self.settings.default_priority)
@@ -4,7 +4,12 @@ from fastapi import FastAPI
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 
+from graph.infra.config import get_settings
+
+from .admission import AdmissionMiddleware
+from .deadline import DeadlineMiddleware
 from .lifespan import lifespan
+from .tenant import TenantMiddleware
 
 app: Optional[FastAPI] = None
 
@@ -12,6 +17,15 @@ app: Optional[FastAPI] = None
 def create_app() -> FastAPI:
     app = FastAPI(lifespan=lifespan)
 
+    api_settings = get_settings().api
+    if api_settings.admission.enabled:
+        # Shed requests never reach routing, dependencies or the services.
+        app.add_middleware(AdmissionMiddleware, settings=api_settings.admission)
+    # Added later, so they run first: queueing for admission spends the
+    # budget, and the tenant sets the admission priority.
+    app.add_middleware(DeadlineMiddleware, settings=api_settings)
+    app.add_middleware(TenantMiddleware, settings=api_settings)
+
     app.mount("/static", StaticFiles(directory="static"), name="static")
 
     @app.get("/favicon.ico", include_in_schema=False)
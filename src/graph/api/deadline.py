@@ -0,0 +1,53 @@
+# src/graph/api/deadline.py
+
+import time
+from typing import Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from graph.infra.config import get_settings
+from graph.infra.config.schemas.api import ApiSettings
+from graph.infra.context import context_var_manager, context_vars
+
+
+class DeadlineMiddleware:
+    """
+    ASGI middleware that gives every request a deadline, stored in the
+    `timeout_deadline` context variable for the stages that honor it.
+
+    The budget is `deadline_seconds`; a client may ask for less in the
+    deadline header, never for more, so no request outlives the SLO.
+    """
+
+    def __init__(self, app: ASGIApp, settings: Optional[ApiSettings] = None):
+        self.app = app
+        self.settings = settings or get_settings().api
+        self._header = self.settings.deadline_header.lower().encode("latin-1")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        budget = self._budget(scope) if scope["type"] == "http" else None
+        if budget is None:
+            await self.app(scope, receive, send)
+            return
+
+        deadline = context_vars.set_timeout_deadline(time.time() + budget)
+        cancelled = context_vars.set_timeout_cancelled(False)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            context_var_manager.reset("timeout_cancelled", cancelled)
+            context_var_manager.reset("timeout_deadline", deadline)
+
+    def _budget(self, scope: Scope) -> Optional[float]:
+        budget = self.settings.deadline_seconds
+        for name, value in scope.get("headers", ()):
+            if name != self._header:
+                continue
+            try:
+                requested = float(value)
+            except ValueError:
+                break
+            if requested > 0:
+                budget = min(budget, requested) if budget else requested
+            break
+        return budget
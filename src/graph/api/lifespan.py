@@ -8,10 +8,13 @@ import uvloop
 from fastapi import FastAPI
 from loguru import logger
 
+from graph.embedding import EmbeddingService
 from graph.infra.config import get_settings
 from graph.infra.observability import setup_tracing
 from graph.infra.store.graph.providers import Neo4jStoreProvider
-from graph.infra.store.vector.providers.weaviate_store import WeaviateStore
+from graph.infra.store.vector.providers import (ShardedVectorStore,
+                                                WeaviateStore)
+from src.graph.retrieval.cache import ResponseCache
 from src.graph.retrieval.service import RetrievalService
 
 
@@ -28,24 +31,57 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # 1. Instantiate all infrastructure and application services
     neo4j_store = Neo4jStoreProvider(settings.store.graph)
-    weaviate_store = WeaviateStore(settings.store.vector)
+    weaviate_store = (
+        ShardedVectorStore.from_settings(settings.store.sharded)
+        if settings.store.sharded.shards
+        else WeaviateStore(settings.store.vector)
+    )
+
+    # One model copy per process, shared by everything that embeds text.
+    # Worker pools are for bulk ingestion; queries embed one text at a time.
+    embedding_service = EmbeddingService(settings.embedding, workers=False)
+    services = [neo4j_store, weaviate_store]
+
+    # Repeated queries are answered from the cache until the next ingestion.
+    response_cache = (
+        ResponseCache.from_settings(settings.retrieval.cache)
+        if settings.retrieval.cache.enabled
+        else None
+    )
+    if response_cache is not None:
+        services.append(response_cache)
 
     retrieval_service = RetrievalService(
-        vector_store=weaviate_store, graph_store=neo4j_store
+        vector_store=weaviate_store,
+        graph_store=neo4j_store,
+        embedding_model_name=settings.embedding.model_name,
+        embedding_service=embedding_service,
+        response_cache=response_cache,
+        chunk_oversample=(
+            settings.ingestion.chunk_search_oversample
+            if settings.ingestion.chunking
+            else 1
+        ),
     )
 
     # 2. Store instances in app.state for dependency injection
+    app.state.embedding_service = embedding_service
     app.state.neo4j_store = neo4j_store
     app.state.weaviate_store = weaviate_store
+    app.state.response_cache = response_cache
     app.state.retrieval_service = retrieval_service
 
-    # 3. Start all managed services concurrently
-    await asyncio.gather(neo4j_store.start(), weaviate_store.start())
+    # 3. Load and warm up the embedding model first: the app serves requests
+    # as soon as startup returns, and the first queries must not pay for
+    # the model load or kernel selection. The stores then start concurrently.
+    await embedding_service.start()
+    await asyncio.gather(*(service.start() for service in services))
     logger.info("--- Services Started Successfully ---")
 
     yield
 
     # --- Shutdown ---
     logger.info("--- Application Shutdown ---")
-    await asyncio.gather(neo4j_store.stop(), weaviate_store.stop())
+    await asyncio.gather(*(service.stop() for service in services))
+    await embedding_service.stop()
     logger.info("--- Services Stopped Gracefully ---")
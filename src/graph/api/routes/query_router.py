@@ -1,10 +1,11 @@
 # src/graph/api/routes/query_router.py
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, Field
 
+from graph.infra.context import DeadlineExceeded
 from src.graph.retrieval.service import RetrievalService
 
 # --- Pydantic Models for API Contract ---
@@ -12,6 +13,11 @@ from src.graph.retrieval.service import RetrievalService
 
 class QueryRequest(BaseModel):
     query: str = Field(..., min_length=3, description="The user query to search for.")
+    ef: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Optional vector index search breadth; higher trades latency for recall.",
+    )
 
 
 class Citation(BaseModel):
@@ -23,6 +29,10 @@ class Citation(BaseModel):
 class QueryResponse(BaseModel):
     context: str
     citations: List[Citation]
+    degraded: bool = Field(
+        default=False,
+        description="Ranked without graph context because the deadline was near.",
+    )
 
 
 # --- Dependency ---
@@ -47,7 +57,10 @@ async def query_endpoint(
     Receives a query, performs hybrid retrieval, and returns the
     synthesized context along with citations.
     """
-    retrieved_docs = await retrieval_service.query(request.query)
+    try:
+        retrieved_docs = await retrieval_service.query(request.query, ef=request.ef)
+    except DeadlineExceeded as e:
+        raise HTTPException(status_code=504, detail=str(e)) from e
 
     citations = [
         Citation(
@@ -61,4 +74,8 @@ async def query_endpoint(
     # In a real system, this context would be fed to an LLM.
     context = " ".join([doc.get("text", "") for doc in retrieved_docs[:3]])
 
-    return QueryResponse(context=context, citations=citations)
+    return QueryResponse(
+        context=context,
+        citations=citations,
+        degraded=any(doc.get("degraded") for doc in retrieved_docs),
+    )
@@ -0,0 +1,63 @@
+# src/graph/api/tenant.py
+
+import ipaddress
+from typing import Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from graph.infra.config import get_settings
+from graph.infra.config.schemas.api import ApiSettings
+from graph.infra.context import context_var_manager, context_vars
+
+
+class TenantMiddleware:
+    """
+    ASGI middleware that sets the `tenant_id` context variable of every
+    request from the tenant header, so cached responses, coalesced queries
+    and admission priorities are scoped to the tenant.
+
+    The header is not authenticated, so it is only honored on connections
+    from `tenant_trusted_proxies`: the gateway that authenticates clients
+    and sets the header must be the only way to reach the API with it.
+    """
+
+    def __init__(self, app: ASGIApp, settings: Optional[ApiSettings] = None):
+        self.app = app
+        self.settings = settings or get_settings().api
+        self._header = self.settings.tenant_header.lower().encode("latin-1")
+        self._proxies = [
+            ipaddress.ip_network(proxy, strict=False)
+            for proxy in self.settings.tenant_trusted_proxies
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        tenant = (
+            self._tenant(scope)
+            if scope["type"] == "http" and self._trusted(scope)
+            else None
+        )
+        if tenant is None:
+            await self.app(scope, receive, send)
+            return
+
+        token = context_vars.set_tenant_id(tenant)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            context_var_manager.reset("tenant_id", token)
+
+    def _trusted(self, scope: Scope) -> bool:
+        client = scope.get("client")
+        if not client or not self._proxies:
+            return False
+        try:
+            address = ipaddress.ip_address(client[0])
+        except ValueError:
+            return False
+        return any(address in proxy for proxy in self._proxies)
+
+    def _tenant(self, scope: Scope) -> Optional[str]:
+        for name, value in scope.get("headers", ()):
+            if name == self._header:
+                return value.decode("latin-1").strip() or None
+        return None
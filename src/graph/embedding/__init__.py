@@ -0,0 +1,29 @@
+from .cache import EmbeddingCache
+from .exceptions import (EmbeddingBackendError, EmbeddingCacheError,
+                         EmbeddingError, EmbeddingServerError)
+from .factory import create_embedding_backend
+from .parity import ParityReport, check_parity, compare_embeddings
+from .protocol import EmbeddingBackendProtocol
+from .providers import (EmbeddingModelLoader, LocalEmbeddingBackend,
+                        ProcessPoolEmbeddingBackend, RemoteEmbeddingBackend)
+from .server import EmbeddingServer
+from .service import EmbeddingService
+
+__all__ = [
+    "EmbeddingBackendProtocol",
+    "EmbeddingError",
+    "EmbeddingBackendError",
+    "EmbeddingCacheError",
+    "EmbeddingServerError",
+    "EmbeddingCache",
+    "EmbeddingService",
+    "EmbeddingServer",
+    "EmbeddingModelLoader",
+    "LocalEmbeddingBackend",
+    "ProcessPoolEmbeddingBackend",
+    "RemoteEmbeddingBackend",
+    "create_embedding_backend",
+    "ParityReport",
+    "check_parity",
+    "compare_embeddings",
+]
@@ -0,0 +1,77 @@
+# src/graph/embedding/batcher.py
+
+import asyncio
+from typing import Awaitable, Callable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from graph.infra.observability.metrics.usage.embedding_metrics import \
+    EMBEDDING_BATCH_TEXTS
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent encode calls into shared model calls.
+
+    The first call after a flush opens a batch that is sent once it holds
+    `max_texts` texts or `max_wait` seconds have passed, whichever comes
+    first. Every caller then gets back the rows of its own texts, or the
+    error of the shared call.
+    """
+
+    def __init__(
+        self,
+        encode: Callable[[List[str]], Awaitable[np.ndarray]],
+        max_texts: int,
+        max_wait: float,
+    ):
+        self._encode = encode
+        self._max_texts = max_texts
+        self._max_wait = max_wait
+        self._pending: List[Tuple[List[str], asyncio.Future]] = []
+        self._count = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(self, texts: List[str]) -> np.ndarray:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((texts, future))
+        self._count += len(texts)
+        if self._count >= self._max_texts:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_wait, self._flush)
+        return await future
+
+    async def close(self) -> None:
+        """Sends what is pending and waits for the calls in flight."""
+        self._flush()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending, self._count = self._pending, [], 0
+        if pending:
+            task = asyncio.ensure_future(self._run(pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, pending: List[Tuple[List[str], asyncio.Future]]) -> None:
+        texts = [text for batch, _ in pending for text in batch]
+        EMBEDDING_BATCH_TEXTS.observe(len(texts))
+        try:
+            vectors = await self._encode(texts)
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        start = 0
+        for batch, future in pending:
+            # A caller that was cancelled meanwhile no longer waits.
+            if not future.done():
+                future.set_result(vectors[start : start + len(batch)])
+            start += len(batch)
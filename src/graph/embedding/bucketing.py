@@ -0,0 +1,38 @@
+# src/graph/embedding/bucketing.py
+
+from bisect import bisect_left
+from typing import List, Sequence
+
+
+def bucket_batch_size(bound: int, max_batch_size: int, max_batch_tokens: int) -> int:
+    """Texts per batch of a bucket, keeping its padded tokens within budget."""
+    return max(1, min(max_batch_size, max_batch_tokens // bound))
+
+
+def bucket_batches(
+    lengths: Sequence[int],
+    buckets: Sequence[int],
+    max_batch_size: int,
+    max_batch_tokens: int,
+) -> List[List[int]]:
+    """
+    Groups text positions into batches of texts from the same length bucket.
+
+    A text falls into the smallest bucket bound that holds its token count;
+    longer texts share the last bucket. A model call pads its batch to the
+    longest text, so each batch holds at most `max_batch_tokens // bound`
+    texts: short texts are embedded in large batches, long ones in small
+    batches, and no call pads a short text to a long one.
+    """
+    bounds = sorted(buckets)
+    members: List[List[int]] = [[] for _ in bounds]
+    for position, length in enumerate(lengths):
+        members[min(bisect_left(bounds, length), len(bounds) - 1)].append(position)
+
+    batches: List[List[int]] = []
+    for bound, positions in zip(bounds, members):
+        size = bucket_batch_size(bound, max_batch_size, max_batch_tokens)
+        batches.extend(
+            positions[start : start + size] for start in range(0, len(positions), size)
+        )
+    return batches
@@ -0,0 +1,231 @@
+import fcntl
+import hashlib
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from graph.infra.observability.metrics.usage.embedding_metrics import \
+    EMBEDDING_CACHE_LOOKUPS_TOTAL
+
+from .exceptions import EmbeddingCacheError
+
+INDEX_FILE = "index.bin"
+META_FILE = "meta.json"
+LOCK_FILE = "lock"
+
+# One index entry: a 16-byte key digest and the (segment, row) it points to.
+_INDEX_DTYPE = np.dtype([("key", "u1", (16,)), ("segment", "<u4"), ("row", "<u8")])
+
+
+def _cache_key(model_name: str, text: str) -> bytes:
+    return hashlib.blake2b(
+        f"{model_name}\0{text}".encode("utf-8"), digest_size=16
+    ).digest()
+
+
+class EmbeddingCache:
+    """
+    On-disk, content-addressed cache of embeddings keyed by (model, text),
+    in a directory of its own per model and backend: int8 backends produce
+    slightly different vectors than the torch reference, so they never
+    share cached vectors.
+
+    Vectors are appended as raw float32 rows to segment files and located
+    through an append-only index of fixed-size entries, which is loaded into
+    memory on open. The index is only appended after its rows are flushed,
+    so a crash can lose the tail of a write but never yields a dangling entry.
+
+    Several processes (the shards of an ingestion run) may share a cache:
+    writes hold an exclusive lock on the cache directory and first catch up
+    with the entries and rows other processes appended, so row numbers are
+    always taken from the files rather than from this process's view.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        model_name: str,
+        segment_rows: int = 1_000_000,
+        backend: str = "torch",
+    ):
+        self.model_name = model_name
+        self.backend = backend
+        self._root = (
+            Path(path)
+            / hashlib.sha1(f"{backend}\0{model_name}".encode("utf-8")).hexdigest()
+        )
+        self._segment_rows = segment_rows
+        self._lock = threading.Lock()
+        self._index: Dict[bytes, Tuple[int, int]] = {}
+        self._maps: Dict[int, np.memmap] = {}
+        self.dimension: Optional[int] = None
+        self._segment, self._rows = 0, 0
+        # Bytes of the index file already loaded into `_index`.
+        self._index_bytes = 0
+        try:
+            self._open()
+        except Exception as e:
+            raise EmbeddingCacheError(
+                f"Failed to open the embedding cache at '{self._root}'."
+            ) from e
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def get_many(self, texts: List[str]) -> Tuple[Optional[np.ndarray], List[int]]:
+        """
+        Returns a matrix with the cached vectors filled in and the positions
+        of the texts that missed. The matrix is None when nothing was cached.
+        """
+        keys = [_cache_key(self.model_name, t) for t in texts]
+        with self._lock:
+            found = [self._index.get(k) for k in keys]
+            missing = [i for i, loc in enumerate(found) if loc is None]
+            EMBEDDING_CACHE_LOOKUPS_TOTAL.labels(result="hit").inc(
+                len(texts) - len(missing)
+            )
+            EMBEDDING_CACHE_LOOKUPS_TOTAL.labels(result="miss").inc(len(missing))
+            if len(missing) == len(texts):
+                return None, missing
+
+            vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+            for i, loc in enumerate(found):
+                if loc is not None:
+                    segment, row = loc
+                    vectors[i] = self._segment_map(segment, row)[row]
+            return vectors, missing
+
+    def put_many(self, texts: List[str], vectors: np.ndarray) -> None:
+        """Appends the vectors of texts that are not cached yet."""
+        matrix = np.ascontiguousarray(vectors, dtype=np.float32)
+        with self._lock, self._file_lock():
+            if self.dimension is None:
+                self._read_meta()
+            if self.dimension is None:
+                self._write_meta(matrix.shape[1])
+            self._catch_up()
+            new: Dict[bytes, int] = {}
+            for i, text in enumerate(texts):
+                key = _cache_key(self.model_name, text)
+                if key not in self._index:
+                    new[key] = i
+            start = 0
+            rows = list(new.items())
+            while start < len(rows):
+                room = self._segment_rows - self._rows
+                if room == 0:
+                    self._segment, self._rows = self._segment + 1, 0
+                    continue
+                self._append(rows[start : start + room], matrix)
+                start += room
+
+    # --- Files ---
+
+    def _segment_path(self, segment: int) -> Path:
+        return self._root / f"seg-{segment:06d}.f32"
+
+    def _segment_map(self, segment: int, row: int) -> np.memmap:
+        mapped = self._maps.get(segment)
+        if mapped is None or row >= len(mapped):
+            # The active segment grows; remap it when reading past its end.
+            mapped = np.memmap(self._segment_path(segment), dtype=np.float32, mode="r")
+            mapped = mapped.reshape(-1, self.dimension)
+            self._maps[segment] = mapped
+        return mapped
+
+    def _append(self, rows: List[Tuple[bytes, int]], matrix: np.ndarray) -> None:
+        entries = np.zeros(len(rows), dtype=_INDEX_DTYPE)
+        entries["key"] = np.frombuffer(b"".join(k for k, _ in rows), np.uint8).reshape(
+            -1, 16
+        )
+        entries["segment"] = self._segment
+        entries["row"] = np.arange(self._rows, self._rows + len(rows))
+
+        with open(self._segment_path(self._segment), "ab") as f:
+            f.write(matrix[[i for _, i in rows]].tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        with open(self._root / INDEX_FILE, "ab") as f:
+            f.write(entries.tobytes())
+        self._index_bytes += entries.nbytes
+
+        for (key, _), row in zip(rows, entries["row"]):
+            self._index[key] = (self._segment, int(row))
+        self._rows += len(rows)
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Holds the lock that serializes writers across processes."""
+        with open(self._root / LOCK_FILE, "a+b") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _open(self) -> None:
+        self._root.mkdir(parents=True, exist_ok=True)
+        with self._file_lock():
+            self._read_meta()
+            if self.dimension is not None:
+                self._catch_up()
+
+    def _read_meta(self) -> None:
+        meta = self._root / META_FILE
+        if meta.exists():
+            with open(meta, "r", encoding="utf-8") as f:
+                self.dimension = json.load(f)["dimension"]
+
+    def _catch_up(self) -> None:
+        """
+        Loads the index entries appended since the last call and positions
+        the next write after the last row of the active segment. Must be
+        called with the file lock held.
+        """
+        index_path = self._root / INDEX_FILE
+        if index_path.exists():
+            with open(index_path, "rb") as f:
+                f.seek(self._index_bytes)
+                data = f.read()
+            # Cut a torn trailing entry so that later appends stay aligned.
+            usable = len(data) - len(data) % _INDEX_DTYPE.itemsize
+            if usable < len(data):
+                os.truncate(index_path, self._index_bytes + usable)
+            entries = np.frombuffer(data[:usable], dtype=_INDEX_DTYPE)
+            self._index.update(
+                (k.tobytes(), (int(s), int(r)))
+                for k, s, r in zip(entries["key"], entries["segment"], entries["row"])
+            )
+            self._index_bytes += usable
+            if len(entries):
+                self._segment = max(self._segment, int(entries["segment"].max()))
+
+        # Another process may have started a segment it has not indexed yet.
+        while self._segment_path(self._segment + 1).exists():
+            self._segment += 1
+
+        # Rows written after the last index entry are orphaned but harmless;
+        # a torn trailing row is cut for the same reason as above.
+        self._rows = 0
+        active = self._segment_path(self._segment)
+        if active.exists():
+            row_bytes = self.dimension * 4
+            self._rows = os.path.getsize(active) // row_bytes
+            os.truncate(active, self._rows * row_bytes)
+
+    def _write_meta(self, dimension: int) -> None:
+        with open(self._root / META_FILE, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "model_name": self.model_name,
+                    "backend": self.backend,
+                    "dimension": dimension,
+                },
+                f,
+            )
+        self.dimension = dimension
@@ -0,0 +1,22 @@
+class EmbeddingError(Exception):
+    """Base exception for all errors in the embedding backends."""
+
+    pass
+
+
+class EmbeddingBackendError(EmbeddingError):
+    """Raised when an embedding backend fails to start or to encode a batch."""
+
+    pass
+
+
+class EmbeddingCacheError(EmbeddingError):
+    """Raised when the on-disk embedding cache cannot be opened or written."""
+
+    pass
+
+
+class EmbeddingServerError(EmbeddingBackendError):
+    """Raised when the embedding server is unreachable or rejects a request."""
+
+    pass
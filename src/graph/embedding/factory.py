@@ -0,0 +1,25 @@
+# src/graph/embedding/factory.py
+
+from graph.infra.config.schemas.embedding.embedding_config import \
+    EmbeddingSettings
+
+from .protocol import EmbeddingBackendProtocol
+from .providers import (EmbeddingModelLoader, LocalEmbeddingBackend,
+                        ProcessPoolEmbeddingBackend, RemoteEmbeddingBackend)
+
+
+def create_embedding_backend(
+    settings: EmbeddingSettings, workers: bool = True
+) -> EmbeddingBackendProtocol:
+    """
+    Builds the embedding backend the settings select: the node's embedding
+    server when a socket is configured, a worker pool when workers are
+    configured (and allowed), otherwise the in-process backend.
+    """
+    if settings.server_socket:
+        return RemoteEmbeddingBackend(settings)
+    if workers and settings.workers > 0:
+        return ProcessPoolEmbeddingBackend(
+            settings, model_loader=EmbeddingModelLoader(settings)
+        )
+    return LocalEmbeddingBackend(settings)
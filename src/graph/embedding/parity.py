@@ -0,0 +1,162 @@
+# src/graph/embedding/parity.py
+
+import argparse
+import asyncio
+import json
+from dataclasses import dataclass
+from itertools import islice
+from typing import List, Optional, Sequence
+
+import numpy as np
+from loguru import logger
+
+from graph.infra.config import get_settings
+from graph.infra.config.schemas.embedding.embedding_config import \
+    EmbeddingSettings
+
+from .protocol import EmbeddingBackendProtocol
+from .providers.local import LocalEmbeddingBackend
+
+
+@dataclass
+class ParityReport:
+    """How closely a backend's vectors match those of the reference model."""
+
+    texts: int
+    top_k: int
+    mean_cosine: float
+    min_cosine: float
+    recall_at_k: float
+    passed: bool
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def _neighbours(vectors: np.ndarray, k: int) -> np.ndarray:
+    similarities = vectors @ vectors.T
+    np.fill_diagonal(similarities, -np.inf)
+    return np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+
+
+def compare_embeddings(
+    candidate: np.ndarray,
+    reference: np.ndarray,
+    top_k: int = 10,
+    min_cosine: float = 0.99,
+    min_recall: float = 0.95,
+) -> ParityReport:
+    """
+    Compares two embeddings of the same texts. Besides the cosine similarity
+    of each pair of vectors, every text queries all the others: recall@k is
+    the share of its k nearest neighbours under the reference that the
+    candidate also ranks in its top k, which is what search results see.
+    """
+    candidate, reference = _normalize(candidate), _normalize(reference)
+    if candidate.shape != reference.shape:
+        raise ValueError("Both embeddings must cover the same texts.")
+    cosine = (candidate * reference).sum(axis=1)
+
+    count = len(reference)
+    k = min(top_k, count - 1)
+    recall = 1.0
+    if k > 0:
+        expected, found = _neighbours(reference, k), _neighbours(candidate, k)
+        overlap = [len(set(a) & set(b)) / k for a, b in zip(expected, found)]
+        recall = float(np.mean(overlap))
+    mean_cosine = float(cosine.mean()) if count else 1.0
+    return ParityReport(
+        texts=count,
+        top_k=k,
+        mean_cosine=mean_cosine,
+        min_cosine=float(cosine.min()) if count else 1.0,
+        recall_at_k=recall,
+        passed=mean_cosine >= min_cosine and recall >= min_recall,
+    )
+
+
+async def check_parity(
+    candidate: EmbeddingBackendProtocol,
+    reference: EmbeddingBackendProtocol,
+    texts: List[str],
+    settings: Optional[EmbeddingSettings] = None,
+) -> ParityReport:
+    """Embeds the texts with both backends and compares the results."""
+    settings = settings or get_settings().embedding
+    candidate_vectors, reference_vectors = await asyncio.gather(
+        candidate.encode(texts), reference.encode(texts)
+    )
+    return compare_embeddings(
+        candidate_vectors,
+        reference_vectors,
+        top_k=settings.parity_top_k,
+        min_cosine=settings.parity_min_cosine,
+        min_recall=settings.parity_min_recall,
+    )
+
+
+def read_texts(path: str, limit: int) -> List[str]:
+    """Reads the `text` field of the first `limit` records of a JSONL file."""
+    with open(path, "rb") as f:
+        records = (json.loads(line) for line in f if line.strip())
+        return [record["text"] for record in islice(records, limit)]
+
+
+async def run_parity(texts: List[str], settings: EmbeddingSettings) -> ParityReport:
+    """Loads the configured backend and the eager reference model to compare."""
+    settings = settings.model_copy(update={"warmup": False})
+    candidate = LocalEmbeddingBackend(settings, service_name="parity_candidate")
+    reference = LocalEmbeddingBackend(
+        settings.model_copy(update={"backend": "torch"}),
+        service_name="parity_reference",
+    )
+    await asyncio.gather(candidate.start(), reference.start())
+    try:
+        return await check_parity(candidate, reference, texts, settings)
+    finally:
+        await asyncio.gather(candidate.stop(), reference.stop())
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare an embedding backend with the reference model.",
+    )
+    parser.add_argument("--texts", default="data/documents.jsonl")
+    parser.add_argument(
+        "--limit", type=int, default=1000, help="Records embedded by both models."
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["torch", "torch_int8", "onnx_int8"],
+        help="Backend to check (defaults to the configured one).",
+    )
+    args = parser.parse_args(argv)
+
+    settings = get_settings().embedding
+    if args.backend:
+        settings = settings.model_copy(update={"backend": args.backend})
+    if settings.backend == "torch":
+        logger.warning("The 'torch' backend is the reference; parity is trivial.")
+
+    report = asyncio.run(run_parity(read_texts(args.texts, args.limit), settings))
+    logger.info(
+        f"Parity of '{settings.backend}' on {report.texts} texts: "
+        f"mean cosine {report.mean_cosine:.4f} (min {report.min_cosine:.4f}), "
+        f"recall@{report.top_k} {report.recall_at_k:.4f}."
+    )
+    if not report.passed:
+        logger.error(
+            f"Below the thresholds (cosine {settings.parity_min_cosine}, "
+            f"recall {settings.parity_min_recall})."
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(main())
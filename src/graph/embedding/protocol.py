@@ -0,0 +1,18 @@
+from typing import List, Protocol, runtime_checkable
+
+import numpy as np
+
+
+@runtime_checkable
+class EmbeddingBackendProtocol(Protocol):
+    """
+    Protocol for a text embedding backend.
+    This interface lets the ingestion and retrieval services stay agnostic of
+    where and how the model runs (in-process, worker processes, a server, ...).
+    """
+
+    async def encode(self, texts: List[str]) -> np.ndarray:
+        """
+        Embeds a batch of texts into a (len(texts), dimension) float32 matrix.
+        """
+        ...
@@ -0,0 +1,10 @@
+from .local import EmbeddingModelLoader, LocalEmbeddingBackend
+from .process_pool import ProcessPoolEmbeddingBackend
+from .remote import RemoteEmbeddingBackend
+
+__all__ = [
+    "EmbeddingModelLoader",
+    "LocalEmbeddingBackend",
+    "ProcessPoolEmbeddingBackend",
+    "RemoteEmbeddingBackend",
+]
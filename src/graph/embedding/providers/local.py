@@ -0,0 +1,223 @@
+import asyncio
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+from loguru import logger
+
+from graph.infra.config import get_settings
+from graph.infra.config.schemas.embedding.embedding_config import \
+    EmbeddingSettings
+from graph.infra.services.base import BaseService
+
+from ..bucketing import bucket_batch_size, bucket_batches
+from ..exceptions import EmbeddingBackendError
+
+
+class EmbeddingModelLoader:
+    """
+    Loads a SentenceTransformer model for the configured inference backend.
+
+    `torch` is the eager reference model. `torch_int8` quantizes its linear
+    layers to int8 with dynamic activation scales, which needs nothing
+    beyond torch. `onnx_int8` exports the model to an ONNX graph once,
+    quantizes it for the configured instruction set and runs it on ONNX
+    Runtime; it needs the `onnx` extra. Loaders are picklable, so worker
+    processes load the same backend as their parent.
+    """
+
+    def __init__(self, settings: EmbeddingSettings):
+        self.settings = settings
+
+    def __call__(self, model_name: str) -> Any:
+        if self.settings.backend == "onnx_int8":
+            return self._load_onnx_int8(model_name)
+
+        from sentence_transformers import SentenceTransformer
+
+        model = SentenceTransformer(model_name, device="cpu")
+        if self.settings.backend == "torch_int8":
+            import torch
+            from torch.ao.quantization import quantize_dynamic
+
+            # Linear layers hold almost all weights and FLOPs of the encoder.
+            model = quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        return model
+
+    def _load_onnx_int8(self, model_name: str) -> Any:
+        try:
+            import optimum.onnxruntime  # noqa: F401
+            from sentence_transformers import (
+                SentenceTransformer, export_dynamic_quantized_onnx_model)
+        except ImportError as e:
+            raise ImportError(
+                "The 'onnx_int8' embedding backend requires optimum and "
+                "onnxruntime (the 'onnx' extra)."
+            ) from e
+
+        export_dir = Path(self.settings.onnx_export_path) / model_name.replace(
+            "/", "__"
+        )
+        file_name = f"onnx/model_qint8_{self.settings.onnx_quantization}.onnx"
+        if not (export_dir / file_name).exists():
+            # The onnx backend exports the graph itself when a model ships none.
+            model = SentenceTransformer(model_name, backend="onnx", device="cpu")
+            model.save_pretrained(str(export_dir))
+            export_dynamic_quantized_onnx_model(
+                model, self.settings.onnx_quantization, str(export_dir)
+            )
+        return SentenceTransformer(
+            str(export_dir),
+            backend="onnx",
+            device="cpu",
+            model_kwargs={"file_name": file_name},
+        )
+
+
+class LocalEmbeddingBackend(BaseService):
+    """
+    Embeds texts in-process with the configured inference backend.
+
+    Texts are tokenized once per call and grouped by length bucket; each
+    bucket batch is trimmed to its longest text and run through the model's
+    forward pass, so every batch pads to a bound close to its texts' lengths
+    and stays within a fixed token budget. On start, a warmup batch per bucket pays for kernel
+    selection and buffer allocation before the first real request does.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[EmbeddingSettings] = None,
+        service_name: str = "local_embedding",
+        model_loader: Optional[Callable[[str], Any]] = None,
+    ):
+        super().__init__(service_name=service_name)
+        self.settings = settings or get_settings().embedding
+        self._model_loader = model_loader or EmbeddingModelLoader(self.settings)
+        self.model: Any = None
+        self.dimension: Optional[int] = None
+        self._buckets: List[int] = list(self.settings.length_buckets)
+        self.logger = logger.bind(service=self.service_name)
+
+    @property
+    def tokenizer(self) -> Any:
+        return getattr(self.model, "tokenizer", None)
+
+    async def _connect(self) -> None:
+        try:
+            self.model = await asyncio.to_thread(
+                self._model_loader, self.settings.model_name
+            )
+            self.dimension = int(self.model.get_sentence_embedding_dimension())
+            max_length = getattr(self.model, "max_seq_length", None)
+            if max_length:
+                # Texts are truncated to the model's length, so larger
+                # bounds would only shrink batches.
+                self._buckets = sorted({min(b, max_length) for b in self._buckets})
+            if self.settings.warmup:
+                await asyncio.to_thread(self.warmup)
+        except Exception as e:
+            self.model = None
+            raise EmbeddingBackendError(
+                f"Failed to load the '{self.settings.backend}' embedding backend."
+            ) from e
+        self.logger.info(
+            f"Loaded the '{self.settings.backend}' embedding backend "
+            f"(dim={self.dimension}, buckets={self._buckets})."
+        )
+
+    async def _close(self) -> None:
+        self.model = None
+
+    async def encode(self, texts: List[str]) -> np.ndarray:
+        if not self.is_ready():
+            raise EmbeddingBackendError("The embedding backend is not running.")
+        if not texts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+        try:
+            # encode is CPU-bound; the thread keeps the event loop free.
+            return await asyncio.to_thread(self._encode_bucketed, texts)
+        except Exception as e:
+            raise EmbeddingBackendError("The embedding model failed.") from e
+
+    def warmup(self) -> None:
+        """Embeds one full batch of synthetic text at every bucket bound."""
+        started = time.perf_counter()
+        settings = self.settings
+        for bound in self._buckets:
+            size = bucket_batch_size(
+                bound, settings.max_batch_size, settings.max_batch_tokens
+            )
+            # Common words are one token each in any vocabulary; two tokens
+            # are left for the special tokens around the text.
+            self._encode_bucketed([" ".join(["the"] * max(bound - 2, 1))] * size)
+        self.logger.info(
+            f"Warmed up {len(self._buckets)} length buckets in "
+            f"{time.perf_counter() - started:.2f}s."
+        )
+
+    def _preprocess(self, texts: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Tokenizes and pads all texts in one call.
+
+        Returns None for models without a right-padding tokenizer; those are
+        bucketed by word count and tokenize inside `encode`.
+        """
+        tokenizer = self.tokenizer
+        preprocess = getattr(self.model, "preprocess", None) or getattr(
+            self.model, "tokenize", None
+        )
+        if (
+            tokenizer is None
+            or preprocess is None
+            or getattr(tokenizer, "padding_side", "right") != "right"
+        ):
+            return None
+        features = preprocess(texts)
+        return features if "attention_mask" in features else None
+
+    def _forward(
+        self, features: Dict[str, Any], batch: List[int], length: int
+    ) -> np.ndarray:
+        import torch
+
+        rows = torch.as_tensor(batch)
+        # Padding is on the right, so trimming columns to the batch's
+        # longest text leaves every row's tokens intact.
+        inputs = {
+            name: (
+                value[rows, :length]
+                if isinstance(value, torch.Tensor) and value.dim() == 2
+                else value
+            )
+            for name, value in features.items()
+        }
+        with torch.inference_mode():
+            embeddings = self.model(inputs)["sentence_embedding"]
+        return embeddings.float().cpu().numpy()
+
+    def _encode_bucketed(self, texts: List[str]) -> np.ndarray:
+        features = self._preprocess(texts)
+        if features is None:
+            lengths = [len(text.split()) for text in texts]
+        else:
+            lengths = features["attention_mask"].sum(dim=1).tolist()
+        vectors = np.empty((len(texts), self.dimension), dtype=np.float32)
+        for batch in bucket_batches(
+            lengths,
+            self._buckets,
+            self.settings.max_batch_size,
+            self.settings.max_batch_tokens,
+        ):
+            if features is None:
+                vectors[batch] = self.model.encode(
+                    [texts[i] for i in batch],
+                    batch_size=len(batch),
+                    show_progress_bar=False,
+                )
+            else:
+                vectors[batch] = self._forward(
+                    features, batch, max(lengths[i] for i in batch)
+                )
+        return vectors
@@ -0,0 +1,169 @@
+import asyncio
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from graph.infra.config import get_settings
+from graph.infra.config.schemas.embedding.embedding_config import \
+    EmbeddingSettings
+from graph.infra.services.base import BaseService
+
+from ..exceptions import EmbeddingBackendError
+
+# --- Worker process state ---
+# Each worker loads the model once in its initializer and keeps its
+# attachments to the parent's shared-memory slots across calls.
+
+_worker_model: Any = None
+_worker_slots: Dict[str, SharedMemory] = {}
+
+
+def _load_sentence_transformer(model_name: str) -> Any:
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(model_name)
+
+
+def _init_worker(
+    model_name: str, intra_op_threads: int, model_loader: Callable[[str], Any]
+) -> None:
+    global _worker_model
+    try:
+        import torch
+
+        torch.set_num_threads(intra_op_threads)
+    except ImportError:
+        pass
+    _worker_model = model_loader(model_name)
+
+
+def _worker_dimension() -> int:
+    return int(_worker_model.get_sentence_embedding_dimension())
+
+
+def _worker_encode_into(texts: List[str], slot_name: str) -> Tuple[int, int]:
+    """
+    Encodes texts and writes the vectors into the named shared-memory slot,
+    returning only the shape instead of pickling the matrix back.
+    """
+    vectors = np.asarray(
+        _worker_model.encode(texts, show_progress_bar=False), dtype=np.float32
+    )
+    slot = _worker_slots.get(slot_name)
+    if slot is None:
+        slot = SharedMemory(name=slot_name)
+        # The parent owns the segment; stop this process's tracker from
+        # unlinking it when the worker exits (Python < 3.13 has no track=False).
+        resource_tracker.unregister(slot._name, "shared_memory")
+        _worker_slots[slot_name] = slot
+    np.ndarray(vectors.shape, dtype=np.float32, buffer=slot.buf)[:] = vectors
+    return vectors.shape
+
+
+class ProcessPoolEmbeddingBackend(BaseService):
+    """
+    Embeds texts on a pool of worker processes, each holding one model copy.
+
+    Every call is split into chunks spread across the workers. Workers return
+    vectors through pre-allocated shared-memory slots, so only the texts and a
+    shape cross the process boundary as pickles.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[EmbeddingSettings] = None,
+        service_name: str = "process_pool_embedding",
+        model_loader: Optional[Callable[[str], Any]] = None,
+    ):
+        super().__init__(service_name=service_name)
+        self.settings = settings or get_settings().embedding
+        self._workers = max(1, self.settings.workers)
+        self._model_loader = model_loader or _load_sentence_transformer
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: List[SharedMemory] = []
+        self._free_slots: Optional[asyncio.Queue] = None
+        self.dimension: Optional[int] = None
+        self.logger = logger.bind(service=self.service_name)
+
+    async def _connect(self) -> None:
+        try:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers,
+                # Forking a process that already initialised torch is unsafe.
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(
+                    self.settings.model_name,
+                    self.settings.intra_op_threads,
+                    self._model_loader,
+                ),
+            )
+            loop = asyncio.get_running_loop()
+            dimensions = await asyncio.gather(
+                *(
+                    loop.run_in_executor(self._executor, _worker_dimension)
+                    for _ in range(self._workers)
+                )
+            )
+            self.dimension = dimensions[0]
+
+            slot_bytes = self.settings.max_batch_size * self.dimension * 4
+            self._free_slots = asyncio.Queue()
+            for _ in range(2 * self._workers):
+                slot = SharedMemory(create=True, size=slot_bytes)
+                self._slots.append(slot)
+                self._free_slots.put_nowait(slot)
+        except Exception as e:
+            await self._close()
+            raise EmbeddingBackendError(
+                "Failed to start the embedding worker pool."
+            ) from e
+        self.logger.info(
+            f"Started {self._workers} embedding workers "
+            f"({self.settings.intra_op_threads} threads each, dim={self.dimension})."
+        )
+
+    async def _close(self) -> None:
+        if self._executor:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        for slot in self._slots:
+            slot.close()
+            slot.unlink()
+        self._slots = []
+
+    async def encode(self, texts: List[str]) -> np.ndarray:
+        if not self.is_ready():
+            raise EmbeddingBackendError("The embedding worker pool is not running.")
+        if not texts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+
+        chunk_size = min(
+            self.settings.max_batch_size, math.ceil(len(texts) / self._workers)
+        )
+        chunks = await asyncio.gather(
+            *(
+                self._encode_chunk(texts[start : start + chunk_size])
+                for start in range(0, len(texts), chunk_size)
+            )
+        )
+        return np.concatenate(chunks)
+
+    async def _encode_chunk(self, texts: List[str]) -> np.ndarray:
+        slot = await self._free_slots.get()
+        try:
+            shape = await asyncio.get_running_loop().run_in_executor(
+                self._executor, _worker_encode_into, texts, slot.name
+            )
+            # Copy out before the slot is handed to the next chunk.
+            return np.ndarray(shape, dtype=np.float32, buffer=slot.buf).copy()
+        except Exception as e:
+            raise EmbeddingBackendError("An embedding worker failed.") from e
+        finally:
+            self._free_slots.put_nowait(slot)
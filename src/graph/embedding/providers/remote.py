@@ -0,0 +1,111 @@
+import asyncio
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from graph.infra.config import get_settings
+from graph.infra.config.schemas.embedding.embedding_config import \
+    EmbeddingSettings
+from graph.infra.services.base import BaseService
+
+from ..exceptions import EmbeddingServerError
+from ..wire import (OP_HEALTH, pack_encode_request, read_frame,
+                    unpack_response, unpack_vectors, write_frame)
+
+_Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class RemoteEmbeddingBackend(BaseService):
+    """
+    Embeds texts on the node's embedding server (`graph.embedding.server`).
+
+    Keeps up to `server_connections` connections to the server's Unix
+    socket and sends one request per connection at a time. Starting waits
+    for the server to answer its health probe, as it may still be loading
+    its model.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[EmbeddingSettings] = None,
+        service_name: str = "remote_embedding",
+    ):
+        super().__init__(service_name=service_name)
+        self.settings = settings or get_settings().embedding
+        self._slots = asyncio.Semaphore(self.settings.server_connections)
+        self._idle: List[_Connection] = []
+        self.dimension: Optional[int] = None
+        self.logger = logger.bind(service=self.service_name)
+
+    async def _connect(self) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.settings.server_timeout_seconds
+        while True:
+            try:
+                info = await self.health()
+                if info.get("status") == "ok":
+                    break
+            except EmbeddingServerError:
+                if loop.time() >= deadline:
+                    raise
+            if loop.time() >= deadline:
+                raise EmbeddingServerError("The embedding server is not ready.")
+            await asyncio.sleep(0.2)
+        self.dimension = info.get("dimension")
+        self.logger.info(
+            f"Connected to the embedding server at {self.settings.server_socket} "
+            f"(model={info.get('model')}, dim={self.dimension})."
+        )
+
+    async def _close(self) -> None:
+        for _, writer in self._idle:
+            writer.close()
+        self._idle = []
+
+    async def health(self) -> Dict[str, Any]:
+        """The server's health document: status, loaded models, dimension."""
+        return json.loads(await self._request(bytes([OP_HEALTH])))
+
+    async def encode(self, texts: List[str]) -> np.ndarray:
+        if not self.is_ready():
+            raise EmbeddingServerError("The embedding server client is not running.")
+        if not texts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+        body = await self._request(pack_encode_request(self.settings.model_name, texts))
+        return unpack_vectors(body)
+
+    async def _request(self, payload: bytes) -> bytes:
+        async with self._slots:
+            try:
+                reader, writer = self._idle.pop() if self._idle else await self._open()
+            except OSError as e:
+                raise EmbeddingServerError(
+                    f"Cannot reach the embedding server at "
+                    f"{self.settings.server_socket}."
+                ) from e
+            try:
+                write_frame(writer, payload)
+                await writer.drain()
+                response = await asyncio.wait_for(
+                    read_frame(reader, self.settings.server_max_frame_bytes),
+                    self.settings.server_timeout_seconds,
+                )
+            except BaseException as e:
+                # A connection with a half-read response cannot be reused.
+                writer.close()
+                if isinstance(e, (OSError, asyncio.IncompleteReadError)):
+                    raise EmbeddingServerError(
+                        "The embedding server connection failed."
+                    ) from e
+                if isinstance(e, asyncio.TimeoutError):
+                    raise EmbeddingServerError(
+                        "The embedding server did not answer in time."
+                    ) from e
+                raise
+            self._idle.append((reader, writer))
+        return unpack_response(response)
+
+    async def _open(self) -> _Connection:
+        return await asyncio.open_unix_connection(self.settings.server_socket)
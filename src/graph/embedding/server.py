@@ -0,0 +1,186 @@
+# src/graph/embedding/server.py
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+from loguru import logger
+
+from graph.infra.config import get_settings
+from graph.infra.config.schemas.embedding.embedding_config import \
+    EmbeddingSettings
+from graph.infra.observability.metrics.usage.embedding_metrics import (
+    EMBEDDING_SERVER_CONNECTIONS, EMBEDDING_SERVER_REQUESTS_TOTAL)
+from graph.infra.services.base import BaseService
+
+from .exceptions import EmbeddingServerError
+from .service import EmbeddingService
+from .wire import (OP_ENCODE, OP_HEALTH, pack_error, pack_health, pack_vectors,
+                   read_frame, unpack_encode_request, write_frame)
+
+
+class EmbeddingServer(BaseService):
+    """
+    Serves embeddings to the processes of a node over a Unix socket.
+
+    The models live only in this process, so memory per node stays flat as
+    API workers are added, and the server's `EmbeddingService` coalesces
+    the concurrent requests of all its clients into shared model calls.
+    Each connection carries one request at a time; clients keep a few
+    connections open to send requests concurrently.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[EmbeddingSettings] = None,
+        service_name: str = "embedding_server",
+        embedding_service: Optional[EmbeddingService] = None,
+    ):
+        super().__init__(service_name=service_name)
+        self.settings = settings or get_settings().embedding
+        if not self.settings.server_socket:
+            raise ValueError("The embedding server needs a server_socket path.")
+        self._socket_path = Path(self.settings.server_socket)
+        # The server embeds locally; its service must not connect to itself.
+        self._embedding = embedding_service or EmbeddingService(
+            self.settings.model_copy(update={"server_socket": None})
+        )
+        self._server: Optional[asyncio.AbstractServer] = None
+        self.logger = logger.bind(service=self.service_name)
+
+    async def _connect(self) -> None:
+        await self._embedding.start()
+        if self._socket_path.exists():
+            # Left behind by a server that did not shut down cleanly.
+            self._socket_path.unlink()
+        self._server = await asyncio.start_unix_server(
+            self._handle, path=str(self._socket_path)
+        )
+        os.chmod(self._socket_path, 0o660)
+        self.logger.info(f"Embedding server listening on {self._socket_path}.")
+
+    async def _close(self) -> None:
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        self._socket_path.unlink(missing_ok=True)
+        await self._embedding.stop()
+
+    def health(self) -> Dict[str, Any]:
+        return {
+            "status": "ok" if self._embedding.is_ready() else "starting",
+            "model": self._embedding.model_name,
+            "models": self._embedding.models,
+            "dimension": self._embedding.dimension,
+        }
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        EMBEDDING_SERVER_CONNECTIONS.inc()
+        try:
+            while True:
+                try:
+                    payload = await read_frame(
+                        reader, self.settings.server_max_frame_bytes
+                    )
+                except asyncio.IncompleteReadError:
+                    break  # The client closed the connection.
+                except EmbeddingServerError as e:
+                    # The rest of the frame cannot be skipped reliably.
+                    write_frame(writer, pack_error(str(e)))
+                    await writer.drain()
+                    break
+                write_frame(writer, await self._respond(payload))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            EMBEDDING_SERVER_CONNECTIONS.dec()
+            writer.close()
+
+    async def _respond(self, payload: bytes) -> bytes:
+        operation = payload[0] if payload else None
+        if operation == OP_HEALTH:
+            EMBEDDING_SERVER_REQUESTS_TOTAL.labels("health", "ok").inc()
+            return pack_health(self.health())
+        if operation != OP_ENCODE:
+            EMBEDDING_SERVER_REQUESTS_TOTAL.labels("unknown", "error").inc()
+            return pack_error(f"Unknown operation {operation}.")
+        try:
+            model_name, texts = unpack_encode_request(payload)
+            vectors = await self._embedding.encode(texts, model_name or None)
+        except Exception as e:
+            self.logger.exception("Failed to serve an encode request.")
+            EMBEDDING_SERVER_REQUESTS_TOTAL.labels("encode", "error").inc()
+            return pack_error(f"{type(e).__name__}: {e}")
+        EMBEDDING_SERVER_REQUESTS_TOTAL.labels("encode", "ok").inc()
+        return pack_vectors(vectors)
+
+
+async def serve(settings: EmbeddingSettings) -> None:
+    """Runs the server until SIGINT or SIGTERM."""
+    server = EmbeddingServer(settings)
+    stopped = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stopped.set)
+    await server.start()
+    try:
+        await stopped.wait()
+    finally:
+        await server.stop()
+
+
+async def probe(settings: EmbeddingSettings) -> Dict[str, Any]:
+    """Asks a running server for its health document."""
+    from .providers.remote import RemoteEmbeddingBackend
+
+    client = RemoteEmbeddingBackend(settings, service_name="embedding_probe")
+    try:
+        return await client.health()
+    finally:
+        await client.stop()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Serve embeddings to local processes over a Unix socket.",
+    )
+    parser.add_argument("--socket", help="Socket path (overrides settings).")
+    parser.add_argument(
+        "--health",
+        action="store_true",
+        help="Probe a running server and exit non-zero unless it is healthy.",
+    )
+    args = parser.parse_args(argv)
+
+    settings = get_settings().embedding
+    if args.socket:
+        settings = settings.model_copy(update={"server_socket": args.socket})
+    if not settings.server_socket:
+        logger.error("Set embedding.server_socket or pass --socket.")
+        return 2
+
+    if args.health:
+        try:
+            info = asyncio.run(probe(settings))
+        except Exception as e:
+            logger.error(f"The embedding server is unavailable: {e}")
+            return 1
+        print(json.dumps(info))
+        return 0 if info.get("status") == "ok" else 1
+
+    asyncio.run(serve(settings))
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(main())
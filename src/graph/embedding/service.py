@@ -0,0 +1,180 @@
+# src/graph/embedding/service.py
+
+import asyncio
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from graph.infra.config import get_settings
+from graph.infra.config.schemas.embedding.embedding_config import \
+    EmbeddingSettings
+from graph.infra.observability.metrics.usage.embedding_metrics import \
+    EMBEDDING_MEMORY_CACHE_LOOKUPS_TOTAL
+from graph.infra.services.base import BaseService
+
+from .batcher import MicroBatcher
+from .cache import EmbeddingCache
+from .exceptions import EmbeddingBackendError
+from .factory import create_embedding_backend
+from .protocol import EmbeddingBackendProtocol
+
+
+class EmbeddingService(BaseService):
+    """
+    Owns the embedding models of a process and serves every service that
+    embeds text.
+
+    Models are loaded in `_connect` rather than at construction, and kept in
+    a registry keyed by model name, so ingestion and retrieval running in
+    one process share a single copy. Vectors come from an in-memory LRU and,
+    when one is given, the on-disk cache before a model is asked; small
+    concurrent requests are coalesced into one model call.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[EmbeddingSettings] = None,
+        service_name: str = "embedding_service",
+        cache: Optional[EmbeddingCache] = None,
+        workers: bool = True,
+        backend_factory: Optional[
+            Callable[[EmbeddingSettings], EmbeddingBackendProtocol]
+        ] = None,
+    ):
+        super().__init__(service_name=service_name)
+        self.settings = settings or get_settings().embedding
+        self._cache = cache
+        self._backend_factory = backend_factory or (
+            lambda model_settings: create_embedding_backend(model_settings, workers)
+        )
+        self._models: Dict[str, EmbeddingBackendProtocol] = {}
+        self._batchers: Dict[str, MicroBatcher] = {}
+        self._load_lock = asyncio.Lock()
+        self._memory: "OrderedDict[Tuple[str, str], np.ndarray]" = OrderedDict()
+        self.logger = logger.bind(service=self.service_name)
+
+    @property
+    def model_name(self) -> str:
+        return self.settings.model_name
+
+    @property
+    def models(self) -> List[str]:
+        return list(self._models)
+
+    @property
+    def dimension(self) -> Optional[int]:
+        return getattr(self._models.get(self.model_name), "dimension", None)
+
+    @property
+    def tokenizer(self) -> Any:
+        """The default model's tokenizer, when its backend runs in-process."""
+        return getattr(self._models.get(self.model_name), "tokenizer", None)
+
+    async def _connect(self) -> None:
+        await self.load(self.model_name)
+        self.logger.info(f"Embedding service is ready with '{self.model_name}'.")
+
+    async def _close(self) -> None:
+        await asyncio.gather(*(b.close() for b in self._batchers.values()))
+        for backend in self._models.values():
+            if isinstance(backend, BaseService):
+                await backend.stop()
+        self._models, self._batchers = {}, {}
+        self._memory.clear()
+
+    async def load(self, model_name: str) -> EmbeddingBackendProtocol:
+        """Returns the registered backend of a model, starting it on first use."""
+        async with self._load_lock:
+            backend = self._models.get(model_name)
+            if backend is not None:
+                return backend
+            backend = self._backend_factory(
+                self.settings.model_copy(update={"model_name": model_name})
+            )
+            if isinstance(backend, BaseService):
+                await backend.start()
+            self._models[model_name] = backend
+            self._batchers[model_name] = MicroBatcher(
+                backend.encode,
+                self.settings.max_batch_size,
+                self.settings.batch_wait_ms / 1000,
+            )
+            self.logger.info(f"Loaded embedding model '{model_name}'.")
+            return backend
+
+    async def encode(
+        self, texts: List[str], model_name: Optional[str] = None
+    ) -> np.ndarray:
+        """Embeds texts with a registered model, the default one when unnamed."""
+        if not self.is_ready():
+            raise EmbeddingBackendError("The embedding service is not running.")
+        model_name = model_name or self.model_name
+        backend = self._models.get(model_name) or await self.load(model_name)
+        if not texts:
+            return np.empty((0, getattr(backend, "dimension", 0)), dtype=np.float32)
+
+        found: Dict[int, np.ndarray] = {}
+        missing = []
+        for position, text in enumerate(texts):
+            vector = self._remember(model_name, text)
+            if vector is None:
+                missing.append(position)
+            else:
+                found[position] = vector
+        EMBEDDING_MEMORY_CACHE_LOOKUPS_TOTAL.labels(result="hit").inc(len(found))
+        EMBEDDING_MEMORY_CACHE_LOOKUPS_TOTAL.labels(result="miss").inc(len(missing))
+        misses = list(missing)
+
+        # The on-disk cache belongs to one model.
+        cache = self._cache
+        if cache is not None and cache.model_name != model_name:
+            cache = None
+        if missing and cache is not None:
+            cached, still_missing = await asyncio.to_thread(
+                cache.get_many, [texts[i] for i in missing]
+            )
+            if cached is not None:
+                absent = set(still_missing)
+                for row, position in enumerate(missing):
+                    if row not in absent:
+                        found[position] = cached[row]
+                missing = [missing[row] for row in still_missing]
+
+        if missing:
+            missing_texts = [texts[i] for i in missing]
+            computed = await self._compute(model_name, missing_texts)
+            if cache is not None:
+                await asyncio.to_thread(cache.put_many, missing_texts, computed)
+            for position, vector in zip(missing, computed):
+                found[position] = vector
+
+        for position in misses:
+            self._memorize(model_name, texts[position], found[position])
+        return np.stack([found[i] for i in range(len(texts))]).astype(
+            np.float32, copy=False
+        )
+
+    async def _compute(self, model_name: str, texts: List[str]) -> np.ndarray:
+        # Bulk calls are batches already; only small ones wait for company.
+        settings = self.settings
+        if settings.batch_wait_ms == 0 or len(texts) >= settings.max_batch_size:
+            return await self._models[model_name].encode(texts)
+        return await self._batchers[model_name].submit(texts)
+
+    def _remember(self, model_name: str, text: str) -> Optional[np.ndarray]:
+        vector = self._memory.get((model_name, text))
+        if vector is not None:
+            self._memory.move_to_end((model_name, text))
+        return vector
+
+    def _memorize(self, model_name: str, text: str, vector: np.ndarray) -> None:
+        size = self.settings.memory_cache_size
+        if size == 0:
+            return
+        # A copy, so that a remembered row does not pin its whole batch.
+        self._memory[(model_name, text)] = np.array(vector, dtype=np.float32)
+        self._memory.move_to_end((model_name, text))
+        while len(self._memory) > size:
+            self._memory.popitem(last=False)
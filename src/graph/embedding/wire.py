@@ -0,0 +1,110 @@
+# src/graph/embedding/wire.py
+"""
+Framing of the embedding server protocol.
+
+Every message is a frame: a 4-byte little-endian payload length followed
+by the payload. A request payload starts with an opcode byte; a response
+payload starts with a status byte. Texts travel as length-prefixed UTF-8
+and vectors as raw little-endian float32 rows, so neither side pays for
+JSON on the hot path.
+
+    ENCODE request:  op | u16 name length | model name | u32 count
+                     | count x (u32 length | UTF-8 text)
+    ENCODE response: OK | u32 rows | u32 dimension | rows x dimension float32
+    HEALTH request:  op
+    HEALTH response: OK | UTF-8 JSON document
+    Any error:       ERROR | UTF-8 message
+"""
+
+import asyncio
+import json
+import struct
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from .exceptions import EmbeddingServerError
+
+OP_ENCODE = 1
+OP_HEALTH = 2
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+_LENGTH = struct.Struct("<I")
+_NAME_LENGTH = struct.Struct("<H")
+_SHAPE = struct.Struct("<II")
+_FLOAT32 = np.dtype("<f4")
+
+
+async def read_frame(reader: asyncio.StreamReader, max_bytes: int) -> bytes:
+    (length,) = _LENGTH.unpack(await reader.readexactly(_LENGTH.size))
+    if length > max_bytes:
+        raise EmbeddingServerError(f"Frame of {length} bytes exceeds {max_bytes}.")
+    return await reader.readexactly(length)
+
+
+def write_frame(writer: asyncio.StreamWriter, payload: bytes) -> None:
+    writer.write(_LENGTH.pack(len(payload)) + payload)
+
+
+def pack_encode_request(model_name: str, texts: List[str]) -> bytes:
+    name = model_name.encode("utf-8")
+    parts = [bytes([OP_ENCODE]), _NAME_LENGTH.pack(len(name)), name]
+    parts.append(_LENGTH.pack(len(texts)))
+    for text in texts:
+        data = text.encode("utf-8")
+        parts.append(_LENGTH.pack(len(data)))
+        parts.append(data)
+    return b"".join(parts)
+
+
+def unpack_encode_request(payload: bytes) -> Tuple[str, List[str]]:
+    """Parses an ENCODE payload, opcode included."""
+    view = memoryview(payload)
+    offset = 1
+    (name_length,) = _NAME_LENGTH.unpack_from(view, offset)
+    offset += _NAME_LENGTH.size
+    model_name = bytes(view[offset : offset + name_length]).decode("utf-8")
+    offset += name_length
+    (count,) = _LENGTH.unpack_from(view, offset)
+    offset += _LENGTH.size
+    texts = []
+    for _ in range(count):
+        (length,) = _LENGTH.unpack_from(view, offset)
+        offset += _LENGTH.size
+        texts.append(bytes(view[offset : offset + length]).decode("utf-8"))
+        offset += length
+    if offset != len(payload):
+        raise EmbeddingServerError("Malformed encode request.")
+    return model_name, texts
+
+
+def pack_vectors(vectors: np.ndarray) -> bytes:
+    matrix = np.ascontiguousarray(vectors, dtype=_FLOAT32)
+    rows, dimension = matrix.shape
+    return bytes([STATUS_OK]) + _SHAPE.pack(rows, dimension) + matrix.tobytes()
+
+
+def pack_health(info: Dict[str, Any]) -> bytes:
+    return bytes([STATUS_OK]) + json.dumps(info).encode("utf-8")
+
+
+def pack_error(message: str) -> bytes:
+    return bytes([STATUS_ERROR]) + message.encode("utf-8")
+
+
+def unpack_response(payload: bytes) -> bytes:
+    """Returns the body of a successful response; raises on an error one."""
+    if payload[0] == STATUS_ERROR:
+        raise EmbeddingServerError(payload[1:].decode("utf-8", errors="replace"))
+    return payload[1:]
+
+
+def unpack_vectors(body: bytes) -> np.ndarray:
+    rows, dimension = _SHAPE.unpack_from(body)
+    # frombuffer shares the frame's memory; the copy makes it writable.
+    return (
+        np.frombuffer(body, dtype=_FLOAT32, offset=_SHAPE.size)
+        .reshape(rows, dimension)
+        .astype(np.float32)
+    )
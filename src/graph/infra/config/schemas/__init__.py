@@ -1,13 +1,31 @@
 # src/graph/fortify/config/schemas/__init__.py
+from .api import AdmissionSettings, ApiSettings
 from .app_settings import AppSettings
+from .embedding import EmbeddingSettings
+from .ingestion import IngestionSettings
 from .observability import MetricsSettings, ObservabilitySettings
-from .store import GraphSettings, StoreSettings, VectorSettings
+from .resilience import ResilienceSettings, RetryPolicySettings, RetrySettings
+from .retrieval import ResponseCacheSettings, RetrievalSettings
+from .store import (GraphSettings, MmapVectorSettings, QuantizedVectorSettings,
+                    ShardedVectorSettings, StoreSettings, VectorSettings)
 
 __all__ = [
     "AppSettings",
+    "ApiSettings",
+    "AdmissionSettings",
+    "EmbeddingSettings",
+    "IngestionSettings",
     "ObservabilitySettings",
     "MetricsSettings",
+    "ResilienceSettings",
+    "RetrySettings",
+    "RetryPolicySettings",
+    "RetrievalSettings",
+    "ResponseCacheSettings",
     "StoreSettings",
     "GraphSettings",
     "VectorSettings",
+    "MmapVectorSettings",
+    "QuantizedVectorSettings",
+    "ShardedVectorSettings",
 ]
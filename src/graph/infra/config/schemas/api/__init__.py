@@ -0,0 +1,3 @@
+from .api_config import AdmissionSettings, ApiSettings
+
+__all__ = ["AdmissionSettings", "ApiSettings"]
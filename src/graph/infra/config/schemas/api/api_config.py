@@ -0,0 +1,96 @@
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class AdmissionSettings(BaseModel):
+    """
+    Admission control for the API: how many requests run at once, how many
+    may wait for a slot and for how long before they are shed with a 503.
+    """
+
+    model_config = ConfigDict(extra="ignore", populate_by_name=True)
+
+    enabled: bool = Field(
+        default=True,
+        alias="ENABLED",
+        description="Limit concurrent requests and shed the excess with 503 responses.",
+    )
+    paths: List[str] = Field(
+        default_factory=lambda: ["/query"],
+        alias="PATHS",
+        description="Path prefixes under admission control; other paths always run.",
+    )
+    max_concurrency: int = Field(
+        default=32,
+        ge=1,
+        alias="MAX_CONCURRENCY",
+        description="Requests running at once in each API process.",
+    )
+    max_queue: int = Field(
+        default=64,
+        ge=0,
+        alias="MAX_QUEUE",
+        description="Requests waiting for a slot; further ones are rejected at once.",
+    )
+    max_queue_seconds: float = Field(
+        default=0.5,
+        gt=0,
+        alias="MAX_QUEUE_SECONDS",
+        description="Longest wait for a slot before a queued request is rejected.",
+    )
+    retry_after_seconds: int = Field(
+        default=1,
+        ge=0,
+        alias="RETRY_AFTER_SECONDS",
+        description="Value of the Retry-After header of rejected requests.",
+    )
+    default_priority: int = Field(
+        default=0,
+        alias="DEFAULT_PRIORITY",
+        description="Priority of requests no route or tenant priority applies to.",
+    )
+    route_priorities: Dict[str, int] = Field(
+        default_factory=dict,
+        alias="ROUTE_PRIORITIES",
+        description="Priorities by path prefix; the longest matching prefix applies.",
+    )
+    tenant_priorities: Dict[str, int] = Field(
+        default_factory=dict,
+        alias="TENANT_PRIORITIES",
+        description="Priorities by tenant id; higher ones are admitted first.",
+    )
+
+
+class ApiSettings(BaseModel):
+    """Settings for the query API."""
+
+    model_config = ConfigDict(extra="ignore", populate_by_name=True)
+
+    tenant_header: str = Field(
+        default="X-Tenant-ID",
+        alias="TENANT_HEADER",
+        description="Request header carrying the tenant id of the request.",
+    )
+    tenant_trusted_proxies: List[str] = Field(
+        default_factory=list,
+        alias="TENANT_TRUSTED_PROXIES",
+        description=(
+            "Addresses or networks of the gateways that set the tenant header; "
+            "the header of any other client is ignored."
+        ),
+    )
+    deadline_seconds: Optional[float] = Field(
+        default=5.0,
+        gt=0,
+        alias="DEADLINE_SECONDS",
+        description="Time budget of each request; None leaves requests unbounded.",
+    )
+    deadline_header: str = Field(
+        default="X-Request-Timeout",
+        alias="DEADLINE_HEADER",
+        description="Header with a shorter budget, in seconds, chosen by the client.",
+    )
+    admission: AdmissionSettings = Field(
+        default_factory=AdmissionSettings, alias="ADMISSION"
+    )
@@ -5,8 +5,13 @@ from pydantic import BaseModel, ConfigDict, Field
 
 from graph.infra.config.schemas.store.store_config import StoreSettings
 
+from .api.api_config import ApiSettings
 from .context.context_config import ContextSettings
+from .embedding.embedding_config import EmbeddingSettings
+from .ingestion.ingestion_config import IngestionSettings
 from .observability.observability_config import ObservabilitySettings
+from .resilience.resilience_config import ResilienceSettings
+from .retrieval.retrieval_config import RetrievalSettings
 
 
 class AppSettings(BaseModel):
@@ -41,5 +46,35 @@ class AppSettings(BaseModel):
 
     store: StoreSettings = Field(default_factory=StoreSettings, alias="STORE")
 
+    embedding: EmbeddingSettings = Field(
+        default_factory=EmbeddingSettings,
+        alias="EMBEDDING",
+        description="Settings for text embedding backends.",
+    )
+
+    ingestion: IngestionSettings = Field(
+        default_factory=IngestionSettings,
+        alias="INGESTION",
+        description="Settings for the offline ingestion pipeline.",
+    )
+
+    api: ApiSettings = Field(
+        default_factory=ApiSettings,
+        alias="API",
+        description="Settings for the query API.",
+    )
+
+    retrieval: RetrievalSettings = Field(
+        default_factory=RetrievalSettings,
+        alias="RETRIEVAL",
+        description="Settings for the online query path.",
+    )
+
+    resilience: ResilienceSettings = Field(
+        default_factory=ResilienceSettings,
+        alias="RESILIENCE",
+        description="Retry settings for calls to external services.",
+    )
+
 
 AppSettings.model_rebuild()
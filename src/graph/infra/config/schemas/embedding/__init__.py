@@ -0,0 +1,3 @@
+from .embedding_config import EmbeddingSettings
+
+__all__ = ["EmbeddingSettings"]
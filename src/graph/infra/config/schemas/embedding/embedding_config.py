@@ -0,0 +1,139 @@
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+
+class EmbeddingSettings(BaseModel):
+    """Configuration settings for text embedding backends."""
+
+    model_config = ConfigDict(
+        extra="ignore", populate_by_name=True, protected_namespaces=()
+    )
+
+    model_name: str = Field(
+        default="all-MiniLM-L6-v2",
+        alias="MODEL_NAME",
+        description="SentenceTransformer model used to embed documents and queries.",
+    )
+    backend: Literal["torch", "torch_int8", "onnx_int8"] = Field(
+        default="torch",
+        alias="BACKEND",
+        description="Inference backend: eager torch (the reference) or an int8 model.",
+    )
+    onnx_export_path: str = Field(
+        default="data/.onnx",
+        alias="ONNX_EXPORT_PATH",
+        description="Directory holding the exported and quantized ONNX models.",
+    )
+    onnx_quantization: Literal["arm64", "avx2", "avx512", "avx512_vnni"] = Field(
+        default="avx2",
+        alias="ONNX_QUANTIZATION",
+        description="Instruction set targeted by the dynamic int8 ONNX quantization.",
+    )
+    length_buckets: List[int] = Field(
+        default=[32, 64, 128, 256, 512],
+        alias="LENGTH_BUCKETS",
+        description="Token-length bucket bounds; each batch holds texts of one bucket.",
+    )
+    max_batch_tokens: int = Field(
+        default=16384,
+        ge=1,
+        alias="MAX_BATCH_TOKENS",
+        description="Padded tokens per model call, so longer buckets get smaller batches.",
+    )
+    warmup: bool = Field(
+        default=True,
+        alias="WARMUP",
+        description="Run one batch per length bucket when the backend starts.",
+    )
+    parity_top_k: int = Field(
+        default=10,
+        ge=1,
+        alias="PARITY_TOP_K",
+        description="Neighbours compared by the parity check against the reference model.",
+    )
+    parity_min_cosine: float = Field(
+        default=0.99,
+        gt=0.0,
+        le=1.0,
+        alias="PARITY_MIN_COSINE",
+        description="Lowest mean cosine similarity to the reference vectors that passes.",
+    )
+    parity_min_recall: float = Field(
+        default=0.95,
+        gt=0.0,
+        le=1.0,
+        alias="PARITY_MIN_RECALL",
+        description="Lowest recall@k of the reference neighbours that passes.",
+    )
+    workers: int = Field(
+        default=0,
+        ge=0,
+        alias="WORKERS",
+        description="Embedding worker processes for bulk ingestion; 0 embeds in-process.",
+    )
+    intra_op_threads: int = Field(
+        default=1,
+        ge=1,
+        alias="INTRA_OP_THREADS",
+        description="Torch intra-op threads per worker process.",
+    )
+    max_batch_size: int = Field(
+        default=256,
+        ge=1,
+        alias="MAX_BATCH_SIZE",
+        description="Largest number of texts sent to one worker in a single call.",
+    )
+    batch_wait_ms: float = Field(
+        default=2.0,
+        ge=0.0,
+        alias="BATCH_WAIT_MS",
+        description="How long small concurrent requests wait to share a model call; 0 disables.",
+    )
+    memory_cache_size: int = Field(
+        default=10_000,
+        ge=0,
+        alias="MEMORY_CACHE_SIZE",
+        description="Vectors kept in the embedding service's in-memory LRU cache.",
+    )
+    server_socket: Optional[str] = Field(
+        default=None,
+        alias="SERVER_SOCKET",
+        description="Unix socket of a shared embedding server; unset loads models in-process.",
+    )
+    server_connections: int = Field(
+        default=4,
+        ge=1,
+        alias="SERVER_CONNECTIONS",
+        description="Connections each client keeps open to the embedding server.",
+    )
+    server_timeout_seconds: float = Field(
+        default=30.0,
+        gt=0.0,
+        alias="SERVER_TIMEOUT_SECONDS",
+        description="How long a client waits for the server to answer or to come up.",
+    )
+    server_max_frame_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        ge=1024,
+        alias="SERVER_MAX_FRAME_BYTES",
+        description="Largest request or response frame either side accepts.",
+    )
+    cache_path: Optional[str] = Field(
+        default=None,
+        alias="CACHE_PATH",
+        description="Directory of the on-disk embedding cache used by ingestion; unset disables it.",
+    )
+    cache_segment_rows: int = Field(
+        default=1_000_000,
+        ge=1,
+        alias="CACHE_SEGMENT_ROWS",
+        description="Vectors per cache segment file before a new one is started.",
+    )
+
+    @model_validator(mode="after")
+    def _check_length_buckets(self) -> "EmbeddingSettings":
+        if not self.length_buckets or min(self.length_buckets) < 1:
+            raise ValueError("length_buckets must be positive token counts.")
+        self.length_buckets = sorted(set(self.length_buckets))
+        return self
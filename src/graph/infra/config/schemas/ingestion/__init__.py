@@ -0,0 +1,3 @@
+from .ingestion_config import IngestionSettings
+
+__all__ = ["IngestionSettings"]
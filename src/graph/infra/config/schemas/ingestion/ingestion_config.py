@@ -0,0 +1,170 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+
+class IngestionSettings(BaseModel):
+    """Configuration settings for the offline ingestion pipeline."""
+
+    model_config = ConfigDict(extra="ignore", populate_by_name=True)
+
+    batch_size: int = Field(
+        default=128,
+        ge=1,
+        alias="BATCH_SIZE",
+        description="Number of records read, embedded and written per batch.",
+    )
+    queue_size: int = Field(
+        default=4,
+        ge=1,
+        alias="QUEUE_SIZE",
+        description="Capacity, in batches, of the bounded queue between two stages.",
+    )
+    parse_concurrency: int = Field(
+        default=1,
+        ge=1,
+        alias="PARSE_CONCURRENCY",
+        description=(
+            "Number of batches decoded at once in worker threads. Decoding "
+            "JSON holds the GIL, so more than one rarely speeds it up."
+        ),
+    )
+    embed_concurrency: int = Field(
+        default=1,
+        ge=1,
+        alias="EMBED_CONCURRENCY",
+        description="Number of batches embedded concurrently.",
+    )
+    write_concurrency: int = Field(
+        default=2,
+        ge=1,
+        alias="WRITE_CONCURRENCY",
+        description="Number of batches written to the stores concurrently.",
+    )
+    checkpoint_path: Optional[str] = Field(
+        default=None,
+        alias="CHECKPOINT_PATH",
+        description="State file recording committed batches per input; unset disables resuming.",
+    )
+    dead_letter_path: Optional[str] = Field(
+        default=None,
+        alias="DEAD_LETTER_PATH",
+        description=(
+            "JSONL file for batches whose writes still fail after retries; "
+            "unset aborts the run instead."
+        ),
+    )
+    incremental: bool = Field(
+        default=False,
+        alias="INCREMENTAL",
+        description="Only write new or changed records, tracked in a local hash manifest.",
+    )
+    manifest_path: str = Field(
+        default="data/.ingestion_manifest.sqlite",
+        alias="MANIFEST_PATH",
+        description="SQLite file holding the content hash of every ingested record.",
+    )
+    snapshot: bool = Field(
+        default=True,
+        alias="SNAPSHOT",
+        description="Treat inputs as full snapshots and delete records missing from them.",
+    )
+    tombstone_field: str = Field(
+        default="deleted",
+        alias="TOMBSTONE_FIELD",
+        description="Records with this field set to true are deleted from the stores.",
+    )
+    delete_batch_size: int = Field(
+        default=500,
+        ge=1,
+        alias="DELETE_BATCH_SIZE",
+        description="Number of ids removed from the stores per delete call.",
+    )
+    reader: Literal["auto", "jsonl", "parquet", "arrow"] = Field(
+        default="auto",
+        alias="READER",
+        description="Input format; 'auto' picks it from the file extension.",
+    )
+    json_decoder: Literal["auto", "orjson", "json"] = Field(
+        default="auto",
+        alias="JSON_DECODER",
+        description="JSON decoder for JSONL inputs; 'auto' uses orjson when installed.",
+    )
+    embedding_column: Optional[str] = Field(
+        default=None,
+        alias="EMBEDDING_COLUMN",
+        description="Field holding precomputed document vectors, which skip the model.",
+    )
+    chunking: bool = Field(
+        default=False,
+        alias="CHUNKING",
+        description="Split document texts into overlapping token windows before embedding.",
+    )
+    chunk_tokens: int = Field(
+        default=254,
+        ge=1,
+        alias="CHUNK_TOKENS",
+        description="Maximum tokens per chunk; keep it within the model's sequence length.",
+    )
+    chunk_overlap: int = Field(
+        default=32,
+        ge=0,
+        alias="CHUNK_OVERLAP",
+        description="Tokens shared by consecutive chunks of a document.",
+    )
+    chunk_search_oversample: int = Field(
+        default=4,
+        ge=1,
+        alias="CHUNK_SEARCH_OVERSAMPLE",
+        description="Vector hits fetched per requested document when chunking is on.",
+    )
+    link_wait: Literal["batch", "pipeline"] = Field(
+        default="batch",
+        alias="LINK_WAIT",
+        description=(
+            "'batch' starts linking alongside documents and entities, each link batch "
+            "waiting for the nodes it references; 'pipeline' links after both finish."
+        ),
+    )
+    adaptive_batching: bool = Field(
+        default=False,
+        alias="ADAPTIVE_BATCHING",
+        description="Tune embed and store batch sizes per operation with AIMD on latency.",
+    )
+    min_batch_size: int = Field(
+        default=16,
+        ge=1,
+        alias="MIN_BATCH_SIZE",
+        description="Lower bound of adaptive sizes.",
+    )
+    max_batch_size: int = Field(
+        default=1024,
+        ge=1,
+        alias="MAX_BATCH_SIZE",
+        description="Upper bound of adaptive sizes; inputs are read in batches of this size.",
+    )
+    target_latency_seconds: float = Field(
+        default=1.0,
+        gt=0,
+        alias="TARGET_LATENCY_SECONDS",
+        description="Calls slower than this shrink the batch size of their operation.",
+    )
+    batch_increase: int = Field(
+        default=16,
+        ge=1,
+        alias="BATCH_INCREASE",
+        description="Records added to a batch size after each call within the target.",
+    )
+    batch_decrease_factor: float = Field(
+        default=0.5,
+        gt=0,
+        lt=1,
+        alias="BATCH_DECREASE_FACTOR",
+        description="Factor applied to a batch size after a slow or failed call.",
+    )
+
+    @model_validator(mode="after")
+    def _check_chunk_overlap(self) -> "IngestionSettings":
+        if self.chunk_overlap >= self.chunk_tokens:
+            raise ValueError("chunk_overlap must be smaller than chunk_tokens.")
+        return self
@@ -0,0 +1,8 @@
+from .resilience_config import (ResilienceSettings, RetryPolicySettings,
+                                RetrySettings)
+
+__all__ = [
+    "ResilienceSettings",
+    "RetryPolicySettings",
+    "RetrySettings",
+]
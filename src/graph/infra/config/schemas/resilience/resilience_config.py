@@ -0,0 +1,88 @@
+from typing import Dict, List
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+# Failures that a later attempt can cure. Store wrappers keep the driver's
+# error as the cause, which is matched as well.
+TRANSIENT_EXCEPTIONS = [
+    "ConnectionError",
+    "TimeoutError",
+    "neo4j.exceptions.ServiceUnavailable",
+    "neo4j.exceptions.SessionExpired",
+    "neo4j.exceptions.TransientError",
+    "weaviate.exceptions.WeaviateConnectionError",
+    "weaviate.exceptions.WeaviateTimeoutError",
+    "graph.infra.store.graph.exceptions.GraphConnectionError",
+    "graph.infra.store.vector.exceptions.VectorConnectionError",
+]
+
+
+class RetryPolicySettings(BaseModel):
+    """How often and how patiently one kind of operation is retried."""
+
+    model_config = ConfigDict(extra="ignore", populate_by_name=True)
+
+    attempts: int = Field(
+        default=3,
+        ge=1,
+        alias="ATTEMPTS",
+        description="Total attempts, including the first call.",
+    )
+    wait_min_seconds: float = Field(
+        default=0.5,
+        ge=0,
+        alias="WAIT_MIN_SECONDS",
+        description="Lower bound of the wait before a retry.",
+    )
+    wait_max_seconds: float = Field(
+        default=5.0,
+        ge=0,
+        alias="WAIT_MAX_SECONDS",
+        description="Upper bound of the wait before a retry.",
+    )
+    backoff: float = Field(
+        default=2.0,
+        ge=1.0,
+        alias="BACKOFF",
+        description="Factor by which the wait ceiling grows after each attempt.",
+    )
+    exceptions: List[str] = Field(
+        default_factory=lambda: list(TRANSIENT_EXCEPTIONS),
+        alias="EXCEPTIONS",
+        description="Exception classes retried, also as causes; ['Exception'] retries all.",
+    )
+
+    @model_validator(mode="after")
+    def _check_waits(self) -> "RetryPolicySettings":
+        if self.wait_max_seconds < self.wait_min_seconds:
+            raise ValueError("wait_max_seconds must not be below wait_min_seconds.")
+        return self
+
+
+class RetrySettings(BaseModel):
+    """Retry settings: a default policy and optional per-operation overrides."""
+
+    model_config = ConfigDict(extra="ignore", populate_by_name=True)
+
+    enabled: bool = Field(
+        default=True,
+        alias="ENABLED",
+        description="Disabling makes every operation a single attempt.",
+    )
+    default_policy: RetryPolicySettings = Field(
+        default_factory=RetryPolicySettings,
+        alias="DEFAULT_POLICY",
+    )
+    policies: Dict[str, RetryPolicySettings] = Field(
+        default_factory=dict,
+        alias="POLICIES",
+        description="Policies keyed by operation name, e.g. 'graph.upsert_documents'.",
+    )
+
+
+class ResilienceSettings(BaseModel):
+    """Settings for handling transient failures of external services."""
+
+    model_config = ConfigDict(extra="ignore", populate_by_name=True)
+
+    retry: RetrySettings = Field(default_factory=RetrySettings, alias="RETRY")
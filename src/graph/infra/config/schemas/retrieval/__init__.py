@@ -0,0 +1,3 @@
+from .retrieval_config import ResponseCacheSettings, RetrievalSettings
+
+__all__ = ["ResponseCacheSettings", "RetrievalSettings"]
@@ -0,0 +1,53 @@
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ResponseCacheSettings(BaseModel):
+    """Settings for the cache of final query responses."""
+
+    model_config = ConfigDict(extra="ignore", populate_by_name=True)
+
+    enabled: bool = Field(
+        default=True,
+        alias="ENABLED",
+        description="Answer repeated queries from the cache until the next ingestion.",
+    )
+    max_entries: int = Field(
+        default=10000,
+        ge=0,
+        alias="MAX_ENTRIES",
+        description="Responses kept in each process's LRU; 0 disables that tier.",
+    )
+    ttl_seconds: float = Field(
+        default=3600.0,
+        gt=0,
+        alias="TTL_SECONDS",
+        description="Upper bound on the age of a cached response, in both tiers.",
+    )
+    redis_url: Optional[str] = Field(
+        default=None,
+        alias="REDIS_URL",
+        description="Redis-protocol server shared by all API processes (the 'cache' extra).",
+    )
+    epoch_path: str = Field(
+        default="data/.ingestion_epoch",
+        alias="EPOCH_PATH",
+        description="File holding the ingestion epoch when no Redis server is configured.",
+    )
+    epoch_refresh_seconds: float = Field(
+        default=1.0,
+        ge=0,
+        alias="EPOCH_REFRESH_SECONDS",
+        description="How long a process reuses the epoch it read before reading it again.",
+    )
+
+
+class RetrievalSettings(BaseModel):
+    """Settings for the online query path."""
+
+    model_config = ConfigDict(extra="ignore", populate_by_name=True)
+
+    cache: ResponseCacheSettings = Field(
+        default_factory=ResponseCacheSettings, alias="CACHE"
+    )
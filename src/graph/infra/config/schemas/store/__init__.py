@@ -1,3 +1,12 @@
-from .store_config import GraphSettings, StoreSettings, VectorSettings
+from .store_config import (GraphSettings, MmapVectorSettings,
+                           QuantizedVectorSettings, ShardedVectorSettings,
+                           StoreSettings, VectorSettings)
 
-__all__ = ["StoreSettings", "GraphSettings", "VectorSettings"]
+__all__ = [
+    "StoreSettings",
+    "GraphSettings",
+    "VectorSettings",
+    "MmapVectorSettings",
+    "QuantizedVectorSettings",
+    "ShardedVectorSettings",
+]
@@ -1,3 +1,5 @@
+from typing import List, Literal, Optional
+
 from pydantic import BaseModel, Field
 
 
@@ -9,6 +11,13 @@ class GraphSettings(BaseModel):
     uri: str = Field(..., description="The connection URI for the Neo4j database.")
     user: str = Field(..., description="The user name for authentication.")
     password: str = Field(..., description="The password for the specified user.")
+    entity_write_mode: Literal["merge", "create"] = Field(
+        default="merge",
+        description=(
+            "'merge' writes only new or changed entities; 'create' skips the lookup "
+            "for initial loads into an empty graph and fails on existing ids."
+        ),
+    )
 
 
 class VectorSettings(BaseModel):
@@ -17,6 +26,154 @@ class VectorSettings(BaseModel):
     """
 
     url: str = Field(..., description="The URL for the Weaviate instance.")
+    class_name: str = Field(
+        default="Document", description="Name of the document collection."
+    )
+
+    # --- HNSW index (applied when the collection is created) ---
+    distance: Literal["cosine", "dot"] = Field(
+        default="cosine",
+        description="Distance metric; 'dot' is cheaper and equivalent on normalized vectors.",
+    )
+    ef: int = Field(
+        default=-1,
+        ge=-1,
+        description="Search-time candidate list size; -1 enables dynamic ef.",
+    )
+    ef_construction: int = Field(
+        default=128, ge=1, description="Candidate list size while building the graph."
+    )
+    max_connections: int = Field(
+        default=32, ge=1, description="Maximum edges per node in the HNSW graph."
+    )
+    dynamic_ef_min: int = Field(
+        default=100, ge=1, description="Lower bound for dynamic ef."
+    )
+    dynamic_ef_max: int = Field(
+        default=500, ge=1, description="Upper bound for dynamic ef."
+    )
+    dynamic_ef_factor: int = Field(
+        default=8, ge=1, description="Dynamic ef is the query limit times this factor."
+    )
+
+    # --- Vector compression ---
+    compression: Literal["none", "pq", "sq", "bq"] = Field(
+        default="none", description="Vector compression applied by the index."
+    )
+    compression_training_limit: Optional[int] = Field(
+        default=None, ge=1, description="Objects used to train pq/sq compression."
+    )
+    compression_rescore_limit: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Candidates re-scored with full vectors for sq/bq compression.",
+    )
+    pq_segments: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Number of pq segments; must divide the dimension.",
+    )
+
+
+class MmapVectorSettings(BaseModel):
+    """
+    Settings for the memory-mapped exact-search vector store provider.
+    """
+
+    path: str = Field(
+        default="data/vectors",
+        description="Directory holding the segment files and the manifest.",
+    )
+    dimension: int = Field(
+        default=384, ge=1, description="Dimension of the stored embeddings."
+    )
+    block_size: int = Field(
+        default=65536,
+        ge=1,
+        description="Number of rows scored per block during a search.",
+    )
+    search_threads: int = Field(
+        default=4,
+        ge=1,
+        description="Size of the thread pool used to score blocks concurrently.",
+    )
+    merge_factor: int = Field(
+        default=8,
+        ge=2,
+        description="Number of trailing segments of one size that are merged into one.",
+    )
+    max_segment_rows: int = Field(
+        default=1_000_000,
+        ge=1,
+        description="Segments are not merged beyond this many rows.",
+    )
+
+
+class QuantizedVectorSettings(BaseModel):
+    """
+    Settings for the in-process quantized vector store provider.
+    """
+
+    codec: Literal["int8", "pq"] = Field(
+        default="int8",
+        description="Compression codec: int8 scalar (4x) or product quantization.",
+    )
+    dimension: int = Field(
+        default=384, ge=1, description="Dimension of the stored embeddings."
+    )
+    pq_subspaces: int = Field(
+        default=96,
+        ge=1,
+        description="Number of one-byte PQ subspaces; must divide the dimension.",
+    )
+    pq_iterations: int = Field(
+        default=20, ge=1, description="k-means iterations when training PQ."
+    )
+    training_size: int = Field(
+        default=10000,
+        ge=1,
+        description="Vectors buffered at full precision before the codec is trained.",
+    )
+    block_size: int = Field(
+        default=16384,
+        ge=1,
+        description="Number of codes scored per block; bounds a search's scratch memory.",
+    )
+    rescore_path: Optional[str] = Field(
+        default=None,
+        description="File for full-precision vectors used to re-score candidates; "
+        "re-scoring is disabled when unset.",
+    )
+    rescore_candidates: int = Field(
+        default=100,
+        ge=1,
+        description="Number of approximate candidates re-scored exactly.",
+    )
+
+
+class ShardedVectorSettings(BaseModel):
+    """
+    Settings for the sharded vector store router.
+    """
+
+    shards: List[VectorSettings] = Field(
+        default_factory=list,
+        description="One vector store per shard; sharding is disabled when empty.",
+    )
+    partial_results: Literal["fail", "allow"] = Field(
+        default="allow",
+        description="Whether a search may return results when some shards fail.",
+    )
+    min_successful_shards: int = Field(
+        default=1,
+        ge=1,
+        description="Minimum number of shards that must answer a search under 'allow'.",
+    )
+    shard_timeout_seconds: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Per-shard search timeout; a timed-out shard counts as failed.",
+    )
 
 
 class StoreSettings(BaseModel):
@@ -26,3 +183,6 @@ class StoreSettings(BaseModel):
 
     graph: GraphSettings
     vector: VectorSettings
+    mmap: MmapVectorSettings = Field(default_factory=MmapVectorSettings)
+    quantized: QuantizedVectorSettings = Field(default_factory=QuantizedVectorSettings)
+    sharded: ShardedVectorSettings = Field(default_factory=ShardedVectorSettings)
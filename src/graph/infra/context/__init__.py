@@ -6,6 +6,7 @@ It includes:
 - `context_vars`: fine-grained control of per-request variables (e.g. tenant_id, request_id, trace_id)
 - `ExecutionContext`: a centralized object that encapsulates all context variables
 - `ContextualKeyGenerator`: a utility for generating consistent keys based on the execution context
+- `run_within_deadline`: bounds an awaitable by the request deadline in `timeout_deadline`
 
 All Fortify modules should rely on this package for:
 - Multi-tenancy support
@@ -16,6 +17,7 @@ All Fortify modules should rely on this package for:
 """
 
 from . import context_vars
+from .deadline import DeadlineExceeded, remaining_seconds, run_within_deadline
 from .execution import ExecutionContext
 from .key_resolver import ContextualKeyGenerator
 from .manager import ContextVarInfo, ContextVarManager, context_var_manager
@@ -25,6 +27,9 @@ __all__ = [
     "context_vars",
     "ExecutionContext",
     "ContextualKeyGenerator",
+    "DeadlineExceeded",
+    "remaining_seconds",
+    "run_within_deadline",
     "capture_context",
     "restore_context",
     "context_var_manager",
@@ -0,0 +1,49 @@
+# src/graph/infra/context/deadline.py
+
+import asyncio
+import inspect
+import time
+from typing import Awaitable, Optional, TypeVar
+
+from . import context_vars
+
+T = TypeVar("T")
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when the request's deadline expires before a stage completes."""
+
+    def __init__(self, stage: str):
+        super().__init__(f"The request deadline expired during '{stage}'.")
+        self.stage = stage
+
+
+def remaining_seconds() -> Optional[float]:
+    """
+    Seconds left until the `timeout_deadline` of the current context (a Unix
+    timestamp), or None when the context has no deadline.
+    """
+    deadline = context_vars.get_timeout_deadline()
+    return None if deadline is None else deadline - time.time()
+
+
+async def run_within_deadline(awaitable: Awaitable[T], stage: str) -> T:
+    """
+    Awaits `awaitable`, cancelling it when the context's deadline expires.
+    Expiry sets `timeout_cancelled` and raises `DeadlineExceeded`.
+    """
+    remaining = remaining_seconds()
+    if remaining is None:
+        return await awaitable
+    if remaining <= 0:
+        if inspect.iscoroutine(awaitable):
+            awaitable.close()
+        context_vars.set_timeout_cancelled(True)
+        raise DeadlineExceeded(stage)
+    try:
+        return await asyncio.wait_for(awaitable, remaining)
+    except TimeoutError as e:
+        if (remaining_seconds() or 0) > 0:
+            raise  # A timeout of the stage itself, not of the deadline.
+        context_vars.set_timeout_cancelled(True)
+        raise DeadlineExceeded(stage) from e
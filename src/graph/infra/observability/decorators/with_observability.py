@@ -6,7 +6,7 @@ from loguru import logger
 from opentelemetry import context, trace
 from opentelemetry.trace import SpanKind, StatusCode
 
-from graph.infra.context.context_vars import get_request_id, get_trace_id
+from graph.infra.context import context_vars
 from graph.infra.observability.tracing import get_tracer
 
 
@@ -14,8 +14,8 @@ def build_span_attributes(
     bound_args, static_attributes, attributes_from_args
 ) -> Dict[str, Any]:
     span_attributes = {
-        "request.id": get_request_id(),
-        "trace.id": get_trace_id(),
+        "request.id": context_vars.get_request_id(),
+        "trace.id": context_vars.get_trace_id(),
         **(static_attributes or {}),
     }
     if attributes_from_args:
@@ -31,8 +31,8 @@ def log_call(logger, func_name: str, args, kwargs):
         extra={
             "args": args,
             "kwargs": kwargs,
-            "trace_id": get_trace_id(),
-            "request_id": get_request_id(),
+            "trace_id": context_vars.get_trace_id(),
+            "request_id": context_vars.get_request_id(),
         },
     )
 
@@ -42,8 +42,8 @@ def log_result(logger, func_name: str, result):
         f"{func_name} returned",
         extra={
             "result": result,
-            "trace_id": get_trace_id(),
-            "request_id": get_request_id(),
+            "trace_id": context_vars.get_trace_id(),
+            "request_id": context_vars.get_request_id(),
         },
     )
 
@@ -52,8 +52,8 @@ def log_error(logger, func_name: str, error: Exception):
     logger.error(
         f"{func_name} error: {error}",
         extra={
-            "trace_id": get_trace_id(),
-            "request_id": get_request_id(),
+            "trace_id": context_vars.get_trace_id(),
+            "request_id": context_vars.get_request_id(),
         },
         exc_info=True,
     )
@@ -4,7 +4,7 @@ from typing import Any, Callable, Optional
 
 from opentelemetry.trace import SpanKind
 
-from graph.infra.context.context_vars import get_request_id, get_trace_id
+from graph.infra.context import context_vars
 from graph.infra.observability.tracing.tracing import get_tracer
 
 
@@ -28,8 +28,8 @@ def with_span(
         bound_args = inspect.signature(func).bind(*args, **kwargs)
         bound_args.apply_defaults()
         span_attributes = {
-            "request.id": get_request_id(),
-            "trace.id": get_trace_id(),
+            "request.id": context_vars.get_request_id(),
+            "trace.id": context_vars.get_trace_id(),
             **(static_attributes or {}),
         }
         if attributes_from_args:
@@ -4,11 +4,15 @@ from prometheus_client import start_http_server
 from graph.infra.config import get_settings
 
 
-def start_metrics_server() -> None:
+def start_metrics_server(port_offset: int = 0) -> None:
+    """
+    Serves the Prometheus registry over HTTP. Processes that run side by
+    side, such as ingestion shards, pass distinct offsets from the port.
+    """
     settings = get_settings().observability
 
     if settings.enabled:
-        port = settings.exporter_port
+        port = settings.exporter_port + port_offset
         logger.info(f"Starting metrics server on port {port}")
         start_http_server(port)
     else:
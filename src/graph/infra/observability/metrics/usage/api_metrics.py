@@ -0,0 +1,24 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+API_ADMISSION_IN_FLIGHT = Gauge(
+    "api_admission_in_flight_requests",
+    "Requests admitted and running under admission control",
+)
+
+API_ADMISSION_QUEUED = Gauge(
+    "api_admission_queued_requests",
+    "Requests waiting for an admission slot",
+)
+
+API_ADMISSION_DECISIONS_TOTAL = Counter(
+    "api_admission_decisions_total",
+    "Admission decisions: admitted, or rejected because the queue was full, "
+    "the wait timed out or a higher-priority request displaced it",
+    labelnames=["decision", "priority"],
+)
+
+API_ADMISSION_QUEUE_WAIT = Histogram(
+    "api_admission_queue_wait_seconds",
+    "Time requests spent waiting for an admission slot",
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5],
+)
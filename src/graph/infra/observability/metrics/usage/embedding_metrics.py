@@ -0,0 +1,30 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+EMBEDDING_CACHE_LOOKUPS_TOTAL = Counter(
+    "embedding_cache_lookups_total",
+    "Total number of texts looked up in the embedding cache",
+    labelnames=["result"],
+)
+
+EMBEDDING_MEMORY_CACHE_LOOKUPS_TOTAL = Counter(
+    "embedding_memory_cache_lookups_total",
+    "Total number of texts looked up in the embedding service's in-memory cache",
+    labelnames=["result"],
+)
+
+EMBEDDING_BATCH_TEXTS = Histogram(
+    "embedding_batch_texts",
+    "Texts per model call after concurrent embedding requests are coalesced",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256, 512),
+)
+
+EMBEDDING_SERVER_REQUESTS_TOTAL = Counter(
+    "embedding_server_requests_total",
+    "Total number of requests handled by the embedding server",
+    labelnames=["operation", "result"],
+)
+
+EMBEDDING_SERVER_CONNECTIONS = Gauge(
+    "embedding_server_connections",
+    "Client connections currently open to the embedding server",
+)
@@ -12,3 +12,9 @@ GRAPH_STORE_OPERATIONS_TOTAL = Counter(
     "Total number of operations executed on the graph store",
     labelnames=["provider", "operation", "status"],
 )
+
+GRAPH_STORE_ENTITY_ROWS_TOTAL = Counter(
+    "graph_store_entity_rows_total",
+    "Entity rows sent to the graph store, by whether they were written",
+    labelnames=["provider", "outcome"],
+)
@@ -0,0 +1,60 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+INGESTION_STAGE_LATENCY = Histogram(
+    "ingestion_stage_latency_seconds",
+    "Time spent by an ingestion stage processing one batch",
+    labelnames=["pipeline", "stage"],
+    buckets=[0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0],
+)
+
+INGESTION_STAGE_RECORDS_TOTAL = Counter(
+    "ingestion_stage_records_total",
+    "Total number of records that passed through an ingestion stage",
+    labelnames=["pipeline", "stage"],
+)
+
+INGESTION_QUEUE_DEPTH = Gauge(
+    "ingestion_queue_depth",
+    "Number of batches waiting in the input queue of an ingestion stage",
+    labelnames=["pipeline", "stage"],
+)
+
+INGESTION_BATCH_SIZE = Gauge(
+    "ingestion_batch_size",
+    "Current batch size chosen by an ingestion batch-size controller",
+    labelnames=["controller"],
+)
+
+INGESTION_STAGE_FAILED_RECORDS_TOTAL = Counter(
+    "ingestion_stage_failed_records_total",
+    "Total number of records in batches that failed in an ingestion stage",
+    labelnames=["pipeline", "stage"],
+)
+
+INGESTION_STAGE_SKIPPED_RECORDS_TOTAL = Counter(
+    "ingestion_stage_skipped_records_total",
+    "Total number of records an ingestion stage dropped instead of forwarding",
+    labelnames=["pipeline", "stage"],
+)
+
+INGESTION_DEAD_LETTER_BATCHES_TOTAL = Counter(
+    "ingestion_dead_letter_batches_total",
+    "Total number of batches written to the dead-letter file after failing",
+    labelnames=["pipeline"],
+)
+
+INGESTION_RECORDS_PER_SECOND = Gauge(
+    "ingestion_records_per_second",
+    "Records completing an ingestion pipeline per second, over a sliding window",
+    labelnames=["pipeline"],
+)
+
+INGESTION_EMBEDDED_TOKENS_TOTAL = Counter(
+    "ingestion_embedded_tokens_total",
+    "Total number of whitespace-delimited tokens in texts sent to the embedder",
+)
+
+INGESTION_EMBEDDING_TOKENS_PER_SECOND = Gauge(
+    "ingestion_embedding_tokens_per_second",
+    "Tokens embedded per second, over a sliding window",
+)
@@ -0,0 +1,13 @@
+from prometheus_client import Counter
+
+RETRY_ATTEMPTS_TOTAL = Counter(
+    "retry_attempts_total",
+    "Total number of retries of a failed operation",
+    labelnames=["operation"],
+)
+
+RETRY_EXHAUSTED_TOTAL = Counter(
+    "retry_exhausted_total",
+    "Total number of operations that still failed after their last attempt",
+    labelnames=["operation"],
+)
@@ -0,0 +1,20 @@
+from prometheus_client import Counter
+
+RETRIEVAL_SINGLE_FLIGHT_TOTAL = Counter(
+    "retrieval_single_flight_requests_total",
+    "Queries that ran the retrieval pipeline (leader) or awaited an identical "
+    "in-flight one (coalesced)",
+    labelnames=["role"],
+)
+
+RETRIEVAL_CACHE_LOOKUPS_TOTAL = Counter(
+    "retrieval_cache_lookups_total",
+    "Response cache lookups per tier, by result (hit, miss or error)",
+    labelnames=["tier", "result"],
+)
+
+RETRIEVAL_DEADLINE_EXCEEDED_TOTAL = Counter(
+    "retrieval_deadline_exceeded_total",
+    "Retrieval stages cut short by the request deadline",
+    labelnames=["stage"],
+)
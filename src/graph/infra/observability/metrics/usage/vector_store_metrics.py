@@ -12,3 +12,10 @@ VECTOR_STORE_OPERATIONS_TOTAL = Counter(
     "Total number of operations executed on the vector store",
     labelnames=["provider", "operation", "status"],
 )
+
+VECTOR_SHARD_LATENCY = Histogram(
+    "vector_store_shard_latency_seconds",
+    "Latency of vector store operations per shard of a sharded store",
+    labelnames=["shard", "operation", "status"],
+    buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+)
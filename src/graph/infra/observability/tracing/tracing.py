@@ -15,7 +15,7 @@ from opentelemetry.trace import Span, SpanKind, Status, StatusCode, Tracer
 from graph.infra.config import get_settings
 from graph.infra.config.schemas import ObservabilitySettings
 from graph.infra.config.schemas.app_settings import AppSettings
-from graph.infra.context.context_vars import get_request_id, get_trace_id
+from graph.infra.context import context_vars
 
 _tracing_initialized = False
 
@@ -119,8 +119,8 @@ def start_span(
     tracer = get_tracer()
     ctx_attributes: Dict[str, Any] = {}
     try:
-        req_id = get_request_id()
-        trace_id = get_trace_id()
+        req_id = context_vars.get_request_id()
+        trace_id = context_vars.get_trace_id()
         if req_id:
             ctx_attributes["request.id"] = req_id
         if trace_id:
@@ -0,0 +1,3 @@
+from .retry import Retrier, RetryPolicy, resolve_exceptions
+
+__all__ = ["Retrier", "RetryPolicy", "resolve_exceptions"]
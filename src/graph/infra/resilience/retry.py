@@ -0,0 +1,131 @@
+# src/graph/infra/resilience/retry.py
+
+import asyncio
+import builtins
+import importlib
+import random
+from typing import (Awaitable, Callable, Dict, Iterable, Optional, Tuple, Type,
+                    TypeVar)
+
+from loguru import logger
+
+from graph.infra.config.schemas.resilience import (RetryPolicySettings,
+                                                   RetrySettings)
+from graph.infra.observability.metrics.usage.resilience_metrics import (
+    RETRY_ATTEMPTS_TOTAL, RETRY_EXHAUSTED_TOTAL)
+
+T = TypeVar("T")
+
+
+def resolve_exceptions(names: Iterable[str]) -> Tuple[Type[BaseException], ...]:
+    """Resolves builtin (`TimeoutError`) or dotted (`neo4j.exceptions.X`) names."""
+    classes = []
+    for name in names:
+        module_name, _, attribute = name.rpartition(".")
+        if module_name:
+            error = getattr(importlib.import_module(module_name), attribute, None)
+        else:
+            error = getattr(builtins, name, None)
+        if not (isinstance(error, type) and issubclass(error, BaseException)):
+            raise ValueError(f"'{name}' is not an exception class.")
+        classes.append(error)
+    return tuple(classes)
+
+
+def _caused_by(
+    error: Optional[BaseException], exceptions: Tuple[Type[BaseException], ...]
+) -> bool:
+    """Whether the error, or an error it was raised from, is one of these."""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        if isinstance(error, exceptions):
+            return True
+        seen.add(id(error))
+        error = error.__cause__
+    return False
+
+
+class RetryPolicy:
+    """
+    Retries an async call on the configured exceptions with jittered
+    exponential backoff. The wait before retry `n` is drawn uniformly from
+    [wait_min, min(wait_max, wait_min * backoff**n)], so concurrent callers
+    that failed together do not retry in lockstep.
+
+    An error is retried when it or one of its causes is configured, so a
+    store error wrapping a dropped connection is retried while one wrapping
+    a constraint violation fails at once.
+    """
+
+    def __init__(
+        self,
+        attempts: int,
+        wait_min: float,
+        wait_max: float,
+        backoff: float,
+        exceptions: Tuple[Type[BaseException], ...] = (ConnectionError, TimeoutError),
+        rng: Callable[[], float] = random.random,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        self.attempts = attempts
+        self.wait_min, self.wait_max = wait_min, wait_max
+        self.backoff = backoff
+        self.exceptions = exceptions
+        self._rng = rng
+        self._sleep = sleep
+
+    @classmethod
+    def from_settings(cls, settings: RetryPolicySettings) -> "RetryPolicy":
+        return cls(
+            attempts=settings.attempts,
+            wait_min=settings.wait_min_seconds,
+            wait_max=settings.wait_max_seconds,
+            backoff=settings.backoff,
+            exceptions=resolve_exceptions(settings.exceptions),
+        )
+
+    def wait(self, retry: int) -> float:
+        ceiling = min(self.wait_max, self.wait_min * self.backoff**retry)
+        return self.wait_min + (ceiling - self.wait_min) * self._rng()
+
+    async def call(self, operation: str, fn: Callable[[], Awaitable[T]]) -> T:
+        for attempt in range(1, self.attempts + 1):
+            try:
+                return await fn()
+            except BaseException as e:
+                if not _caused_by(e, self.exceptions):
+                    raise
+                if attempt == self.attempts:
+                    RETRY_EXHAUSTED_TOTAL.labels(operation=operation).inc()
+                    raise
+                wait = self.wait(attempt - 1)
+                logger.bind(service="retry").warning(
+                    f"'{operation}' failed (attempt {attempt}/{self.attempts}): "
+                    f"{e!r}; retrying in {wait:.2f}s."
+                )
+                RETRY_ATTEMPTS_TOTAL.labels(operation=operation).inc()
+                await self._sleep(wait)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+
+class Retrier:
+    """Applies the retry policy configured for each named operation."""
+
+    def __init__(self, settings: RetrySettings):
+        self._enabled = settings.enabled
+        self._default = RetryPolicy.from_settings(settings.default_policy)
+        self._policies: Dict[str, RetryPolicy] = {
+            name: RetryPolicy.from_settings(policy)
+            for name, policy in settings.policies.items()
+        }
+
+    def policy(self, operation: str) -> Optional[RetryPolicy]:
+        if not self._enabled:
+            return None
+        return self._policies.get(operation, self._default)
+
+    async def call(self, operation: str, fn: Callable[[], Awaitable[T]]) -> T:
+        policy = self.policy(operation)
+        if policy is None:
+            return await fn()
+        return await policy.call(operation, fn)
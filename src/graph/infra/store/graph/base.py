@@ -76,6 +76,21 @@ class BaseGraphStore(BaseService, GraphStoreProtocol, BaseServiceProtocol, ABC):
             "link_doc_entities", self._link_doc_entities_impl, pairs
         )
 
+    async def delete_documents(self, doc_ids: List[str]) -> None:
+        await self._instrumented_call(
+            "delete_documents", self._delete_documents_impl, doc_ids
+        )
+
+    async def delete_entities(self, entity_ids: List[str]) -> None:
+        await self._instrumented_call(
+            "delete_entities", self._delete_entities_impl, entity_ids
+        )
+
+    async def unlink_doc_entities(self, pairs: List[tuple[str, str]]) -> None:
+        await self._instrumented_call(
+            "unlink_doc_entities", self._unlink_doc_entities_impl, pairs
+        )
+
     async def expand_entities(
         self, start_entities: List[str], hops: int, limit: int
     ) -> List[Dict[str, Any]]:
@@ -99,6 +114,18 @@ class BaseGraphStore(BaseService, GraphStoreProtocol, BaseServiceProtocol, ABC):
     async def _link_doc_entities_impl(self, pairs: List[tuple[str, str]]) -> None:
         pass
 
+    @abstractmethod
+    async def _delete_documents_impl(self, doc_ids: List[str]) -> None:
+        pass
+
+    @abstractmethod
+    async def _delete_entities_impl(self, entity_ids: List[str]) -> None:
+        pass
+
+    @abstractmethod
+    async def _unlink_doc_entities_impl(self, pairs: List[tuple[str, str]]) -> None:
+        pass
+
     @abstractmethod
     async def _expand_entities_impl(
         self, start_entities: List[str], hops: int, limit: int
@@ -32,6 +32,24 @@ class GraphStoreProtocol(Protocol):
         """
         ...
 
+    async def delete_documents(self, doc_ids: List[str]) -> None:
+        """
+        Deletes document nodes and all of their relationships.
+        """
+        ...
+
+    async def delete_entities(self, entity_ids: List[str]) -> None:
+        """
+        Deletes entity nodes and all of their relationships.
+        """
+        ...
+
+    async def unlink_doc_entities(self, pairs: List[tuple[str, str]]) -> None:
+        """
+        Removes relationships between documents and entities, keeping the nodes.
+        """
+        ...
+
     async def expand_entities(
         self, start_entities: List[str], hops: int, limit: int
     ) -> List[Dict[str, Any]]:
@@ -1,15 +1,42 @@
 from typing import Any, Dict, List, Optional, Tuple
 
 import neo4j
-from neo4j.exceptions import ServiceUnavailable
+from neo4j.exceptions import ConstraintError, ServiceUnavailable
 
 from graph.infra.config import get_settings
 from graph.infra.config.schemas.store.store_config import GraphSettings
+from graph.infra.observability.metrics.usage.graph_store_metrics import \
+    GRAPH_STORE_ENTITY_ROWS_TOTAL
 
 from ..base import BaseGraphStore
 from ..exceptions import (GraphConnectionError, GraphDataError,
                           GraphIndexError, GraphQueryError)
 
+# Setting a property to the value it already has still writes it to the
+# transaction log, so existing entities are only touched when they changed.
+_MERGE_CHANGED_ENTITIES = """
+UNWIND $rows AS row
+MERGE (e:Entity {id: row.id})
+WITH e, row
+WHERE NOT coalesce(e.name = row.name, e.name IS NULL AND row.name IS NULL)
+SET e.name = row.name
+RETURN count(e) AS written
+"""
+
+# Initial loads skip the lookup; the uniqueness constraint rejects duplicates.
+_CREATE_ENTITIES = """
+UNWIND $rows AS row
+CREATE (:Entity {id: row.id, name: row.name})
+"""
+
+
+def _dedupe_entities(entities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Keeps the last row of every entity id, in the order ids first appear."""
+    rows: Dict[str, Dict[str, Any]] = {}
+    for entity in entities:
+        rows[entity["id"]] = {"id": entity["id"], "name": entity.get("name")}
+    return list(rows.values())
+
 
 class Neo4jStoreProvider(BaseGraphStore):
     def __init__(
@@ -53,19 +80,31 @@ class Neo4jStoreProvider(BaseGraphStore):
             raise GraphIndexError("Failed to ensure graph indexes.") from e
 
     async def _upsert_entities_impl(self, entities: List[Dict[str, Any]]) -> None:
+        rows = _dedupe_entities(entities)
         try:
             async with self.driver.session() as session:
-                await session.run(
-                    """
-                    UNWIND $rows AS row
-                    MERGE (e:Entity {id: row.id})
-                    ON CREATE SET e.name = row.name
-                    ON MATCH SET e.name = row.name
-                    """,
-                    rows=entities,
-                )
+                if self.settings.entity_write_mode == "create":
+                    result = await session.run(_CREATE_ENTITIES, rows=rows)
+                    await result.consume()
+                    written = len(rows)
+                else:
+                    result = await session.run(_MERGE_CHANGED_ENTITIES, rows=rows)
+                    written = (await result.single())["written"]
+        except ConstraintError as e:
+            raise GraphDataError(
+                "Create-only entity writes found an existing entity id; use the "
+                "'merge' entity_write_mode unless the graph is empty."
+            ) from e
         except Exception as e:
             raise GraphDataError("Failed to upsert entities.") from e
+        for outcome, count in (
+            ("duplicate", len(entities) - len(rows)),
+            ("unchanged", len(rows) - written),
+            ("written", written),
+        ):
+            GRAPH_STORE_ENTITY_ROWS_TOTAL.labels(self._provider_name, outcome).inc(
+                count
+            )
 
     async def _upsert_documents_impl(self, docs: List[Dict[str, Any]]) -> None:
         try:
@@ -95,6 +134,48 @@ class Neo4jStoreProvider(BaseGraphStore):
         except Exception as e:
             raise GraphDataError("Failed to link documents and entities.") from e
 
+    async def _delete_documents_impl(self, doc_ids: List[str]) -> None:
+        try:
+            async with self.driver.session() as session:
+                await session.run(
+                    """
+                    UNWIND $ids AS id
+                    MATCH (d:Document {id: id})
+                    DETACH DELETE d
+                    """,
+                    ids=doc_ids,
+                )
+        except Exception as e:
+            raise GraphDataError("Failed to delete document nodes.") from e
+
+    async def _delete_entities_impl(self, entity_ids: List[str]) -> None:
+        try:
+            async with self.driver.session() as session:
+                await session.run(
+                    """
+                    UNWIND $ids AS id
+                    MATCH (e:Entity {id: id})
+                    DETACH DELETE e
+                    """,
+                    ids=entity_ids,
+                )
+        except Exception as e:
+            raise GraphDataError("Failed to delete entities.") from e
+
+    async def _unlink_doc_entities_impl(self, pairs: List[Tuple[str, str]]) -> None:
+        try:
+            async with self.driver.session() as session:
+                await session.run(
+                    """
+                    UNWIND $rows AS row
+                    MATCH (:Document {id: row[0]})-[r:MENTIONS]->(:Entity {id: row[1]})
+                    DELETE r
+                    """,
+                    rows=pairs,
+                )
+        except Exception as e:
+            raise GraphDataError("Failed to unlink documents and entities.") from e
+
     async def _expand_entities_impl(
         self, start_entities: List[str], hops: int, limit: int
     ) -> List[Dict[str, Any]]:
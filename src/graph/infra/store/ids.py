@@ -0,0 +1,16 @@
+# src/graph/infra/store/ids.py
+
+CHUNK_ID_SEPARATOR = "#chunk-"
+
+
+def chunk_id(doc_id: str, index: int) -> str:
+    """The vector store id of a document's `index`-th chunk."""
+    return f"{doc_id}{CHUNK_ID_SEPARATOR}{index}"
+
+
+def parent_id(vector_id: str) -> str:
+    """Maps a chunk id back to its document id; other ids are returned as is."""
+    head, separator, index = vector_id.rpartition(CHUNK_ID_SEPARATOR)
+    if separator and index.isdigit():
+        return head
+    return vector_id
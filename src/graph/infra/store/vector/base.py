@@ -1,6 +1,6 @@
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Awaitable, Callable, Dict, List
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from opentelemetry import trace
 from opentelemetry.trace import Status, StatusCode
@@ -61,9 +61,16 @@ class BaseVectorStore(BaseService, VectorStoreProtocol, BaseServiceProtocol, ABC
             "upsert_documents", self._upsert_documents_impl, docs, vectors
         )
 
-    async def vector_search(self, query_vec: Any, top_k: int) -> List[Dict[str, Any]]:
+    async def delete_documents(self, doc_ids: List[str]) -> None:
+        await self._instrumented_call(
+            "delete_documents", self._delete_documents_impl, doc_ids
+        )
+
+    async def vector_search(
+        self, query_vec: Any, top_k: int, ef: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         return await self._instrumented_call(
-            "vector_search", self._vector_search_impl, query_vec, top_k
+            "vector_search", self._vector_search_impl, query_vec, top_k, ef
         )
 
     @abstractmethod
@@ -76,8 +83,12 @@ class BaseVectorStore(BaseService, VectorStoreProtocol, BaseServiceProtocol, ABC
     ) -> None:
         pass
 
+    @abstractmethod
+    async def _delete_documents_impl(self, doc_ids: List[str]) -> None:
+        pass
+
     @abstractmethod
     async def _vector_search_impl(
-        self, query_vec: Any, top_k: int
+        self, query_vec: Any, top_k: int, ef: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         pass
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Protocol, runtime_checkable
+from typing import Any, Dict, List, Optional, Protocol, runtime_checkable
 
 
 @runtime_checkable
@@ -21,8 +21,18 @@ class VectorStoreProtocol(Protocol):
         """
         ...
 
-    async def vector_search(self, query_vec: Any, top_k: int) -> List[Dict[str, Any]]:
+    async def delete_documents(self, doc_ids: List[str]) -> None:
+        """
+        Removes documents and their vectors from the store. Unknown ids are ignored.
+        """
+        ...
+
+    async def vector_search(
+        self, query_vec: Any, top_k: int, ef: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Performs a vector similarity search to retrieve the top-k most relevant documents.
+        `ef` optionally overrides the search breadth for this request, trading
+        latency for recall on providers with an approximate index.
         """
         ...
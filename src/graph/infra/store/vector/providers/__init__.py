@@ -1,3 +1,11 @@
+from .mmap_store import MmapVectorStore
+from .quantized_store import QuantizedVectorStore
+from .sharded_store import ShardedVectorStore
 from .weaviate_store import WeaviateStore
 
-__all__ = ["WeaviateStore"]
+__all__ = [
+    "WeaviateStore",
+    "MmapVectorStore",
+    "QuantizedVectorStore",
+    "ShardedVectorStore",
+]
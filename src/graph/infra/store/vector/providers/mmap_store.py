@@ -0,0 +1,598 @@
+import asyncio
+import fcntl
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from graph.infra.config import get_settings
+from graph.infra.config.schemas.store.store_config import MmapVectorSettings
+from graph.infra.store.vector.base import BaseVectorStore
+from graph.infra.store.vector.exceptions import (VectorConnectionError,
+                                                 VectorDataError,
+                                                 VectorIndexError,
+                                                 VectorQueryError)
+
+MANIFEST_FILE = "manifest.json"
+LOCK_FILE = "lock"
+SEGMENT_PREFIX = "seg-"
+TOMBSTONE_PREFIX = "del-"
+
+
+@dataclass
+class _Segment:
+    """An immutable, memory-mapped run of vectors and their metadata."""
+
+    name: str
+    vectors: np.memmap
+    metadata: np.ndarray
+    offsets: np.memmap
+    ids: List[str]
+    live: np.ndarray
+
+
+@dataclass
+class _Manifest:
+    """
+    The committed segments and tombstones in the order they apply, the merge
+    level of each segment, the number of the next file and the files a merge
+    dropped, which the following commit removes.
+    """
+
+    entries: List[str] = field(default_factory=list)
+    levels: Dict[str, int] = field(default_factory=dict)
+    next_number: int = 0
+    obsolete: List[str] = field(default_factory=list)
+
+
+def _stamp(stat: os.stat_result) -> Tuple[int, int, int]:
+    # The manifest is replaced on every commit, which gives it a new inode.
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+class MmapVectorStore(BaseVectorStore):
+    """
+    Exact-search vector store over append-only float16 segment files.
+
+    Every `upsert_documents` call writes a new segment (vectors, JSONL metadata
+    and row offsets) and commits it to the manifest; deletes commit a tombstone
+    file listing the removed ids. Once `merge_factor` trailing segments of one
+    merge level have accumulated, their live rows are merged into one segment
+    of the next level, up to `max_segment_rows` rows, so small ingestion
+    batches end up in a few large segments. A file lock serializes writers
+    across processes.
+
+    Segments are memory-mapped read-only, so several worker processes share
+    one page-cache copy of the corpus; each reloads the manifest before a
+    search once another process has committed to it. Searches score
+    fixed-size blocks with a matmul on a thread pool and merge the per-block
+    top-k candidates.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[MmapVectorSettings] = None,
+        service_name: str = "mmap_vector_store",
+    ):
+        super().__init__(service_name=service_name, provider_name="mmap")
+        self.settings = settings or get_settings().store.mmap
+        self._root = Path(self.settings.path)
+        self._segments: Tuple[_Segment, ...] = ()
+        self._locations: Dict[str, Tuple[int, int]] = {}
+        self._manifest = _Manifest()
+        self._stamp: Optional[Tuple[int, int, int]] = None
+        self._opened: Dict[str, _Segment] = {}
+        self._tombstones: Dict[str, List[str]] = {}
+        self._refresh_lock = threading.Lock()
+        self._write_lock = asyncio.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def _connect(self) -> None:
+        try:
+            self._root.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(self._refresh)
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.settings.search_threads,
+                thread_name_prefix="mmap-search",
+            )
+        except Exception as e:
+            raise VectorConnectionError(
+                f"Failed to open memory-mapped vector store at '{self._root}'."
+            ) from e
+
+    async def _close(self) -> None:
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._segments = ()
+        self._locations = {}
+        self._manifest = _Manifest()
+        self._stamp = None
+        self._opened = {}
+        self._tombstones = {}
+
+    async def _ensure_schema_impl(self) -> None:
+        try:
+            self._root.mkdir(parents=True, exist_ok=True)
+            with self._file_lock():
+                if not (self._root / MANIFEST_FILE).exists():
+                    self._write_manifest(_Manifest())
+        except Exception as e:
+            raise VectorIndexError("Failed to initialise the segment manifest.") from e
+
+    async def _upsert_documents_impl(
+        self, docs: List[Dict[str, Any]], vectors: Any
+    ) -> None:
+        if not docs:
+            return
+        try:
+            matrix = self._normalize(np.asarray(vectors, dtype=np.float32))
+            if matrix.shape != (len(docs), self.settings.dimension):
+                raise ValueError(
+                    f"Expected vectors of shape ({len(docs)}, {self.settings.dimension}), "
+                    f"got {matrix.shape}."
+                )
+            async with self._write_lock:
+                await asyncio.to_thread(self._append_segment, docs, matrix)
+        except Exception as e:
+            raise VectorDataError(
+                "Failed to upsert documents into the memory-mapped store."
+            ) from e
+
+    async def _delete_documents_impl(self, doc_ids: List[str]) -> None:
+        try:
+            async with self._write_lock:
+                await asyncio.to_thread(self._append_tombstone, doc_ids)
+        except Exception as e:
+            raise VectorDataError(
+                "Failed to delete documents from the memory-mapped store."
+            ) from e
+
+    async def _vector_search_impl(
+        self, query_vec: Any, top_k: int, ef: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        # Exact search always has perfect recall, so `ef` is ignored.
+        try:
+            query = self._normalize(np.asarray(query_vec, dtype=np.float32))
+            if self._stale():
+                await asyncio.to_thread(self._refresh)
+            segments = self._segments
+            loop = asyncio.get_running_loop()
+            block_size = self.settings.block_size
+
+            partials = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        self._executor,
+                        self._score_block,
+                        seg_no,
+                        segment,
+                        start,
+                        min(start + block_size, len(segment.ids)),
+                        query,
+                        top_k,
+                    )
+                    for seg_no, segment in enumerate(segments)
+                    for start in range(0, len(segment.ids), block_size)
+                )
+            )
+            return [
+                self._load_hit(segments[seg_no], row, score)
+                for score, seg_no, row in self._merge_top_k(partials, top_k)
+            ]
+        except Exception as e:
+            raise VectorQueryError(
+                "Failed to perform exact vector search.", query_vec=query_vec
+            ) from e
+
+    # --- Search helpers ---
+
+    @staticmethod
+    def _normalize(matrix: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+        return matrix / np.where(norms == 0, 1.0, norms)
+
+    @staticmethod
+    def _score_block(
+        seg_no: int,
+        segment: _Segment,
+        start: int,
+        stop: int,
+        query: np.ndarray,
+        top_k: int,
+    ) -> Tuple[np.ndarray, int, np.ndarray]:
+        """
+        Scores rows [start, stop) of a segment and returns its local top-k as
+        (scores, segment number, row indexes).
+        """
+        block = np.asarray(segment.vectors[start:stop], dtype=np.float32)
+        scores = block @ query
+        scores[~segment.live[start:stop]] = -np.inf
+
+        if len(scores) > top_k:
+            rows = np.argpartition(-scores, top_k - 1)[:top_k]
+        else:
+            rows = np.arange(len(scores))
+        rows = rows[np.isfinite(scores[rows])]
+        return scores[rows], seg_no, rows + start
+
+    @staticmethod
+    def _merge_top_k(
+        partials: List[Tuple[np.ndarray, int, np.ndarray]], top_k: int
+    ) -> List[Tuple[float, int, int]]:
+        """Merges per-block candidates into a globally ordered top-k list."""
+        if not partials or top_k <= 0:
+            return []
+        scores = np.concatenate([p[0] for p in partials])
+        if scores.size == 0:
+            return []
+        seg_nos = np.concatenate([np.full(len(p[0]), p[1]) for p in partials])
+        rows = np.concatenate([p[2] for p in partials])
+
+        if scores.size > top_k:
+            best = np.argpartition(-scores, top_k - 1)[:top_k]
+        else:
+            best = np.arange(scores.size)
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return [(float(scores[i]), int(seg_nos[i]), int(rows[i])) for i in best]
+
+    @staticmethod
+    def _load_hit(segment: _Segment, row: int, score: float) -> Dict[str, Any]:
+        start, stop = int(segment.offsets[row]), int(segment.offsets[row + 1])
+        record = json.loads(bytes(segment.metadata[start:stop]))
+        return {
+            "doc_id": record["doc_id"],
+            "text": record.get("text", ""),
+            "entities": record.get("entities", []),
+            "dense_score": score,
+        }
+
+    # --- Commits ---
+
+    def _append_segment(self, docs: List[Dict[str, Any]], matrix: np.ndarray) -> None:
+        records = [
+            json.dumps(
+                {
+                    "doc_id": d["id"],
+                    "text": d["text"],
+                    "entities": d.get("entities", []),
+                },
+                ensure_ascii=False,
+            ).encode("utf-8")
+            for d in docs
+        ]
+        with self._file_lock():
+            self._refresh()
+            manifest = self._manifest
+            name = f"{SEGMENT_PREFIX}{manifest.next_number:06d}"
+            self._write_segment(name, [(matrix, records, [d["id"] for d in docs])])
+            self._commit(
+                self._merge_tail(
+                    _Manifest(
+                        entries=manifest.entries + [name],
+                        levels={**manifest.levels, name: 0},
+                        next_number=manifest.next_number + 1,
+                    )
+                )
+            )
+
+    def _append_tombstone(self, doc_ids: List[str]) -> None:
+        with self._file_lock():
+            self._refresh()
+            doc_ids = [i for i in dict.fromkeys(doc_ids) if i in self._locations]
+            if not doc_ids:
+                return
+            manifest = self._manifest
+            name = f"{TOMBSTONE_PREFIX}{manifest.next_number:06d}"
+            self._write_ids(name, doc_ids)
+            self._commit(
+                replace(
+                    manifest,
+                    entries=manifest.entries + [name],
+                    next_number=manifest.next_number + 1,
+                    obsolete=[],
+                )
+            )
+
+    def _commit(self, manifest: _Manifest) -> None:
+        """
+        Commits a manifest and removes the files the previous commit dropped;
+        readers still on that one had a whole commit to move on.
+        """
+        obsolete = self._manifest.obsolete
+        self._write_manifest(manifest)
+        for name in obsolete:
+            for path in self._paths(name):
+                path.unlink(missing_ok=True)
+        self._refresh()
+
+    def _merge_tail(self, manifest: _Manifest) -> _Manifest:
+        """
+        Merges the last `merge_factor` segments while they share a merge level
+        and fit in `max_segment_rows`. The tombstones among them are combined
+        into one that precedes the merged segment: its rows are already the
+        live ones, so the tombstones only apply to older segments.
+        """
+        factor = self.settings.merge_factor
+        while True:
+            segments = [
+                n for n in manifest.entries if not n.startswith(TOMBSTONE_PREFIX)
+            ]
+            tail = segments[-factor:]
+            level = manifest.levels.get(tail[-1], 0) if tail else 0
+            if (
+                len(tail) < factor
+                or any(manifest.levels.get(n, 0) != level for n in tail)
+                or sum(len(self._segment(n).ids) for n in tail)
+                > self.settings.max_segment_rows
+            ):
+                return manifest
+
+            start = manifest.entries.index(tail[0])
+            run = manifest.entries[start:]
+            live: Dict[str, Tuple[str, int]] = {}
+            deleted: List[str] = []
+            for name in run:
+                if name.startswith(TOMBSTONE_PREFIX):
+                    for doc_id in self._tombstone(name):
+                        live.pop(doc_id, None)
+                        deleted.append(doc_id)
+                else:
+                    for row, doc_id in enumerate(self._segment(name).ids):
+                        live[doc_id] = (name, row)
+
+            number = manifest.next_number
+            merged: List[str] = []
+            levels = {n: lv for n, lv in manifest.levels.items() if n not in run}
+            if deleted:
+                merged.append(f"{TOMBSTONE_PREFIX}{number:06d}")
+                self._write_ids(merged[-1], list(dict.fromkeys(deleted)))
+                number += 1
+            if live:
+                merged.append(f"{SEGMENT_PREFIX}{number:06d}")
+                self._write_segment(merged[-1], self._live_blocks(live.values()))
+                levels[merged[-1]] = level + 1
+                number += 1
+            manifest = _Manifest(
+                entries=manifest.entries[:start] + merged,
+                levels=levels,
+                next_number=number,
+                obsolete=manifest.obsolete + run,
+            )
+
+    def _live_blocks(
+        self, rows: Iterable[Tuple[str, int]]
+    ) -> Iterator[Tuple[np.ndarray, List[bytes], List[str]]]:
+        """Yields the given rows as (vectors, records, ids), segment by segment."""
+        by_segment: Dict[str, List[int]] = {}
+        for name, row in rows:
+            by_segment.setdefault(name, []).append(row)
+        for name, segment_rows in by_segment.items():
+            segment = self._segment(name)
+            segment_rows.sort()
+            yield (
+                segment.vectors[segment_rows],
+                [
+                    bytes(segment.metadata[segment.offsets[r] : segment.offsets[r + 1]])
+                    for r in segment_rows
+                ],
+                [segment.ids[r] for r in segment_rows],
+            )
+
+    # --- Manifest ---
+
+    def _stale(self) -> bool:
+        """Whether the manifest changed since it was last read."""
+        try:
+            return _stamp(os.stat(self._root / MANIFEST_FILE)) != self._stamp
+        except FileNotFoundError:
+            return False
+
+    def _refresh(self) -> None:
+        """
+        Catches up with the committed manifest. Appended entries are applied to
+        the current state; when a merge replaced entries, the live rows are
+        rebuilt and swapped in at once, so searches never see a partial state.
+        """
+        with self._refresh_lock:
+            try:
+                f = open(self._root / MANIFEST_FILE, "r", encoding="utf-8")
+            except FileNotFoundError:
+                return
+            with f:
+                stamp = _stamp(os.fstat(f.fileno()))
+                if stamp == self._stamp:
+                    return
+                manifest = self._parse_manifest(json.load(f))
+
+            current = self._manifest.entries
+            if manifest.entries[: len(current)] == current:
+                segments = list(self._segments)
+                for name in manifest.entries[len(current) :]:
+                    self._apply(name, segments, self._locations)
+                self._segments = tuple(segments)
+            else:
+                self._opened = {
+                    name: replace(segment, live=np.ones(len(segment.ids), dtype=bool))
+                    for name, segment in self._opened.items()
+                    if name in manifest.levels
+                }
+                self._tombstones = {
+                    name: ids
+                    for name, ids in self._tombstones.items()
+                    if name in manifest.entries
+                }
+                segments = []
+                locations: Dict[str, Tuple[int, int]] = {}
+                for name in manifest.entries:
+                    self._apply(name, segments, locations)
+                self._segments, self._locations = tuple(segments), locations
+            self._manifest, self._stamp = manifest, stamp
+
+    def _apply(
+        self,
+        name: str,
+        segments: List[_Segment],
+        locations: Dict[str, Tuple[int, int]],
+    ) -> None:
+        """
+        Applies a committed entry: a tombstone hides the rows of its ids, a
+        segment becomes searchable and supersedes older rows with its doc_ids.
+        """
+        if name.startswith(TOMBSTONE_PREFIX):
+            for doc_id in self._tombstone(name):
+                location = locations.pop(doc_id, None)
+                if location is not None:
+                    seg_no, row = location
+                    segments[seg_no].live[row] = False
+            return
+
+        segment = self._opened[name] = self._segment(name)
+        seg_no = len(segments)
+        for row, doc_id in enumerate(segment.ids):
+            previous = locations.get(doc_id)
+            if previous is not None:
+                prev_seg, prev_row = previous
+                if prev_seg == seg_no:
+                    segment.live[prev_row] = False
+                else:
+                    segments[prev_seg].live[prev_row] = False
+            locations[doc_id] = (seg_no, row)
+        segments.append(segment)
+
+    def _parse_manifest(self, data: Dict[str, Any]) -> _Manifest:
+        if data.get("dimension", self.settings.dimension) != self.settings.dimension:
+            raise ValueError(
+                f"Store at '{self._root}' holds {data['dimension']}-dim vectors, "
+                f"settings expect {self.settings.dimension}."
+            )
+        entries = list(data.get("segments", []))
+        levels = data.get("levels") or {
+            n: 0 for n in entries if not n.startswith(TOMBSTONE_PREFIX)
+        }
+        # Older manifests numbered their files by position.
+        next_number = data.get(
+            "next", 1 + max((int(n.rsplit("-", 1)[1]) for n in entries), default=-1)
+        )
+        return _Manifest(entries, levels, next_number, data.get("obsolete", []))
+
+    def _write_manifest(self, manifest: _Manifest) -> None:
+        """Atomically replaces the manifest, which is the commit point of a write."""
+        tmp_path = self._root / f"{MANIFEST_FILE}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "dimension": self.settings.dimension,
+                    "segments": manifest.entries,
+                    "levels": manifest.levels,
+                    "next": manifest.next_number,
+                    "obsolete": manifest.obsolete,
+                },
+                f,
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._root / MANIFEST_FILE)
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Holds the lock that serializes writers across processes."""
+        with open(self._root / LOCK_FILE, "a+b") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    # --- Segment files ---
+
+    def _paths(self, name: str) -> Tuple[Path, Path, Path, Path]:
+        return (
+            self._root / f"{name}.vec",
+            self._root / f"{name}.meta",
+            self._root / f"{name}.off",
+            self._root / f"{name}.ids",
+        )
+
+    def _write_segment(
+        self,
+        name: str,
+        blocks: Iterable[Tuple[np.ndarray, List[bytes], List[str]]],
+    ) -> None:
+        """
+        Writes a segment from (vectors, JSON records, ids) blocks and syncs its
+        files, so the manifest never commits a segment that is not on disk.
+        """
+        vec_path, meta_path, off_path, ids_path = self._paths(name)
+        lengths: List[int] = []
+        with (
+            open(vec_path, "wb") as vec_file,
+            open(meta_path, "wb") as meta_file,
+            open(ids_path, "w", encoding="utf-8") as ids_file,
+        ):
+            for vectors, records, ids in blocks:
+                vec_file.write(np.asarray(vectors, dtype=np.float16).tobytes())
+                meta_file.writelines(records)
+                lengths.extend(len(r) for r in records)
+                ids_file.writelines(json.dumps(doc_id) + "\n" for doc_id in ids)
+            for f in (vec_file, meta_file, ids_file):
+                f.flush()
+                os.fsync(f.fileno())
+
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(lengths)
+        with open(off_path, "wb") as f:
+            f.write(offsets.tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _write_ids(self, name: str, doc_ids: List[str]) -> None:
+        with open(self._paths(name)[3], "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(doc_id) + "\n" for doc_id in doc_ids)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _read_ids(self, name: str) -> List[str]:
+        with open(self._paths(name)[3], "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def _tombstone(self, name: str) -> List[str]:
+        if name not in self._tombstones:
+            self._tombstones[name] = self._read_ids(name)
+        return self._tombstones[name]
+
+    def _segment(self, name: str) -> _Segment:
+        """The open segment of that name, or a newly opened one."""
+        return self._opened.get(name) or self._open_segment(name)
+
+    def _open_segment(self, name: str) -> _Segment:
+        vec_path, meta_path, off_path, _ = self._paths(name)
+        ids = self._read_ids(name)
+
+        vectors = np.memmap(
+            vec_path,
+            dtype=np.float16,
+            mode="r",
+            shape=(len(ids), self.settings.dimension),
+        )
+        offsets = np.memmap(off_path, dtype=np.int64, mode="r")
+        # np.memmap cannot map an empty file.
+        metadata = (
+            np.memmap(meta_path, dtype=np.uint8, mode="r")
+            if os.path.getsize(meta_path)
+            else np.zeros(0, dtype=np.uint8)
+        )
+        return _Segment(
+            name=name,
+            vectors=vectors,
+            metadata=metadata,
+            offsets=offsets,
+            ids=ids,
+            live=np.ones(len(ids), dtype=bool),
+        )
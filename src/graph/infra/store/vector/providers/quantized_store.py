@@ -0,0 +1,286 @@
+import asyncio
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from graph.infra.config import get_settings
+from graph.infra.config.schemas.store.store_config import \
+    QuantizedVectorSettings
+from graph.infra.store.vector.base import BaseVectorStore
+from graph.infra.store.vector.exceptions import (VectorConnectionError,
+                                                 VectorDataError,
+                                                 VectorQueryError)
+from graph.infra.store.vector.quantization import VectorCodec, create_codec
+
+
+class QuantizedVectorStore(BaseVectorStore):
+    """
+    In-process vector store that keeps vectors resident as compressed codes.
+
+    Vectors are buffered at full precision until `training_size` of them have
+    arrived, then the codec is trained and every vector is kept as an int8 or
+    PQ code. Searches score the query against the codes (asymmetric distance)
+    in blocks of `block_size`, keeping a running top-k, and, when
+    `rescore_path` is set, re-rank the best candidates exactly against
+    full-precision vectors memory-mapped from that file.
+
+    Only the vectors are compressed: the text and entities of every document
+    stay in process memory as Python objects, which for typical chunks take
+    as much room as the uncompressed vectors or more.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[QuantizedVectorSettings] = None,
+        service_name: str = "quantized_vector_store",
+        codec: Optional[VectorCodec] = None,
+    ):
+        super().__init__(service_name=service_name, provider_name="quantized")
+        self.settings = settings or get_settings().store.quantized
+        self.codec = codec or create_codec(
+            self.settings.codec,
+            self.settings.dimension,
+            self.settings.pq_subspaces,
+            self.settings.pq_iterations,
+        )
+        self._rows: Dict[str, int] = {}
+        self._records: List[Dict[str, Any]] = []
+        # Rows of deleted documents; they are masked out, not compacted.
+        self._deleted: Set[int] = set()
+        self._buffer = np.empty((0, self.settings.dimension), dtype=np.float32)
+        self._codes: Optional[np.ndarray] = None
+
+        self._full_file: Optional[BinaryIO] = None
+        self._full_rows = np.empty(0, dtype=np.int64)
+        self._full_count = 0
+        self._full: Optional[np.memmap] = None
+
+    async def _connect(self) -> None:
+        if self.settings.rescore_path:
+            try:
+                # The store is in-process, so full-precision rows from a
+                # previous run no longer match any code and are discarded.
+                self._full_file = open(self.settings.rescore_path, "w+b")
+            except OSError as e:
+                raise VectorConnectionError(
+                    f"Failed to open re-score file '{self.settings.rescore_path}'."
+                ) from e
+
+    async def _close(self) -> None:
+        self._full = None
+        if self._full_file:
+            self._full_file.close()
+            self._full_file = None
+
+    async def _ensure_schema_impl(self) -> None:
+        # Nothing to provision: the index lives in process memory.
+        return None
+
+    async def _upsert_documents_impl(
+        self, docs: List[Dict[str, Any]], vectors: Any
+    ) -> None:
+        if not docs:
+            return
+        try:
+            matrix = self._normalize(np.asarray(vectors, dtype=np.float32))
+            rows = np.array([self._row_for(d) for d in docs], dtype=np.int64)
+            self._grow(len(self._records))
+
+            if self.codec.is_trained:
+                self._codes[rows] = self.codec.encode(matrix)
+            else:
+                self._buffer[rows] = matrix
+                if len(self._records) >= self.settings.training_size:
+                    self._train()
+
+            if self._full_file:
+                self._append_full_precision(rows, matrix)
+        except Exception as e:
+            raise VectorDataError(
+                "Failed to upsert documents into the quantized store."
+            ) from e
+
+    async def _delete_documents_impl(self, doc_ids: List[str]) -> None:
+        for doc_id in doc_ids:
+            row = self._rows.pop(doc_id, None)
+            if row is not None:
+                self._deleted.add(row)
+
+    async def _vector_search_impl(
+        self, query_vec: Any, top_k: int, ef: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        try:
+            count = len(self._records)
+            if count == 0 or top_k <= 0:
+                return []
+            query = self._normalize(np.asarray(query_vec, dtype=np.float32))
+            # Scoring runs in a thread on a snapshot of the rows, so a search
+            # over a large corpus does not stall the event loop and upserts
+            # arriving meanwhile do not change what it scores.
+            rows, scores = await asyncio.to_thread(
+                self._search,
+                query,
+                self._codes if self.codec.is_trained else self._buffer,
+                count,
+                np.array(sorted(self._deleted), dtype=np.int64),
+                top_k,
+                ef,
+            )
+            return [
+                {**self._records[row], "dense_score": float(score)}
+                for row, score in zip(rows, scores)
+            ]
+        except Exception as e:
+            raise VectorQueryError(
+                "Failed to perform quantized vector search.", query_vec=query_vec
+            ) from e
+
+    def _search(
+        self,
+        query: np.ndarray,
+        matrix: np.ndarray,
+        count: int,
+        deleted: np.ndarray,
+        top_k: int,
+        ef: Optional[int],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the rows and scores of the best `top_k` of the first `count`
+        rows of `matrix`, which holds codes once the codec is trained and
+        full-precision vectors before.
+        """
+        if matrix.dtype == np.float32:
+            return self._scan(
+                lambda start, stop: matrix[start:stop] @ query, count, deleted, top_k
+            )
+
+        # A requested ef replaces the configured re-score breadth.
+        breadth = (
+            max(top_k, ef or self.settings.rescore_candidates)
+            if self._full_file
+            else top_k
+        )
+        rows, scores = self._scan(
+            lambda start, stop: self.codec.score(query, matrix[start:stop]),
+            count,
+            deleted,
+            breadth,
+        )
+        if self._full_file:
+            scores = self._full_precision(rows) @ query
+            best = self._top(scores, top_k)
+            rows, scores = rows[best], scores[best]
+        return rows, scores
+
+    def memory_per_document(self) -> int:
+        """Returns the resident bytes per document used by vectors."""
+        if self.codec.is_trained:
+            return self.codec.code_size
+        return self.settings.dimension * np.dtype(np.float32).itemsize
+
+    # --- Private Methods ---
+
+    @staticmethod
+    def _normalize(matrix: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+        return matrix / np.where(norms == 0, 1.0, norms)
+
+    @staticmethod
+    def _top(scores: np.ndarray, k: int) -> np.ndarray:
+        """Returns the indexes of the k best finite scores, best first."""
+        if len(scores) > k:
+            best = np.argpartition(-scores, k - 1)[:k]
+        else:
+            best = np.arange(len(scores))
+        best = best[np.isfinite(scores[best])]
+        return best[np.argsort(-scores[best], kind="stable")]
+
+    def _scan(
+        self,
+        score: Callable[[int, int], np.ndarray],
+        count: int,
+        deleted: np.ndarray,
+        k: int,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Scores rows [0, count) in blocks of `block_size`, keeping a running
+        top-k, so a search never holds more than one block of widened codes.
+        Returns the rows and scores of the k best, best first.
+        """
+        best_rows = np.empty(0, dtype=np.int64)
+        best_scores = np.empty(0, dtype=np.float32)
+        for start in range(0, count, self.settings.block_size):
+            stop = min(start + self.settings.block_size, count)
+            scores = np.asarray(score(start, stop), dtype=np.float32)
+            scores[deleted[(deleted >= start) & (deleted < stop)] - start] = -np.inf
+            top = self._top(scores, k)
+            best_rows = np.concatenate([best_rows, top + start])
+            best_scores = np.concatenate([best_scores, scores[top]])
+            keep = self._top(best_scores, k)
+            best_rows, best_scores = best_rows[keep], best_scores[keep]
+        return best_rows, best_scores
+
+    def _row_for(self, doc: Dict[str, Any]) -> int:
+        record = {
+            "doc_id": doc["id"],
+            "text": doc["text"],
+            "entities": doc.get("entities", []),
+        }
+        row = self._rows.get(doc["id"])
+        if row is None:
+            row = len(self._records)
+            self._rows[doc["id"]] = row
+            self._records.append(record)
+        else:
+            self._records[row] = record
+        return row
+
+    def _grow(self, size: int) -> None:
+        """Grows the row arrays geometrically so upserts stay amortised O(batch)."""
+        array = self._codes if self.codec.is_trained else self._buffer
+        if size <= len(array):
+            return
+        capacity = max(size, 2 * len(array), 1024)
+        grown = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+        grown[: len(array)] = array
+        if self.codec.is_trained:
+            self._codes = grown
+        else:
+            self._buffer = grown
+
+    def _train(self) -> None:
+        count = len(self._records)
+        self.codec.train(self._buffer[:count])
+        codes = self.codec.encode(self._buffer[:count])
+        self._codes = np.zeros((len(self._buffer), codes.shape[1]), codes.dtype)
+        self._codes[:count] = codes
+        self._buffer = np.empty((0, self.settings.dimension), dtype=np.float32)
+
+    def _append_full_precision(self, rows: np.ndarray, matrix: np.ndarray) -> None:
+        self._full_file.seek(0, 2)
+        self._full_file.write(np.ascontiguousarray(matrix, np.float32).tobytes())
+        self._full_file.flush()
+
+        if len(self._full_rows) < len(self._records):
+            grown = np.zeros(
+                max(len(self._records), 2 * len(self._full_rows)), np.int64
+            )
+            grown[: len(self._full_rows)] = self._full_rows
+            self._full_rows = grown
+        self._full_rows[rows] = np.arange(
+            self._full_count, self._full_count + len(rows)
+        )
+        self._full_count += len(rows)
+        self._full = None
+
+    def _full_precision(self, rows: np.ndarray) -> np.ndarray:
+        # Searches run in threads, so a map of fewer rows may have been cached
+        # after the last append.
+        if self._full is None or len(self._full) != self._full_count:
+            self._full = np.memmap(
+                self._full_file.name,
+                dtype=np.float32,
+                mode="r",
+                shape=(self._full_count, self.settings.dimension),
+            )
+        return np.asarray(self._full[self._full_rows[rows]])
@@ -0,0 +1,217 @@
+import asyncio
+import hashlib
+import heapq
+import itertools
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+from loguru import logger
+
+from graph.infra.config import get_settings
+from graph.infra.config.schemas.embedding import EmbeddingSettings
+from graph.infra.config.schemas.store.store_config import ShardedVectorSettings
+from graph.infra.observability.metrics.usage.vector_store_metrics import \
+    VECTOR_SHARD_LATENCY
+from graph.infra.services.protocol import BaseServiceProtocol
+from graph.infra.store.vector.base import BaseVectorStore
+from graph.infra.store.vector.exceptions import (VectorConnectionError,
+                                                 VectorDataError,
+                                                 VectorIndexError,
+                                                 VectorQueryError)
+from graph.infra.store.vector.protocol import VectorStoreProtocol
+
+from .weaviate_store import WeaviateStore
+
+
+def shard_for(doc_id: str, num_shards: int) -> int:
+    """
+    Maps a document id to a shard with a hash that is stable across processes.
+    """
+    digest = hashlib.blake2b(doc_id.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % num_shards
+
+
+class ShardedVectorStore(BaseVectorStore):
+    """
+    Routes vector operations over N underlying vector stores.
+
+    Upserts are partitioned by a stable hash of the document id. Searches are
+    scattered to every shard concurrently and the per-shard hits are merged
+    into a global top-k. When some shards fail, the configured partial-results
+    policy decides whether the merged hits of the remaining shards are returned.
+    """
+
+    def __init__(
+        self,
+        shards: Sequence[VectorStoreProtocol],
+        settings: Optional[ShardedVectorSettings] = None,
+        service_name: str = "sharded_vector_store",
+    ):
+        super().__init__(service_name=service_name, provider_name="sharded")
+        if not shards:
+            raise ValueError("ShardedVectorStore requires at least one shard.")
+        self.settings = settings or get_settings().store.sharded
+        self._shards = list(shards)
+        self.logger = logger.bind(service=self.service_name)
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings: Optional[ShardedVectorSettings] = None,
+        embedding: Optional[EmbeddingSettings] = None,
+    ) -> "ShardedVectorStore":
+        """Builds one WeaviateStore per configured shard."""
+        settings = settings or get_settings().store.sharded
+        shards = [
+            WeaviateStore(
+                shard_settings,
+                service_name=f"weaviate_store_shard_{i}",
+                embedding=embedding,
+            )
+            for i, shard_settings in enumerate(settings.shards)
+        ]
+        return cls(shards=shards, settings=settings)
+
+    async def _connect(self) -> None:
+        try:
+            await asyncio.gather(
+                *(
+                    shard.start()
+                    for shard in self._shards
+                    if isinstance(shard, BaseServiceProtocol)
+                )
+            )
+        except Exception as e:
+            raise VectorConnectionError("Failed to start all vector shards.") from e
+
+    async def _close(self) -> None:
+        await asyncio.gather(
+            *(
+                shard.stop()
+                for shard in self._shards
+                if isinstance(shard, BaseServiceProtocol)
+            ),
+            return_exceptions=True,
+        )
+
+    async def _ensure_schema_impl(self) -> None:
+        try:
+            await asyncio.gather(
+                *(
+                    self._timed(i, "ensure_schema", shard.ensure_schema)
+                    for i, shard in enumerate(self._shards)
+                )
+            )
+        except Exception as e:
+            raise VectorIndexError("Failed to ensure schema on all shards.") from e
+
+    async def _upsert_documents_impl(
+        self, docs: List[Dict[str, Any]], vectors: Any
+    ) -> None:
+        groups: Dict[int, List[int]] = {}
+        for row, doc in enumerate(docs):
+            groups.setdefault(shard_for(doc["id"], len(self._shards)), []).append(row)
+
+        matrix = np.asarray(vectors)
+        try:
+            await asyncio.gather(
+                *(
+                    self._timed(
+                        i,
+                        "upsert_documents",
+                        self._shards[i].upsert_documents,
+                        docs=[docs[row] for row in rows],
+                        vectors=matrix[rows],
+                    )
+                    for i, rows in groups.items()
+                )
+            )
+        except Exception as e:
+            raise VectorDataError("Failed to upsert documents to all shards.") from e
+
+    async def _delete_documents_impl(self, doc_ids: List[str]) -> None:
+        groups: Dict[int, List[str]] = {}
+        for doc_id in doc_ids:
+            groups.setdefault(shard_for(doc_id, len(self._shards)), []).append(doc_id)
+        try:
+            await asyncio.gather(
+                *(
+                    self._timed(
+                        i, "delete_documents", self._shards[i].delete_documents, ids
+                    )
+                    for i, ids in groups.items()
+                )
+            )
+        except Exception as e:
+            raise VectorDataError("Failed to delete documents from all shards.") from e
+
+    async def _vector_search_impl(
+        self, query_vec: Any, top_k: int, ef: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        results = await asyncio.gather(
+            *(
+                self._timed(
+                    i,
+                    "vector_search",
+                    shard.vector_search,
+                    query_vec=query_vec,
+                    top_k=top_k,
+                    ef=ef,
+                    timeout=self.settings.shard_timeout_seconds,
+                )
+                for i, shard in enumerate(self._shards)
+            ),
+            return_exceptions=True,
+        )
+
+        hits = [r for r in results if not isinstance(r, BaseException)]
+        failed = {i: r for i, r in enumerate(results) if isinstance(r, BaseException)}
+        if failed:
+            self._check_partial_results(
+                failed, succeeded=len(hits), query_vec=query_vec
+            )
+
+        return heapq.nlargest(
+            top_k,
+            itertools.chain.from_iterable(hits),
+            key=lambda d: d.get("dense_score", 0.0),
+        )
+
+    def _check_partial_results(
+        self, failed: Dict[int, BaseException], succeeded: int, query_vec: Any
+    ) -> None:
+        """Raises unless the partial-results policy accepts the surviving shards."""
+        for i, error in failed.items():
+            self.logger.warning(f"Vector shard {i} failed during search: {error!r}")
+
+        if (
+            self.settings.partial_results == "fail"
+            or succeeded < self.settings.min_successful_shards
+        ):
+            first_error = next(iter(failed.values()))
+            raise VectorQueryError(
+                f"{len(failed)} of {len(self._shards)} vector shards failed.",
+                query_vec=query_vec,
+            ) from first_error
+
+    async def _timed(
+        self,
+        shard_index: int,
+        operation: str,
+        func: Callable[..., Awaitable[Any]],
+        *args: Any,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Runs a shard call, recording its latency under the shard label."""
+        start_time = time.perf_counter()
+        status_label = "failure"
+        try:
+            result = await asyncio.wait_for(func(*args, **kwargs), timeout=timeout)
+            status_label = "success"
+            return result
+        finally:
+            VECTOR_SHARD_LATENCY.labels(
+                shard=str(shard_index), operation=operation, status=status_label
+            ).observe(time.perf_counter() - start_time)
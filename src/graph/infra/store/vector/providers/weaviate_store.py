@@ -1,9 +1,17 @@
+import asyncio
+import hashlib
+import json
 from typing import Any, Dict, List, Optional
 
 import weaviate
-from weaviate.classes.config import Configure
+from loguru import logger
+from weaviate.classes.config import (Configure, DataType, Property,
+                                     VectorDistances)
+from weaviate.classes.query import Filter
+from weaviate.util import generate_uuid5
 
 from graph.infra.config import get_settings
+from graph.infra.config.schemas.embedding import EmbeddingSettings
 from graph.infra.config.schemas.store.store_config import VectorSettings
 from graph.infra.store.vector.base import BaseVectorStore
 from graph.infra.store.vector.exceptions import (VectorConnectionError,
@@ -12,14 +20,43 @@ from graph.infra.store.vector.exceptions import (VectorConnectionError,
                                                  VectorQueryError)
 
 
+def _document_uuid(doc_id: str, namespace: str) -> str:
+    """
+    Derives a deterministic object UUID from the document id, so that
+    re-ingesting the same document overwrites it instead of duplicating it.
+    """
+    return generate_uuid5(doc_id, namespace)
+
+
+def _embedding_id(settings: EmbeddingSettings) -> str:
+    """Identifies the model and backend that computed a document's vector."""
+    return f"{settings.backend}:{settings.model_name}"
+
+
+def _content_hash(doc: Dict[str, Any], embedding_id: str) -> str:
+    """
+    Hashes the properties that determine a document's stored object and
+    vector, including the embedding that produced the vector, so switching
+    the model or backend rewrites every document.
+    """
+    payload = json.dumps(
+        [doc["id"], doc["text"], sorted(doc.get("entities", [])), embedding_id],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
 class WeaviateStore(BaseVectorStore):
     def __init__(
         self,
         settings: Optional[VectorSettings] = None,
         service_name: Optional[str] = "weaviate_store",
+        embedding: Optional[EmbeddingSettings] = None,
     ):
         super().__init__(service_name=service_name, provider_name="weaviate")
         self.settings = settings or get_settings().store.vector
+        self._embedding_id = _embedding_id(embedding or get_settings().embedding)
         self.client: Optional[weaviate.WeaviateClient] = None
 
     async def _connect(self) -> None:
@@ -34,66 +71,241 @@ class WeaviateStore(BaseVectorStore):
 
     async def _ensure_schema_impl(self) -> None:
         try:
-            doc_class = "Document"
+            doc_class = self.settings.class_name
             if doc_class not in self.client.collections.list_all():
                 self.client.collections.create(
                     name=doc_class,
                     vectorizer_config=Configure.Vectorizer.none(),
+                    vector_index_config=self._vector_index_config(),
                     properties=[
-                        {"name": "doc_id", "dataType": "text"},
-                        {"name": "text", "dataType": "text"},
-                        {"name": "entities", "dataType": "text[]"},
+                        Property(name="doc_id", data_type=DataType.TEXT),
+                        Property(name="text", data_type=DataType.TEXT),
+                        Property(name="entities", data_type=DataType.TEXT_ARRAY),
+                        Property(name="content_hash", data_type=DataType.TEXT),
                     ],
                 )
+                return
+
+            col = self.client.collections.get(doc_class)
+            properties = {p.name for p in col.config.get().properties}
+            if "content_hash" not in properties:
+                # The collection predates deterministic UUIDs; the property is
+                # added last, so an interrupted migration runs again.
+                moved = self._migrate_random_uuids(col)
+                logger.info(
+                    f"Moved {moved} objects of '{doc_class}' to UUIDs derived "
+                    f"from their doc_id."
+                )
+                col.config.add_property(
+                    Property(name="content_hash", data_type=DataType.TEXT)
+                )
         except Exception as e:
             raise VectorIndexError("Failed to ensure vector store schema.") from e
 
+    def _migrate_random_uuids(self, col: Any, chunk_size: int = 1000) -> int:
+        """
+        Moves objects stored under random UUIDs to the UUID derived from their
+        doc_id, keeping their vector, and deletes the originals, so the next
+        ingestion run overwrites them instead of adding a second copy. Where
+        the derived UUID already exists, the original is only deleted.
+        Returns the number of objects removed from random UUIDs.
+        """
+        moved = 0
+        pending: Dict[str, Any] = {}
+        originals: List[str] = []
+
+        def flush() -> None:
+            existing = self._fetch_content_hashes(col, list(pending))
+            with col.batch.dynamic() as batch:
+                for uuid, o in pending.items():
+                    if uuid not in existing:
+                        vector = o.vector
+                        batch.add_object(
+                            uuid=uuid,
+                            properties=dict(o.properties),
+                            vector=(
+                                vector.get("default")
+                                if isinstance(vector, dict)
+                                else vector
+                            ),
+                        )
+            if col.batch.failed_objects:
+                raise VectorDataError(
+                    f"Failed to move {len(col.batch.failed_objects)} objects "
+                    f"to their deterministic UUIDs."
+                )
+            col.data.delete_many(where=Filter.by_id().contains_any(originals))
+            pending.clear()
+            originals.clear()
+
+        for o in col.iterator(
+            include_vector=True, return_properties=["doc_id", "text", "entities"]
+        ):
+            uuid = _document_uuid(o.properties["doc_id"], self.settings.class_name)
+            if str(o.uuid) == uuid:
+                continue
+            # Of several copies of one document, the last one read is kept.
+            pending[uuid] = o
+            originals.append(str(o.uuid))
+            moved += 1
+            if len(originals) >= chunk_size:
+                flush()
+        if originals:
+            flush()
+        return moved
+
+    def _vector_index_config(self) -> Any:
+        """
+        Builds the HNSW index configuration from the vector settings.
+        """
+        s = self.settings
+        quantizer: Any = None
+        if s.compression == "pq":
+            quantizer = Configure.VectorIndex.Quantizer.pq(
+                segments=s.pq_segments, training_limit=s.compression_training_limit
+            )
+        elif s.compression == "sq":
+            quantizer = Configure.VectorIndex.Quantizer.sq(
+                rescore_limit=s.compression_rescore_limit,
+                training_limit=s.compression_training_limit,
+            )
+        elif s.compression == "bq":
+            quantizer = Configure.VectorIndex.Quantizer.bq(
+                rescore_limit=s.compression_rescore_limit
+            )
+
+        return Configure.VectorIndex.hnsw(
+            distance_metric=(
+                VectorDistances.DOT if s.distance == "dot" else VectorDistances.COSINE
+            ),
+            ef=s.ef,
+            ef_construction=s.ef_construction,
+            max_connections=s.max_connections,
+            dynamic_ef_min=s.dynamic_ef_min,
+            dynamic_ef_max=s.dynamic_ef_max,
+            dynamic_ef_factor=s.dynamic_ef_factor,
+            quantizer=quantizer,
+        )
+
     async def _upsert_documents_impl(
         self, docs: List[Dict[str, Any]], vectors: Any
     ) -> None:
+        # The client calls block; the event loop keeps the other stages going.
+        await asyncio.to_thread(self._write_documents, docs, vectors)
+
+    def _write_documents(self, docs: List[Dict[str, Any]], vectors: Any) -> None:
         try:
-            col = self.client.collections.get("Document")
+            col = self.client.collections.get(self.settings.class_name)
+
+            candidates = {}
+            for d, v in zip(docs, vectors):
+                # Later duplicates of the same doc_id win, as they would on write.
+                uuid = _document_uuid(d["id"], self.settings.class_name)
+                candidates[uuid] = (d, v, _content_hash(d, self._embedding_id))
+
+            stored_hashes = self._fetch_content_hashes(col, list(candidates))
+            changed = [
+                (uuid, d, v, content_hash)
+                for uuid, (d, v, content_hash) in candidates.items()
+                if stored_hashes.get(uuid) != content_hash
+            ]
+            if not changed:
+                return
+
             with col.batch.dynamic() as batch:
-                for d, v in zip(docs, vectors):
+                for uuid, d, v, content_hash in changed:
                     batch.add_object(
+                        uuid=uuid,
                         properties={
                             "doc_id": d["id"],
                             "text": d["text"],
                             "entities": d.get("entities", []),
+                            "content_hash": content_hash,
                         },
                         vector=v,
                     )
+            failed = col.batch.failed_objects
         except Exception as e:
             raise VectorDataError(
                 "Failed to upsert documents into the vector store."
             ) from e
+        # The batch collects rejected objects instead of raising.
+        if failed:
+            raise VectorDataError(
+                f"Failed to upsert {len(failed)} of {len(changed)} documents "
+                f"into the vector store: {failed[0].message}"
+            )
+
+    def _fetch_content_hashes(self, col: Any, uuids: List[str]) -> Dict[str, str]:
+        """
+        Returns the stored content hash for each of the given object UUIDs
+        that already exists in the collection.
+        """
+        if not uuids:
+            return {}
+        res = col.query.fetch_objects(
+            filters=Filter.by_id().contains_any(uuids),
+            limit=len(uuids),
+            return_properties=["content_hash"],
+        )
+        return {
+            str(o.uuid): o.properties.get("content_hash")
+            for o in res.objects
+            if o.properties.get("content_hash")
+        }
+
+    async def _delete_documents_impl(self, doc_ids: List[str]) -> None:
+        if not doc_ids:
+            return
+        try:
+            col = self.client.collections.get(self.settings.class_name)
+            await asyncio.to_thread(
+                col.data.delete_many,
+                where=Filter.by_id().contains_any(
+                    [_document_uuid(i, self.settings.class_name) for i in doc_ids]
+                ),
+            )
+        except Exception as e:
+            raise VectorDataError(
+                "Failed to delete documents from the vector store."
+            ) from e
 
     async def _vector_search_impl(
-        self, query_vec: Any, top_k: int
+        self, query_vec: Any, top_k: int, ef: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         try:
-            col = self.client.collections.get("Document")
-            res = col.query.near_vector(
-                near_vector=query_vec,
-                limit=top_k,
-                return_metadata=["distance"],
-                return_properties=["doc_id", "text", "entities"],
-            )
-            hits = []
-            for o in res.objects:
-                sim = (
-                    1.0 - o.metadata.distance
-                    if o.metadata.distance is not None
-                    else 0.0
-                )
-                hits.append(
-                    {
-                        "doc_id": o.properties.get("doc_id"),
-                        "text": o.properties.get("text", ""),
-                        "entities": o.properties.get("entities", []),
-                        "dense_score": float(sim),
-                    }
-                )
-            return hits
+            # The client call blocks; in a thread, a search that outlives the
+            # request deadline is abandoned instead of stalling the event loop.
+            return await asyncio.to_thread(self._near_vector, query_vec, top_k, ef)
         except Exception as e:
             raise VectorQueryError("Failed to perform vector search.") from e
+
+    def _near_vector(
+        self, query_vec: Any, top_k: int, ef: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        col = self.client.collections.get(self.settings.class_name)
+        # Weaviate has no per-query ef; the index searches with at least
+        # `limit` candidates, so a requested ef widens the limit instead.
+        res = col.query.near_vector(
+            near_vector=query_vec,
+            limit=max(top_k, ef or 0),
+            return_metadata=["distance"],
+            return_properties=["doc_id", "text", "entities"],
+        )
+        return [
+            {
+                "doc_id": o.properties.get("doc_id"),
+                "text": o.properties.get("text", ""),
+                "entities": o.properties.get("entities", []),
+                "dense_score": self._similarity(o.metadata.distance),
+            }
+            for o in res.objects[:top_k]
+        ]
+
+    def _similarity(self, distance: Optional[float]) -> float:
+        """Converts a Weaviate distance into a similarity for the configured metric."""
+        if distance is None:
+            return 0.0
+        if self.settings.distance == "dot":
+            return float(-distance)
+        return float(1.0 - distance)
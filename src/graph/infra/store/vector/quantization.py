@@ -0,0 +1,203 @@
+from typing import Optional, Protocol, runtime_checkable
+
+import numpy as np
+
+
+@runtime_checkable
+class VectorCodec(Protocol):
+    """
+    Protocol for a lossy vector compression codec.
+
+    Codecs are trained on a sample of vectors, encode vectors into compact
+    codes, and score a full-precision query directly against the codes
+    (asymmetric distance computation) without decoding the corpus.
+    """
+
+    @property
+    def is_trained(self) -> bool:
+        """
+        Returns True once the codec has been fitted and can encode vectors.
+        """
+        ...
+
+    @property
+    def code_size(self) -> int:
+        """
+        Returns the number of bytes used to store one encoded vector.
+        """
+        ...
+
+    def train(self, vectors: np.ndarray) -> None:
+        """
+        Fits the codec parameters on a sample of float32 vectors.
+        """
+        ...
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        """
+        Compresses a (n, dim) float32 matrix into a (n, code_size) uint8/int8 matrix.
+        """
+        ...
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        """
+        Reconstructs approximate float32 vectors from their codes.
+        """
+        ...
+
+    def score(self, query: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        """
+        Returns the approximate inner product between the query and every code.
+        Scratch memory grows with the number of codes, so callers score large
+        corpora block by block.
+        """
+        ...
+
+
+class ScalarQuantizer:
+    """
+    Per-dimension int8 scalar quantization (4x smaller than float32).
+
+    Each dimension is mapped linearly from its trained [min, max] range onto
+    the 256 int8 levels.
+    """
+
+    def __init__(self, dimension: int):
+        self.dimension = dimension
+        self._offset: Optional[np.ndarray] = None
+        self._scale: Optional[np.ndarray] = None
+
+    @property
+    def is_trained(self) -> bool:
+        return self._scale is not None
+
+    @property
+    def code_size(self) -> int:
+        return self.dimension
+
+    def train(self, vectors: np.ndarray) -> None:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        low, high = vectors.min(axis=0), vectors.max(axis=0)
+        self._scale = np.maximum(high - low, 1e-12) / 255.0
+        # Code c represents offset + (c + 128) * scale.
+        self._offset = low + 128.0 * self._scale
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        levels = np.rint((np.asarray(vectors, np.float32) - self._offset) / self._scale)
+        return np.clip(levels, -128, 127).astype(np.int8)
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        return codes.astype(np.float32) * self._scale + self._offset
+
+    def score(self, query: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        # q . (c * scale + offset) == c . (q * scale) + q . offset
+        query = np.asarray(query, dtype=np.float32)
+        return codes.astype(np.float32) @ (query * self._scale) + float(
+            query @ self._offset
+        )
+
+
+class ProductQuantizer:
+    """
+    Product quantization with 256 centroids per subspace.
+
+    The vector is split into `subspaces` contiguous slices, each replaced by
+    the one-byte id of its nearest centroid. Scoring builds a per-query lookup
+    table of centroid inner products and sums the table entries of each code.
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        subspaces: int,
+        iterations: int = 20,
+        seed: int = 0,
+    ):
+        if dimension % subspaces:
+            raise ValueError(
+                f"Dimension {dimension} is not divisible by {subspaces} subspaces."
+            )
+        self.dimension = dimension
+        self.subspaces = subspaces
+        self.iterations = iterations
+        self._sub_dim = dimension // subspaces
+        self._rng = np.random.default_rng(seed)
+        self._centroids: Optional[np.ndarray] = None
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    @property
+    def code_size(self) -> int:
+        return self.subspaces
+
+    def train(self, vectors: np.ndarray) -> None:
+        parts = self._split(np.asarray(vectors, dtype=np.float32))
+        self._centroids = np.stack(
+            [self._kmeans(parts[:, m, :], 256) for m in range(self.subspaces)]
+        )
+
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        parts = self._split(np.asarray(vectors, dtype=np.float32))
+        codes = np.empty((parts.shape[0], self.subspaces), dtype=np.uint8)
+        for m in range(self.subspaces):
+            codes[:, m] = self._nearest(parts[:, m, :], self._centroids[m])
+        return codes
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        parts = self._centroids[np.arange(self.subspaces), codes]
+        return parts.reshape(codes.shape[0], self.dimension)
+
+    def score(self, query: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        query_parts = np.asarray(query, dtype=np.float32).reshape(
+            self.subspaces, self._sub_dim
+        )
+        # table[m, c] = <query slice m, centroid c of subspace m>
+        table = np.einsum("md,mcd->mc", query_parts, self._centroids)
+        # Summing per subspace avoids an (n, subspaces) gather.
+        scores = np.zeros(len(codes), dtype=np.float32)
+        for m in range(self.subspaces):
+            scores += table[m, codes[:, m]]
+        return scores
+
+    # --- Private Methods ---
+
+    def _split(self, vectors: np.ndarray) -> np.ndarray:
+        return vectors.reshape(vectors.shape[0], self.subspaces, self._sub_dim)
+
+    @staticmethod
+    def _nearest(points: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        distances = (
+            (points**2).sum(axis=1, keepdims=True)
+            - 2.0 * points @ centroids.T
+            + (centroids**2).sum(axis=1)
+        )
+        return distances.argmin(axis=1)
+
+    def _kmeans(self, points: np.ndarray, k: int) -> np.ndarray:
+        """Lloyd's k-means; unused centroids are padded so codes stay one byte."""
+        n = points.shape[0]
+        centroids = points[self._rng.choice(n, size=min(k, n), replace=False)].copy()
+        for _ in range(self.iterations):
+            assignment = self._nearest(points, centroids)
+            counts = np.bincount(assignment, minlength=len(centroids))
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, points)
+            filled = counts > 0
+            centroids[filled] = sums[filled] / counts[filled, None]
+        if len(centroids) < k:
+            padding = np.repeat(centroids[:1], k - len(centroids), axis=0)
+            centroids = np.concatenate([centroids, padding])
+        return centroids
+
+
+def create_codec(
+    codec: str, dimension: int, subspaces: int, iterations: int = 20
+) -> VectorCodec:
+    """Builds the codec named in the settings ('int8' or 'pq')."""
+    if codec == "int8":
+        return ScalarQuantizer(dimension)
+    if codec == "pq":
+        return ProductQuantizer(dimension, subspaces, iterations=iterations)
+    raise ValueError(f"Unknown vector codec '{codec}'.")
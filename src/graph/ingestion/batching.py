@@ -0,0 +1,104 @@
+# src/graph/ingestion/batching.py
+
+import time
+from typing import Awaitable, Callable, List, TypeVar, Union
+
+from graph.infra.config.schemas.ingestion.ingestion_config import \
+    IngestionSettings
+from graph.infra.observability.metrics.usage.ingestion_metrics import \
+    INGESTION_BATCH_SIZE
+
+T = TypeVar("T")
+
+
+class AimdBatchSizer:
+    """
+    Additive-increase / multiplicative-decrease controller for one batch size.
+
+    Every call that finishes within the latency target grows the size by a
+    fixed step; a slow or failed call shrinks it by a factor. Each stage and
+    store operation gets its own sizer, so each converges to what its
+    backend currently sustains, within [minimum, maximum].
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        target_latency: float,
+        increase: int,
+        decrease_factor: float,
+    ):
+        self.name = name
+        self.minimum, self.maximum = minimum, maximum
+        self.target_latency = target_latency
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self._size = float(min(max(initial, minimum), maximum))
+        INGESTION_BATCH_SIZE.labels(controller=name).set(self.size)
+
+    @property
+    def size(self) -> int:
+        return int(self._size)
+
+    def record(self, latency: float, failed: bool = False) -> None:
+        if failed or latency > self.target_latency:
+            self._size = max(self.minimum, self._size * self.decrease_factor)
+        else:
+            self._size = min(self.maximum, self._size + self.increase)
+        INGESTION_BATCH_SIZE.labels(controller=self.name).set(self.size)
+
+    async def run(self, count: int, call: Callable[[slice], Awaitable[T]]) -> List[T]:
+        """
+        Splits `count` items into consecutive chunks of the current size and
+        awaits `call` on each slice, feeding its latency back into the size.
+        """
+        results, start = [], 0
+        while start < count:
+            chunk = slice(start, min(start + self.size, count))
+            start_time = time.perf_counter()
+            try:
+                results.append(await call(chunk))
+            except Exception:
+                self.record(time.perf_counter() - start_time, failed=True)
+                raise
+            self.record(time.perf_counter() - start_time)
+            start = chunk.stop
+        return results
+
+
+class FixedBatchSizer:
+    """Sizer with the same interface that always uses one constant size."""
+
+    def __init__(self, name: str, size: int):
+        self.name = name
+        self.size = size
+
+    def record(self, latency: float, failed: bool = False) -> None:
+        pass
+
+    async def run(self, count: int, call: Callable[[slice], Awaitable[T]]) -> List[T]:
+        return [
+            await call(slice(start, min(start + self.size, count)))
+            for start in range(0, count, self.size)
+        ]
+
+
+BatchSizer = Union[AimdBatchSizer, FixedBatchSizer]
+
+
+def create_sizer(name: str, settings: IngestionSettings, batch_size: int) -> BatchSizer:
+    """Builds an adaptive sizer starting at `batch_size`, or a fixed one."""
+    if not settings.adaptive_batching:
+        return FixedBatchSizer(name, batch_size)
+    return AimdBatchSizer(
+        name,
+        initial=batch_size,
+        minimum=settings.min_batch_size,
+        maximum=settings.max_batch_size,
+        target_latency=settings.target_latency_seconds,
+        increase=settings.batch_increase,
+        decrease_factor=settings.batch_decrease_factor,
+    )
@@ -0,0 +1,101 @@
+# src/graph/ingestion/chunking.py
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from graph.infra.store.ids import chunk_id
+
+_WORD = re.compile(r"\S+")
+
+
+class TokenWindowChunker:
+    """
+    Splits document texts into windows of at most `window` tokens, each
+    window sharing `overlap` tokens with the previous one.
+
+    Windows are cut at token boundaries and sliced from the original text.
+    With a Hugging Face fast tokenizer (the one of the embedding model),
+    window sizes match what the model sees, so nothing is truncated;
+    without one, whitespace-delimited words approximate tokens.
+    """
+
+    def __init__(self, window: int, overlap: int = 0, tokenizer: Any = None):
+        if not 0 <= overlap < window:
+            raise ValueError("Chunk overlap must be smaller than the window.")
+        self.window = window
+        self.overlap = overlap
+        self._tokenizer = tokenizer if getattr(tokenizer, "is_fast", False) else None
+
+    def chunk(self, docs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Returns the chunk records of the documents, in document order. Each
+        chunk keeps the entities of its document and its `parent_id`.
+        """
+        texts = [doc["text"] for doc in docs]
+        chunks = []
+        for doc, text, spans in zip(docs, texts, self._token_spans(texts)):
+            for index, (start, end) in enumerate(self._windows(spans)):
+                chunks.append(
+                    {
+                        "id": chunk_id(doc["id"], index),
+                        "text": text[start:end] if spans else text,
+                        "entities": doc.get("entities", []),
+                        "parent_id": doc["id"],
+                    }
+                )
+        return chunks
+
+    def split(self, text: str) -> List[str]:
+        return [c["text"] for c in self.chunk([{"id": "", "text": text}])]
+
+    def _token_spans(self, texts: List[str]) -> List[List[Tuple[int, int]]]:
+        """Character spans of every token, tokenized in one call per batch."""
+        if self._tokenizer is None:
+            return [[m.span() for m in _WORD.finditer(text)] for text in texts]
+        encoded = self._tokenizer(
+            texts, add_special_tokens=False, return_offsets_mapping=True
+        )
+        return [
+            [(start, end) for start, end in offsets if end > start]
+            for offsets in encoded["offset_mapping"]
+        ]
+
+    def _windows(self, spans: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        if not spans:
+            # Texts without tokens still get one (empty) chunk, so that the
+            # document stays addressable in the vector store.
+            return [(0, 0)]
+        step = self.window - self.overlap
+        return [
+            (spans[first][0], spans[min(first + self.window, len(spans)) - 1][1])
+            for first in range(0, max(len(spans) - self.overlap, 1), step)
+        ]
+
+
+def chunk_counts(chunks: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Counts the chunks of each parent document."""
+    counts: Dict[str, int] = {}
+    for chunk in chunks:
+        counts[chunk["parent_id"]] = counts.get(chunk["parent_id"], 0) + 1
+    return counts
+
+
+def stale_chunk_ids(
+    previous: Dict[str, int],
+    current: Dict[str, int],
+    deleted: Optional[List[str]] = None,
+) -> List[str]:
+    """
+    Ids of chunks that existed before but not any more: the tail of a
+    document that now has fewer chunks, or every chunk of a deleted one.
+    """
+    stale = [
+        chunk_id(doc_id, index)
+        for doc_id, count in current.items()
+        for index in range(count, previous.get(doc_id, 0))
+    ]
+    for doc_id in deleted or []:
+        stale.extend(
+            chunk_id(doc_id, index) for index in range(previous.get(doc_id, 0))
+        )
+    return stale
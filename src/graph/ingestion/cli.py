@@ -0,0 +1,395 @@
+# src/graph/ingestion/cli.py
+
+import argparse
+import asyncio
+import multiprocessing as mp
+import os
+import queue
+import time
+from dataclasses import replace
+from typing import (Callable, Dict, Iterable, List, Mapping, Optional,
+                    Sequence, Tuple)
+
+from loguru import logger
+from prometheus_client import REGISTRY
+
+from graph.infra.config import get_settings
+from graph.infra.observability.metrics.exporter import start_metrics_server
+
+from .dead_letter import DeadLetterQueue
+from .executor import IngestionJob, prepare_stores, run_job
+from .readers import create_reader
+
+PIPELINES = ("documents", "entities", "links")
+PATH_FIELDS = {
+    "documents": "documents_path",
+    "entities": "entities_path",
+    "links": "edges_path",
+}
+# Links reference nodes written by other shards, so they run in a second phase.
+PHASES = (["documents", "entities"], ["links"])
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Ingest documents, entities and their links into the stores.",
+    )
+    parser.add_argument("--documents", default="data/documents.jsonl")
+    parser.add_argument("--entities", default="data/entities.jsonl")
+    parser.add_argument("--edges", default="data/edges.jsonl")
+    parser.add_argument(
+        "--batch-size", type=int, help="Records per batch (overrides settings)."
+    )
+    parser.add_argument(
+        "--embedding-workers",
+        type=int,
+        help="Embedding worker processes; 0 embeds in-process.",
+    )
+    parser.add_argument(
+        "--write-concurrency", type=int, help="Batches written concurrently."
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="Split the inputs by range across this many processes.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Read and decode the inputs without touching the stores.",
+    )
+    parser.add_argument(
+        "--replay-dead-letters",
+        action="store_true",
+        help="Write the batches in the dead-letter file again, then exit.",
+    )
+    parser.add_argument(
+        "--create-only",
+        action="store_true",
+        help="Create entities without looking them up (initial loads only).",
+    )
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Ignore checkpoints left by an interrupted run.",
+    )
+    parser.add_argument(
+        "--no-metrics-server",
+        action="store_true",
+        help="Do not expose ingestion metrics over the Prometheus exporter.",
+    )
+    parser.add_argument(
+        "--progress-interval",
+        type=float,
+        default=5.0,
+        help="Seconds between progress reports.",
+    )
+    return parser
+
+
+def job_from_args(args: argparse.Namespace) -> IngestionJob:
+    """Builds the job with the command-line overrides applied to the settings."""
+    settings = get_settings()
+    ingestion_overrides = {
+        key: value
+        for key, value in (
+            ("batch_size", args.batch_size),
+            ("write_concurrency", args.write_concurrency),
+        )
+        if value is not None
+    }
+    embedding_overrides = (
+        {"workers": args.embedding_workers}
+        if args.embedding_workers is not None
+        else {}
+    )
+    graph_overrides = {"entity_write_mode": "create"} if args.create_only else {}
+    return IngestionJob(
+        documents_path=args.documents,
+        entities_path=args.entities,
+        edges_path=args.edges,
+        ingestion=settings.ingestion.model_copy(update=ingestion_overrides),
+        embedding=settings.embedding.model_copy(update=embedding_overrides),
+        graph=settings.store.graph.model_copy(update=graph_overrides),
+        resume=not args.no_resume,
+    )
+
+
+def input_path(job: IngestionJob, pipeline: str) -> str:
+    return getattr(job, PATH_FIELDS[pipeline])
+
+
+def split_job(job: IngestionJob, shards: int) -> List[IngestionJob]:
+    """
+    Splits every input into `shards` contiguous ranges (newline-aligned bytes
+    for JSONL, rows for Arrow formats) and returns one job per shard. Each
+    shard keeps its own checkpoint file, so an interrupted sharded run
+    resumes every shard where it stopped.
+    """
+    settings = job.ingestion or get_settings().ingestion
+    splits = {}
+    for pipeline in PIPELINES:
+        path = input_path(job, pipeline)
+        reader = create_reader(
+            path,
+            reader=settings.reader,
+            json_decoder=settings.json_decoder,
+            embedding_column=settings.embedding_column,
+        )
+        splits[pipeline] = reader.split(path, shards)
+
+    jobs = []
+    for shard in range(shards):
+        checkpoint_path = (
+            f"{settings.checkpoint_path}.{shard}-of-{shards}"
+            if settings.checkpoint_path
+            else None
+        )
+        # Inputs with fewer ranges than shards get an empty range here.
+        ranges = {
+            pipeline: parts[shard] if shard < len(parts) else (0, 0)
+            for pipeline, parts in splits.items()
+        }
+        jobs.append(
+            replace(
+                job,
+                ingestion=settings.model_copy(
+                    update={"checkpoint_path": checkpoint_path}
+                ),
+                ranges=ranges,
+                ensure_schemas=False,
+            )
+        )
+    return jobs
+
+
+class ProgressReporter:
+    """Logs written record counts and throughput per pipeline."""
+
+    def __init__(self) -> None:
+        self._started = time.monotonic()
+        self._last_time = self._started
+        self._last: Dict[str, float] = {}
+
+    def report(self, counts: Dict[str, float], final: bool = False) -> None:
+        now = time.monotonic()
+        elapsed = max(now - self._last_time, 1e-9)
+        parts = []
+        for pipeline in PIPELINES:
+            count = counts.get(pipeline, 0)
+            if final:
+                rate = count / max(now - self._started, 1e-9)
+            else:
+                rate = (count - self._last.get(pipeline, 0)) / elapsed
+            parts.append(f"{pipeline}={int(count)} ({rate:.0f}/s)")
+        self._last, self._last_time = dict(counts), now
+        label = "Ingested" if final else "Progress"
+        logger.info(f"{label}: {', '.join(parts)}")
+
+
+def written_counts() -> Dict[str, float]:
+    """Reads the records that passed each pipeline's write stage so far."""
+    return {
+        pipeline: REGISTRY.get_sample_value(
+            "ingestion_stage_records_total", {"pipeline": pipeline, "stage": "write"}
+        )
+        or 0.0
+        for pipeline in PIPELINES
+    }
+
+
+async def _run_with_progress(
+    job: IngestionJob,
+    interval: float,
+    publish: Callable[[Dict[str, float]], None],
+) -> Dict[str, float]:
+    """Runs a job while publishing the written counts every `interval`."""
+    task = asyncio.create_task(run_job(job))
+    while True:
+        done, _ = await asyncio.wait({task}, timeout=interval)
+        publish(written_counts())
+        if done:
+            task.result()
+            return written_counts()
+
+
+def dry_run(job: IngestionJob) -> Dict[str, int]:
+    """Reads and decodes the job's inputs and returns their record counts."""
+    settings = job.ingestion or get_settings().ingestion
+    counts = {}
+    for pipeline in PIPELINES:
+        path = input_path(job, pipeline)
+        reader = create_reader(
+            path,
+            reader=settings.reader,
+            json_decoder=settings.json_decoder,
+            embedding_column=settings.embedding_column,
+        )
+        start, end = (job.ranges or {}).get(pipeline, (0, None))
+        counts[pipeline] = sum(
+            reader.decode(batch).size
+            for batch in reader.batches(path, settings.batch_size, start, 0, end)
+        )
+    return counts
+
+
+def serve_metrics(port_offset: int = 0) -> None:
+    """Starts the Prometheus exporter; a busy port only costs the metrics."""
+    try:
+        start_metrics_server(port_offset)
+    except OSError as e:
+        logger.warning(f"Ingestion metrics are not exported: {e}")
+
+
+def _shard_worker(
+    job: IngestionJob,
+    shard: int,
+    updates: "mp.Queue[Tuple[int, Dict[str, float]]]",
+    interval: float,
+    metrics: bool,
+) -> None:
+    """
+    Process entry point: runs one shard with its own store connections and,
+    optionally, its own exporter on the next free port after the parent's.
+    """
+    if metrics:
+        serve_metrics(port_offset=shard + 1)
+
+    def publish(counts: Dict[str, float]) -> None:
+        updates.put((shard, counts))
+
+    asyncio.run(_run_with_progress(job, interval, publish))
+
+
+def run_sharded(
+    jobs: Sequence[IngestionJob], interval: float, metrics: bool = False
+) -> Dict[str, float]:
+    """
+    Runs the shard jobs in one process each, phase by phase, and aggregates
+    their progress. Any failed shard stops the run after its phase.
+    """
+    context = mp.get_context("spawn")
+    updates = context.Queue()
+    reporter = ProgressReporter()
+    totals: Dict[str, float] = {}
+
+    for phase in PHASES:
+        latest: Dict[int, Dict[str, float]] = {}
+        processes = [
+            context.Process(
+                target=_shard_worker,
+                args=(replace(job, only=phase), shard, updates, interval, metrics),
+                name=f"ingestion-shard-{shard}",
+            )
+            for shard, job in enumerate(jobs)
+        ]
+        for process in processes:
+            process.start()
+
+        def drain(timeout: Optional[float]) -> None:
+            try:
+                shard, counts = updates.get(timeout=timeout)
+                latest[shard] = counts
+                while True:
+                    shard, counts = updates.get_nowait()
+                    latest[shard] = counts
+            except queue.Empty:
+                pass
+
+        while any(p.is_alive() for p in processes):
+            drain(interval)
+            reporter.report(_sum(totals, latest.values()))
+        for process in processes:
+            process.join()
+        drain(0.1)
+        totals = _sum(totals, latest.values())
+
+        failed = [p.name for p in processes if p.exitcode != 0]
+        if failed:
+            raise RuntimeError(f"Ingestion shards failed: {', '.join(failed)}.")
+    return totals
+
+
+def _sum(
+    base: Dict[str, float], counts: Iterable[Mapping[str, float]]
+) -> Dict[str, float]:
+    total = dict(base)
+    for shard_counts in counts:
+        for pipeline, count in shard_counts.items():
+            total[pipeline] = total.get(pipeline, 0) + count
+    return total
+
+
+def _dead_letters(job: IngestionJob) -> Optional[DeadLetterQueue]:
+    path = job.ingestion.dead_letter_path if job.ingestion else None
+    return DeadLetterQueue(path) if path else None
+
+
+def _remove_checkpoints(jobs: Sequence[IngestionJob]) -> None:
+    for job in jobs:
+        path = job.ingestion.checkpoint_path if job.ingestion else None
+        if path and os.path.exists(path):
+            os.remove(path)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.shards < 1:
+        logger.error("--shards must be at least 1.")
+        return 2
+    job = job_from_args(args)
+    if args.shards > 1 and job.ingestion.incremental:
+        # The manifest is a local SQLite file and snapshot deletes need the
+        # whole input, so incremental runs stay in one process.
+        logger.error("Incremental ingestion cannot run with --shards.")
+        return 2
+
+    jobs = split_job(job, args.shards) if args.shards > 1 else [job]
+    reporter = ProgressReporter()
+    try:
+        if args.dry_run:
+            for shard, shard_job in enumerate(jobs):
+                if args.shards > 1:
+                    logger.info(f"Shard {shard} ranges: {shard_job.ranges}")
+            reporter.report(_sum({}, (dry_run(j) for j in jobs)), final=True)
+            return 0
+
+        metrics = not args.no_metrics_server
+        if args.replay_dead_letters:
+            asyncio.run(run_job(replace(job, replay_dead_letters=True)))
+            return 0
+        # Shards append to the same file, so its growth counts the whole run.
+        dead_letters = _dead_letters(job)
+        dead_lettered = dead_letters.count() if dead_letters else 0
+        if args.shards > 1:
+            asyncio.run(prepare_stores(job))
+            counts = run_sharded(jobs, args.progress_interval, metrics)
+            _remove_checkpoints(jobs)
+        else:
+            if metrics:
+                serve_metrics()
+            counts = asyncio.run(
+                _run_with_progress(job, args.progress_interval, reporter.report)
+            )
+    except Exception:
+        logger.exception("An error occurred during the ingestion process.")
+        return 1
+    reporter.report(counts, final=True)
+    if dead_letters and dead_letters.count() > dead_lettered:
+        logger.error(
+            f"{dead_letters.count() - dead_lettered} batches were dead-lettered "
+            f"to {dead_letters.path}; replay them with --replay-dead-letters."
+        )
+        return 3
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+
+    # Setup observability (tracing, etc.) before running anything
+    from graph.infra.observability import setup_tracing
+
+    setup_tracing()
+    sys.exit(main())
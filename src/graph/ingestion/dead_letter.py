@@ -0,0 +1,76 @@
+# src/graph/ingestion/dead_letter.py
+
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class DeadLetter:
+    """A batch that could not be written, with the error that stopped it."""
+
+    pipeline: str
+    source: str
+    batch: int
+    error: str
+    records: List[Dict[str, Any]]
+    vectors: Optional[List[List[float]]] = None
+    failed_at: str = ""
+    attempts: int = 1
+
+
+class DeadLetterQueue:
+    """
+    Local JSONL file of batches whose store writes failed after retries.
+
+    Each entry is appended with a single write to a file opened in append
+    mode, so pipelines and shard processes can share one file. `rewrite`
+    atomically replaces the file with the entries a replay did not clear.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def append(self, letter: DeadLetter) -> None:
+        if not letter.failed_at:
+            letter.failed_at = datetime.now(timezone.utc).isoformat()
+        line = json.dumps(asdict(letter), ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line.encode("utf-8"))
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    def read(self) -> List[DeadLetter]:
+        if not self.path.exists():
+            return []
+        with open(self.path, "r", encoding="utf-8") as f:
+            return [DeadLetter(**json.loads(line)) for line in f if line.strip()]
+
+    def count(self) -> int:
+        """Number of entries in the file, without decoding them."""
+        if not self.path.exists():
+            return 0
+        with open(self.path, "rb") as f:
+            return sum(1 for line in f if line.strip())
+
+    def rewrite(self, letters: List[DeadLetter]) -> None:
+        with self._lock:
+            if not letters:
+                self.path.unlink(missing_ok=True)
+                return
+            tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for letter in letters:
+                    f.write(json.dumps(asdict(letter), ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
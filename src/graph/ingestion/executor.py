@@ -1,59 +1,169 @@
 import asyncio
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 
+from loguru import logger
+
+from graph.embedding import EmbeddingCache, EmbeddingService
 from graph.infra.config import get_settings
+from graph.infra.config.schemas.embedding import EmbeddingSettings
+from graph.infra.config.schemas.ingestion.ingestion_config import \
+    IngestionSettings
+from graph.infra.config.schemas.store.store_config import GraphSettings
 from graph.infra.store.graph.providers import Neo4jStoreProvider
-from graph.infra.store.vector.providers.weaviate_store import WeaviateStore
+from graph.infra.store.vector.base import BaseVectorStore
+from graph.infra.store.vector.providers import (ShardedVectorStore,
+                                                WeaviateStore)
+from graph.retrieval.epoch import create_ingestion_epoch, create_redis_client
 
 from .service import IngestionService
 
 
-async def main():
+@dataclass
+class IngestionJob:
     """
-    Initializes the application components and runs the ingestion service.
+    One ingestion run: its inputs, the settings it runs with and, for a
+    shard of a larger run, the offset ranges and pipelines it covers. A
+    replay job writes the dead-lettered batches again instead. Shards skip
+    creating the schemas, which `prepare_stores` does once beforehand.
     """
+
+    documents_path: str = "data/documents.jsonl"
+    entities_path: str = "data/entities.jsonl"
+    edges_path: str = "data/edges.jsonl"
+    ingestion: Optional[IngestionSettings] = None
+    embedding: Optional[EmbeddingSettings] = None
+    graph: Optional[GraphSettings] = None
+    ranges: Optional[Dict[str, Tuple[int, int]]] = None
+    only: Optional[List[str]] = None
+    resume: bool = True
+    replay_dead_letters: bool = False
+    ensure_schemas: bool = True
+
+
+def _create_stores(
+    job: IngestionJob,
+) -> Tuple[Neo4jStoreProvider, BaseVectorStore]:
     settings = get_settings()
+    embedding_settings = job.embedding or settings.embedding
+    graph_store = Neo4jStoreProvider(job.graph or settings.store.graph)
+    # Stored vectors are only reused while the same embedding produces them.
+    vector_store = (
+        ShardedVectorStore.from_settings(
+            settings.store.sharded, embedding=embedding_settings
+        )
+        if settings.store.sharded.shards
+        else WeaviateStore(settings.store.vector, embedding=embedding_settings)
+    )
+    return graph_store, vector_store
+
+
+async def prepare_stores(job: IngestionJob) -> None:
+    """
+    Creates the stores' schemas and indexes once, before the shards of a
+    run start writing; creating them from every shard at once races.
+    """
+    graph_store, vector_store = _create_stores(job)
+    try:
+        await asyncio.gather(graph_store.start(), vector_store.start())
+        await asyncio.gather(graph_store.ensure_indexes(), vector_store.ensure_schema())
+    finally:
+        await asyncio.gather(graph_store.stop(), vector_store.stop())
+
+
+async def run_job(job: IngestionJob) -> None:
+    """
+    Initializes the application components, runs the ingestion service for
+    the job and shuts everything down again. Errors are propagated.
+    """
+    settings = get_settings()
+    embedding_settings = job.embedding or settings.embedding
 
     # 1. Instantiate concrete dependencies
-    neo4j_provider = Neo4jStoreProvider(settings.store.graph)
-    weaviate_provider = WeaviateStore(settings.store.vector)
+    neo4j_provider, weaviate_provider = _create_stores(job)
+
+    # The embedding service loads the model (in-process or in worker
+    # processes, as configured) and owns the on-disk embedding cache.
+    embedding_service = EmbeddingService(
+        embedding_settings,
+        cache=(
+            EmbeddingCache(
+                embedding_settings.cache_path,
+                embedding_settings.model_name,
+                embedding_settings.cache_segment_rows,
+                backend=embedding_settings.backend,
+            )
+            if embedding_settings.cache_path
+            else None
+        ),
+    )
+    dependencies = [neo4j_provider, weaviate_provider, embedding_service]
+
+    # Writing to the stores starts a new epoch, invalidating cached responses.
+    cache_settings = settings.retrieval.cache
+    redis = (
+        create_redis_client(cache_settings.redis_url)
+        if cache_settings.enabled and cache_settings.redis_url
+        else None
+    )
+    epoch = (
+        create_ingestion_epoch(cache_settings, redis)
+        if cache_settings.enabled
+        else None
+    )
 
     # 2. Instantiate the orchestrator service, injecting dependencies
     ingestion_service = IngestionService(
-        graph_store=neo4j_provider, vector_store=weaviate_provider
+        graph_store=neo4j_provider,
+        vector_store=weaviate_provider,
+        settings=job.ingestion or settings.ingestion,
+        embedding_service=embedding_service,
+        epoch=epoch,
     )
 
     # Use a try/finally block to ensure graceful shutdown
     try:
-        # 3. Start all services
-        # The IngestionService will check the readiness of its dependencies.
-        await asyncio.gather(
-            neo4j_provider.start(), weaviate_provider.start(), ingestion_service.start()
-        )
+        # 3. Start the dependencies, then the service that checks their
+        # readiness.
+        await asyncio.gather(*(service.start() for service in dependencies))
+        await ingestion_service.start()
 
         # 4. Execute the pipeline
+        if job.replay_dead_letters:
+            await ingestion_service.replay_dead_letters()
+            return
         await ingestion_service.run_pipeline(
-            documents_path="data/documents.jsonl",
-            entities_path="data/entities.jsonl",
-            edges_path="data/edges.jsonl",
+            documents_path=job.documents_path,
+            entities_path=job.entities_path,
+            edges_path=job.edges_path,
+            resume=job.resume,
+            ranges=job.ranges,
+            only=job.only,
+            ensure_schemas=job.ensure_schemas,
         )
+    finally:
+        # 5. Stop all services gracefully, in reverse order
+        await ingestion_service.stop()
+        await asyncio.gather(*(service.stop() for service in dependencies))
+        if redis is not None:
+            await redis.aclose()
 
+
+async def main(job: Optional[IngestionJob] = None):
+    """
+    Runs an ingestion job, the default inputs when none is given, and logs
+    any failure instead of raising it.
+    """
+    try:
+        await run_job(job or IngestionJob())
     except Exception:
         logger.exception("An error occurred during the ingestion process.")
-    finally:
-        # 5. Stop all services gracefully
-        await asyncio.gather(
-            ingestion_service.stop(), weaviate_provider.stop(), neo4j_provider.stop()
-        )
 
 
 if __name__ == "__main__":
-    # Setup observability (tracing, etc.) before running anything
-    from loguru import logger
-
-    from graph.infra.observability import setup_tracing
+    # The command-line interface sets up observability and parses options.
+    import sys
 
-    setup_tracing()
+    from .cli import main as cli_main
 
-    logger.info("Starting ingestion process...")
-    asyncio.run(main())
-    logger.info("Ingestion process finished.")
+    sys.exit(cli_main())
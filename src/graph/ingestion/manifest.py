@@ -0,0 +1,130 @@
+# src/graph/ingestion/manifest.py
+
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+
+def record_hash(record: Dict[str, Any]) -> str:
+    """Hashes a source record independently of its key order."""
+    payload = json.dumps(
+        record, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class IngestionManifest:
+    """
+    Local SQLite manifest of the content hash of every ingested record.
+
+    Each record also carries the id of the last run that saw it in its input,
+    so records missing from a full snapshot are those with an older run id.
+    A run id is only retired once the run completes, so an interrupted and
+    resumed run keeps the marks made before the interruption. With chunking,
+    the number of vector chunks of each document is kept as well, so that
+    chunks a document no longer has can be deleted.
+    """
+
+    def __init__(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path)
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS records (
+                kind TEXT NOT NULL,
+                id TEXT NOT NULL,
+                hash TEXT NOT NULL,
+                run INTEGER NOT NULL,
+                PRIMARY KEY (kind, id)
+            );
+            CREATE TABLE IF NOT EXISTS runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                completed INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS chunks (
+                id TEXT PRIMARY KEY,
+                count INTEGER NOT NULL
+            );
+            """
+        )
+
+    def begin_run(self) -> int:
+        """Returns the id of the unfinished run, or starts a new one."""
+        row = self._db.execute(
+            "SELECT id FROM runs WHERE completed = 0 ORDER BY id DESC LIMIT 1"
+        ).fetchone()
+        if row:
+            return row[0]
+        with self._db:
+            return self._db.execute("INSERT INTO runs DEFAULT VALUES").lastrowid
+
+    def complete_run(self, run: int) -> None:
+        with self._db:
+            self._db.execute("UPDATE runs SET completed = 1 WHERE id = ?", (run,))
+
+    def stored_hashes(self, kind: str, ids: List[str]) -> Dict[str, str]:
+        if not ids:
+            return {}
+        placeholders = ",".join("?" * len(ids))
+        rows = self._db.execute(
+            f"SELECT id, hash FROM records WHERE kind = ? AND id IN ({placeholders})",
+            (kind, *ids),
+        )
+        return dict(rows.fetchall())
+
+    def touch(self, kind: str, ids: Iterable[str], run: int) -> None:
+        """Marks unchanged records as present in the given run."""
+        with self._db:
+            self._db.executemany(
+                "UPDATE records SET run = ? WHERE kind = ? AND id = ?",
+                [(run, kind, i) for i in ids],
+            )
+
+    def record(self, kind: str, hashes: Dict[str, str], run: int) -> None:
+        """Stores the hashes of records that were written to the stores."""
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO records (kind, id, hash, run) "
+                "VALUES (?, ?, ?, ?)",
+                [(kind, i, h, run) for i, h in hashes.items()],
+            )
+
+    def remove(self, kind: str, ids: Iterable[str]) -> None:
+        with self._db:
+            self._db.executemany(
+                "DELETE FROM records WHERE kind = ? AND id = ?",
+                [(kind, i) for i in ids],
+            )
+
+    def chunk_counts(self, ids: List[str]) -> Dict[str, int]:
+        if not ids:
+            return {}
+        placeholders = ",".join("?" * len(ids))
+        rows = self._db.execute(
+            f"SELECT id, count FROM chunks WHERE id IN ({placeholders})", ids
+        )
+        return dict(rows.fetchall())
+
+    def record_chunks(self, counts: Dict[str, int]) -> None:
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO chunks (id, count) VALUES (?, ?)",
+                counts.items(),
+            )
+
+    def remove_chunks(self, ids: Iterable[str]) -> None:
+        with self._db:
+            self._db.executemany("DELETE FROM chunks WHERE id = ?", [(i,) for i in ids])
+
+    def missing(self, kind: str, run: int, limit: int) -> List[str]:
+        """Returns up to `limit` ids of records not seen in the given run."""
+        rows = self._db.execute(
+            "SELECT id FROM records WHERE kind = ? AND run < ? LIMIT ?",
+            (kind, run, limit),
+        )
+        return [r[0] for r in rows.fetchall()]
+
+    def close(self) -> None:
+        self._db.close()
@@ -0,0 +1,252 @@
+# src/graph/ingestion/pipeline.py
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import (Any, AsyncIterator, Awaitable, Callable, Deque, Dict,
+                    Iterator, List, Optional, Tuple, Union)
+
+import numpy as np
+from loguru import logger
+from prometheus_client import Gauge
+
+from graph.infra.observability.metrics.usage.ingestion_metrics import (
+    INGESTION_QUEUE_DEPTH, INGESTION_RECORDS_PER_SECOND,
+    INGESTION_STAGE_FAILED_RECORDS_TOTAL, INGESTION_STAGE_LATENCY,
+    INGESTION_STAGE_RECORDS_TOTAL, INGESTION_STAGE_SKIPPED_RECORDS_TOTAL)
+
+_DONE = object()
+
+
+@dataclass
+class IngestBatch:
+    """
+    A batch of source records flowing through the ingestion stages.
+    `start_offset` and `end_offset` delimit its position in the source file.
+    Columnar readers fill `columns` instead of `records`; `column` reads
+    them directly and `as_records` only builds per-record mappings for the
+    stages that need them. Once a batch is split into `chunks`, its
+    `vectors` belong to the chunks instead of the records.
+    """
+
+    number: int
+    records: List[Dict[str, Any]] = field(default_factory=list)
+    raw: Optional[List[bytes]] = None
+    columns: Optional[Dict[str, List[Any]]] = None
+    start_offset: int = 0
+    end_offset: int = 0
+    vectors: Any = None
+    chunks: Optional[List[Dict[str, Any]]] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        if self.raw is not None:
+            return len(self.raw)
+        if not self.records and self.columns:
+            return len(next(iter(self.columns.values())))
+        return len(self.records)
+
+    def column(self, name: str) -> List[Any]:
+        if self.columns is not None and name in self.columns:
+            return self.columns[name]
+        return [record[name] for record in self.records]
+
+    def as_records(self) -> List[Dict[str, Any]]:
+        """The records as mappings, built from the columns on first use."""
+        if not self.records and self.columns:
+            names = list(self.columns)
+            self.records = [
+                dict(zip(names, row)) for row in zip(*self.columns.values())
+            ]
+        return self.records
+
+    def select(self, rows: List[int]) -> None:
+        """Keeps only the given rows, in records, columns and vectors alike."""
+        if self.records:
+            self.records = [self.records[i] for i in rows]
+        if self.columns is not None:
+            self.columns = {
+                name: [values[i] for i in rows] for name, values in self.columns.items()
+            }
+        if self.vectors is not None:
+            self.vectors = np.asarray(self.vectors)[rows]
+
+
+class RateMeter:
+    """
+    Publishes the per-second rate of a growing count to a gauge, measured
+    over a sliding time window so it reflects current throughput rather
+    than the average since the start.
+    """
+
+    def __init__(
+        self,
+        gauge: Gauge,
+        window: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._gauge = gauge
+        self._window = window
+        self._clock = clock
+        self._started = clock()
+        self._events: Deque[Tuple[float, int]] = deque()
+        self._count = 0
+
+    def add(self, count: int) -> float:
+        now = self._clock()
+        self._events.append((now, count))
+        self._count += count
+        while now - self._events[0][0] > self._window:
+            self._count -= self._events.popleft()[1]
+        # Until a full window has elapsed, divide by the time actually covered;
+        # the one-second floor keeps the first samples from spiking.
+        rate = self._count / max(min(self._window, now - self._started), 1.0)
+        self._gauge.set(rate)
+        return rate
+
+    def reset(self) -> None:
+        self._events.clear()
+        self._count = 0
+        self._gauge.set(0)
+
+
+@dataclass
+class Stage:
+    """
+    A pipeline stage. The handler receives one item and returns the item to
+    forward downstream, or None to drop it. `concurrency` workers share the
+    stage's bounded input queue.
+    """
+
+    name: str
+    handler: Callable[[Any], Awaitable[Optional[Any]]]
+    concurrency: int = 1
+
+
+class StagedPipeline:
+    """
+    Runs a source and a chain of stages connected by bounded asyncio queues.
+
+    Each stage runs its own workers, so a slow stage only holds back the
+    stages before it once its queue is full (backpressure), and the end-to-end
+    time approaches that of the slowest stage instead of the sum of all stages.
+    The first failure in any stage cancels the whole pipeline and is re-raised.
+
+    Per stage, it records batch latency and processed, failed and skipped
+    (dropped or filtered out) record counts; reading the source is reported
+    as the "read" stage.
+    """
+
+    def __init__(self, name: str, stages: List[Stage], queue_size: int = 4):
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage.")
+        self.name = name
+        self._stages = stages
+        self._queue_size = queue_size
+        self.logger = logger.bind(pipeline=name)
+
+    async def run(self, source: Union[AsyncIterator[Any], Iterator[Any]]) -> None:
+        queues: List[asyncio.Queue] = [
+            asyncio.Queue(maxsize=self._queue_size) for _ in self._stages
+        ]
+        self._throughput = RateMeter(
+            INGESTION_RECORDS_PER_SECOND.labels(pipeline=self.name)
+        )
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self._feed(source, queues[0]))
+                for index, stage in enumerate(self._stages):
+                    q_out = queues[index + 1] if index + 1 < len(queues) else None
+                    tg.create_task(self._run_stage(index, stage, queues[index], q_out))
+        except BaseExceptionGroup as group:
+            # Surface the failure that stopped the pipeline, not the task group.
+            error = group
+            while isinstance(error, BaseExceptionGroup):
+                error = error.exceptions[0]
+            self.logger.error(f"Pipeline '{self.name}' failed: {error!r}")
+            raise error from None
+        finally:
+            self._throughput.reset()
+
+    async def _feed(
+        self, source: Union[AsyncIterator[Any], Iterator[Any]], q_out: asyncio.Queue
+    ) -> None:
+        """Pulls items from the source; sync iterators are advanced off the loop."""
+        first = self._stages[0]
+        latency = INGESTION_STAGE_LATENCY.labels(pipeline=self.name, stage="read")
+        records = INGESTION_STAGE_RECORDS_TOTAL.labels(pipeline=self.name, stage="read")
+        is_async = hasattr(source, "__anext__")
+        while True:
+            start_time = time.perf_counter()
+            if is_async:
+                item = await anext(source, _DONE)
+            else:
+                item = await asyncio.to_thread(next, source, _DONE)
+            if item is _DONE:
+                break
+            latency.observe(time.perf_counter() - start_time)
+            records.inc(getattr(item, "size", 1))
+            await self._put(q_out, first, item)
+        for _ in range(first.concurrency):
+            await q_out.put(_DONE)
+
+    async def _run_stage(
+        self,
+        index: int,
+        stage: Stage,
+        q_in: asyncio.Queue,
+        q_out: Optional[asyncio.Queue],
+    ) -> None:
+        next_stage = self._stages[index + 1] if q_out is not None else None
+        latency = INGESTION_STAGE_LATENCY.labels(pipeline=self.name, stage=stage.name)
+        records = INGESTION_STAGE_RECORDS_TOTAL.labels(
+            pipeline=self.name, stage=stage.name
+        )
+        failed = INGESTION_STAGE_FAILED_RECORDS_TOTAL.labels(
+            pipeline=self.name, stage=stage.name
+        )
+        skipped = INGESTION_STAGE_SKIPPED_RECORDS_TOTAL.labels(
+            pipeline=self.name, stage=stage.name
+        )
+        depth = INGESTION_QUEUE_DEPTH.labels(pipeline=self.name, stage=stage.name)
+
+        async def worker() -> None:
+            while True:
+                item = await q_in.get()
+                depth.set(q_in.qsize())
+                if item is _DONE:
+                    return
+                # Handlers may filter a batch in place, so size it beforehand.
+                size = getattr(item, "size", 1)
+                start_time = time.perf_counter()
+                try:
+                    result = await stage.handler(item)
+                except Exception:
+                    failed.inc(size)
+                    raise
+                latency.observe(time.perf_counter() - start_time)
+                records.inc(size)
+                if next_stage is None:
+                    self._throughput.add(size)
+                    continue
+                forwarded = 0 if result is None else getattr(result, "size", 1)
+                if forwarded < size:
+                    skipped.inc(size - forwarded)
+                if result is not None:
+                    await self._put(q_out, next_stage, result)
+
+        async with asyncio.TaskGroup() as workers:
+            for _ in range(stage.concurrency):
+                workers.create_task(worker())
+        if next_stage is not None:
+            for _ in range(next_stage.concurrency):
+                await q_out.put(_DONE)
+
+    async def _put(self, queue: asyncio.Queue, stage: Stage, item: Any) -> None:
+        await queue.put(item)
+        INGESTION_QUEUE_DEPTH.labels(pipeline=self.name, stage=stage.name).set(
+            queue.qsize()
+        )
@@ -0,0 +1,225 @@
+# src/graph/ingestion/readers.py
+
+import json
+import os
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Generator, List, Optional, Protocol, Tuple
+
+import numpy as np
+
+from .pipeline import IngestBatch
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+READER_BY_SUFFIX = {".parquet": "parquet", ".arrow": "arrow", ".feather": "arrow"}
+
+
+class RecordReader(Protocol):
+    """
+    Turns an input file into numbered batches. `batches` runs in the feeder
+    thread and should only do I/O; `decode` runs in the parse stage.
+
+    Offsets are reader-specific positions used by checkpoints and shard
+    ranges: bytes for JSONL, rows for Arrow formats. A batch never crosses
+    `end_offset`.
+    """
+
+    def batches(
+        self,
+        path: str,
+        batch_size: int,
+        start_offset: int = 0,
+        first_batch: int = 0,
+        end_offset: Optional[int] = None,
+    ) -> Generator[IngestBatch, None, None]: ...
+
+    def decode(self, batch: IngestBatch) -> IngestBatch: ...
+
+    def split(self, path: str, parts: int) -> List[Tuple[int, int]]:
+        """Splits the file into up to `parts` contiguous [start, end) ranges."""
+        ...
+
+
+def _even_ranges(boundaries: List[int]) -> List[Tuple[int, int]]:
+    unique = sorted(set(boundaries))
+    return [(a, b) for a, b in zip(unique, unique[1:])]
+
+
+def _json_loads(decoder: str) -> Callable[[bytes], Any]:
+    if decoder == "orjson" or (decoder == "auto" and orjson is not None):
+        if orjson is None:
+            raise ImportError("The 'orjson' decoder requires the orjson package.")
+        return orjson.loads
+    return json.loads
+
+
+class JsonlReader:
+    """
+    Reads .jsonl files as raw line batches and decodes them in the parse
+    stage, with orjson when it is installed.
+    """
+
+    def __init__(self, decoder: str = "auto", embedding_column: Optional[str] = None):
+        self._loads = _json_loads(decoder)
+        self._embedding_column = embedding_column
+
+    def batches(
+        self,
+        path: str,
+        batch_size: int,
+        start_offset: int = 0,
+        first_batch: int = 0,
+        end_offset: Optional[int] = None,
+    ) -> Generator[IngestBatch, None, None]:
+        with open(path, "rb") as f:
+            f.seek(start_offset)
+            offset, number = start_offset, first_batch
+            while True:
+                chunk = list(islice(f, batch_size))
+                if end_offset is not None:
+                    chunk = self._until(chunk, offset, end_offset)
+                # The check below handles the end of the file gracefully.
+                if not chunk:
+                    break
+                chunk_end = offset + sum(len(line) for line in chunk)
+                lines = [line for line in chunk if line.strip()]
+                if lines:
+                    yield IngestBatch(
+                        number=number,
+                        raw=lines,
+                        start_offset=offset,
+                        end_offset=chunk_end,
+                    )
+                    number += 1
+                offset = chunk_end
+
+    @staticmethod
+    def _until(chunk: List[bytes], offset: int, end_offset: int) -> List[bytes]:
+        kept = []
+        for line in chunk:
+            if offset >= end_offset:
+                break
+            kept.append(line)
+            offset += len(line)
+        return kept
+
+    def split(self, path: str, parts: int) -> List[Tuple[int, int]]:
+        """Splits at line starts near `size * i / parts`."""
+        size = os.path.getsize(path)
+        boundaries = [0, size]
+        with open(path, "rb") as f:
+            for i in range(1, parts):
+                f.seek(size * i // parts)
+                if f.tell() > 0:
+                    f.seek(f.tell() - 1)
+                    f.readline()
+                boundaries.append(f.tell())
+        return _even_ranges(boundaries)
+
+    def decode(self, batch: IngestBatch) -> IngestBatch:
+        batch.records = [self._loads(line) for line in batch.raw]
+        batch.raw = None
+        column = self._embedding_column
+        if column and all(column in r for r in batch.records):
+            # Precomputed embeddings bypass the model; keep them out of the
+            # records so they are not stored as properties.
+            batch.vectors = np.asarray(
+                [r.pop(column) for r in batch.records], dtype=np.float32
+            )
+        return batch
+
+
+class ArrowReader:
+    """
+    Reads Parquet or Arrow IPC files as record batches. Columns stay in
+    column form; an embedding column of fixed-size lists becomes the batch's
+    vector matrix without a Python-level copy per row.
+    """
+
+    def __init__(self, file_format: str, embedding_column: Optional[str] = None):
+        try:
+            import pyarrow.dataset as ds
+        except ImportError as e:
+            raise ImportError(
+                "Reading Parquet or Arrow files requires the pyarrow package."
+            ) from e
+        self._dataset = ds
+        self._format = file_format
+        self._embedding_column = embedding_column
+
+    def batches(
+        self,
+        path: str,
+        batch_size: int,
+        start_offset: int = 0,
+        first_batch: int = 0,
+        end_offset: Optional[int] = None,
+    ) -> Generator[IngestBatch, None, None]:
+        dataset = self._dataset.dataset(path, format=self._format)
+        position, number = 0, first_batch
+        for record_batch in dataset.to_batches(batch_size=batch_size):
+            start, position = position, position + record_batch.num_rows
+            if end_offset is not None and start >= end_offset:
+                break
+            if position <= start_offset:
+                continue
+            if end_offset is not None and position > end_offset:
+                record_batch = record_batch.slice(0, end_offset - start)
+                position = end_offset
+            if start < start_offset:
+                record_batch = record_batch.slice(start_offset - start)
+                start = start_offset
+            if record_batch.num_rows == 0:
+                continue
+
+            vectors = None
+            column = self._embedding_column
+            if column and column in record_batch.schema.names:
+                values = record_batch.column(column)
+                vectors = (
+                    values.flatten()
+                    .to_numpy(zero_copy_only=False)
+                    .astype(np.float32, copy=False)
+                    .reshape(record_batch.num_rows, -1)
+                )
+                record_batch = record_batch.drop_columns([column])
+
+            yield IngestBatch(
+                number=number,
+                columns=record_batch.to_pydict(),
+                vectors=vectors,
+                start_offset=start,
+                end_offset=position,
+            )
+            number += 1
+
+    def split(self, path: str, parts: int) -> List[Tuple[int, int]]:
+        rows = self._dataset.dataset(path, format=self._format).count_rows()
+        return _even_ranges([rows * i // parts for i in range(parts + 1)])
+
+    def decode(self, batch: IngestBatch) -> IngestBatch:
+        # Columns were decoded per field while reading; mappings per record
+        # are only built by the stages that need them (`as_records`).
+        return batch
+
+
+def create_reader(
+    path: str,
+    reader: str = "auto",
+    json_decoder: str = "auto",
+    embedding_column: Optional[str] = None,
+) -> RecordReader:
+    """Picks a reader from the configured format or the file extension."""
+    if reader == "auto":
+        reader = READER_BY_SUFFIX.get(Path(path).suffix.lower(), "jsonl")
+    if reader == "jsonl":
+        return JsonlReader(json_decoder, embedding_column)
+    if reader == "parquet":
+        return ArrowReader("parquet", embedding_column)
+    if reader == "arrow":
+        return ArrowReader("ipc", embedding_column)
+    raise ValueError(f"Unknown ingestion reader '{reader}'.")
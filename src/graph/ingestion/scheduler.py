@@ -0,0 +1,119 @@
+# src/graph/ingestion/scheduler.py
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Iterable, List, Set
+
+from loguru import logger
+
+
+@dataclass
+class PipelineNode:
+    """A unit of ingestion work that may only start once its dependencies finish."""
+
+    name: str
+    run: Callable[[], Awaitable[None]]
+    depends_on: List[str] = field(default_factory=list)
+
+
+class DagScheduler:
+    """
+    Runs pipeline nodes as a dependency graph: every node starts as soon as
+    all the nodes it depends on have finished, so independent nodes overlap.
+    The first failure cancels the remaining nodes and is re-raised.
+    """
+
+    def __init__(self, nodes: List[PipelineNode]):
+        self._nodes = {node.name: node for node in nodes}
+        if len(self._nodes) != len(nodes):
+            raise ValueError("Pipeline node names must be unique.")
+        self._check_graph()
+        self.logger = logger.bind(service="dag_scheduler")
+
+    async def run(self) -> None:
+        finished = {name: asyncio.Event() for name in self._nodes}
+
+        async def run_node(node: PipelineNode) -> None:
+            for dependency in node.depends_on:
+                await finished[dependency].wait()
+            self.logger.info(f"Starting pipeline node '{node.name}'.")
+            await node.run()
+            self.logger.info(f"Pipeline node '{node.name}' finished.")
+            finished[node.name].set()
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for node in self._nodes.values():
+                    tg.create_task(run_node(node))
+        except BaseExceptionGroup as group:
+            # Surface the failure that stopped the run, not the task group.
+            error = group
+            while isinstance(error, BaseExceptionGroup):
+                error = error.exceptions[0]
+            raise error from None
+
+    def _check_graph(self) -> None:
+        """Rejects unknown dependencies and cycles, which would hang the run."""
+        for node in self._nodes.values():
+            unknown = set(node.depends_on) - set(self._nodes)
+            if unknown:
+                raise ValueError(
+                    f"Node '{node.name}' depends on unknown nodes {sorted(unknown)}."
+                )
+
+        visiting: Set[str] = set()
+        done: Set[str] = set()
+
+        def visit(name: str) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Pipeline nodes form a cycle through '{name}'.")
+            visiting.add(name)
+            for dependency in self._nodes[name].depends_on:
+                visit(dependency)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self._nodes:
+            visit(name)
+
+
+class CommitTracker:
+    """
+    Lets a consumer batch wait until the records it references are committed
+    by concurrently running producers. Ids are only tracked for watched kinds,
+    and a producer that finishes releases every remaining wait on its kind,
+    since ids it never committed will not appear any more.
+    """
+
+    def __init__(self) -> None:
+        self._committed: Dict[str, Set[str]] = {}
+        self._finished: Set[str] = set()
+        self._changed = asyncio.Condition()
+
+    def watch(self, kind: str) -> None:
+        self._committed.setdefault(kind, set())
+
+    async def commit(self, kind: str, ids: Iterable[str]) -> None:
+        if kind not in self._committed:
+            return
+        async with self._changed:
+            self._committed[kind].update(ids)
+            self._changed.notify_all()
+
+    async def finish(self, kind: str) -> None:
+        async with self._changed:
+            self._finished.add(kind)
+            # Nothing waits on a finished kind, so its ids can be released.
+            self._committed.pop(kind, None)
+            self._changed.notify_all()
+
+    async def wait_for(self, kind: str, ids: Iterable[str]) -> None:
+        pending = set(ids)
+        async with self._changed:
+            await self._changed.wait_for(
+                lambda: kind in self._finished
+                or kind not in self._committed
+                or pending <= self._committed[kind]
+            )
@@ -2,16 +2,45 @@
 
 import asyncio
 import json
-from itertools import islice
-from typing import Any, Dict, Generator, List
+from dataclasses import dataclass, replace
+from typing import (Any, Awaitable, Callable, Dict, Generator, List, Optional,
+                    Sequence, Tuple)
 
+import numpy as np
 from loguru import logger
-from sentence_transformers import SentenceTransformer
 
+from graph.embedding import EmbeddingService
+from graph.infra.config import get_settings
+from graph.infra.config.schemas.ingestion.ingestion_config import \
+    IngestionSettings
+from graph.infra.config.schemas.resilience import RetrySettings
 from graph.infra.observability.decorators import with_observability
+from graph.infra.observability.metrics.usage.ingestion_metrics import (
+    INGESTION_DEAD_LETTER_BATCHES_TOTAL, INGESTION_EMBEDDED_TOKENS_TOTAL,
+    INGESTION_EMBEDDING_TOKENS_PER_SECOND)
+from graph.infra.resilience import Retrier
 from graph.infra.services.base import BaseService
 from graph.infra.store.graph import GraphStoreProtocol
 from graph.infra.store.vector import VectorStoreProtocol
+from graph.retrieval.epoch import IngestionEpochProtocol
+
+from .batching import BatchSizer, create_sizer
+from .checkpoint import (CheckpointStore, CommitWatermark, SourceCheckpoint,
+                         source_version)
+from .chunking import TokenWindowChunker, chunk_counts, stale_chunk_ids
+from .dead_letter import DeadLetter, DeadLetterQueue
+from .manifest import IngestionManifest, record_hash
+from .pipeline import IngestBatch, RateMeter, Stage, StagedPipeline
+from .readers import RecordReader, create_reader
+from .scheduler import CommitTracker, DagScheduler, PipelineNode
+
+
+@dataclass
+class _RecordKind:
+    """How incremental mode identifies and deletes the records of one input."""
+
+    key: Callable[[Dict[str, Any]], str]
+    delete: Callable[[List[str]], Awaitable[None]]
 
 
 class IngestionService(BaseService):
@@ -25,65 +54,616 @@ class IngestionService(BaseService):
         graph_store: GraphStoreProtocol,
         vector_store: VectorStoreProtocol,
         embedding_model_name: str = "all-MiniLM-L6-v2",
-        batch_size: int = 128,
+        batch_size: Optional[int] = None,
+        settings: Optional[IngestionSettings] = None,
+        embedding_service: Optional[EmbeddingService] = None,
+        retry_settings: Optional[RetrySettings] = None,
+        epoch: Optional[IngestionEpochProtocol] = None,
     ):
         super().__init__(service_name="ingestion_service")
         self._graph_store = graph_store
         self._vector_store = vector_store
-        self._batch_size = batch_size
+        self.settings = settings or get_settings().ingestion
+        self._batch_size = batch_size or self.settings.batch_size
+        # Adaptive sizes can only shrink a batch, so inputs are read at the
+        # upper bound and every operation chunks them at its own size.
+        self._read_batch_size = (
+            max(self.settings.max_batch_size, self._batch_size)
+            if self.settings.adaptive_batching
+            else self._batch_size
+        )
+        self._sizers: Dict[str, BatchSizer] = {
+            name: create_sizer(name, self.settings, self._batch_size)
+            for name in (
+                "embed",
+                "vector.upsert_documents",
+                "graph.upsert_documents",
+                "graph.upsert_entities",
+                "graph.link_doc_entities",
+            )
+        }
+        self._checkpoints = (
+            CheckpointStore(self.settings.checkpoint_path)
+            if self.settings.checkpoint_path
+            else None
+        )
+        self._manifest = (
+            IngestionManifest(self.settings.manifest_path)
+            if self.settings.incremental
+            else None
+        )
+        self._dead_letters = (
+            DeadLetterQueue(self.settings.dead_letter_path)
+            if self.settings.dead_letter_path
+            else None
+        )
+        self._retrier = Retrier(retry_settings or get_settings().resilience.retry)
+        # Bumped after every run that wrote to the stores, which invalidates
+        # the query responses cached before it.
+        self._epoch = epoch
+        self._run_id: Optional[int] = None
+        self._ranges: Dict[str, Tuple[int, int]] = {}
+        self._commits = CommitTracker()
         self.logger = logger.bind(service=self.service_name)
-        # Initialize the embedding model once.
-        self.embedding_model = SentenceTransformer(embedding_model_name)
+        self._token_rate = RateMeter(INGESTION_EMBEDDING_TOKENS_PER_SECOND)
+        # Without a shared embedding service, the service owns one; either
+        # way the model is loaded when that service starts, not here.
+        self._owns_embedding = embedding_service is None
+        self._embedding = embedding_service or EmbeddingService(
+            get_settings().embedding.model_copy(
+                update={"model_name": embedding_model_name}
+            )
+        )
+        # Windows are measured in words until the model's tokenizer is known.
+        self._chunker = (
+            TokenWindowChunker(self.settings.chunk_tokens, self.settings.chunk_overlap)
+            if self.settings.chunking
+            else None
+        )
 
     async def _connect(self) -> None:
         """
         The ingestion service itself is stateless, but it ensures its
         dependencies are ready before operating.
         """
+        if self._owns_embedding:
+            await self._embedding.start()
         if not self._graph_store.is_ready() or not self._vector_store.is_ready():
             raise RuntimeError("Storage providers are not ready for ingestion.")
+        if not self._embedding.is_ready():
+            raise RuntimeError("The embedding service is not ready for ingestion.")
+        if self._chunker:
+            # An in-process model's tokenizer sizes windows in real model
+            # tokens; a model in worker processes leaves them in words.
+            tokenizer = self._embedding.tokenizer
+            if tokenizer is None:
+                self.logger.warning("Chunk windows are measured in words, not tokens.")
+            self._chunker = TokenWindowChunker(
+                self.settings.chunk_tokens, self.settings.chunk_overlap, tokenizer
+            )
         self.logger.info("IngestionService is ready, dependencies are connected.")
 
     async def _close(self) -> None:
+        if self._manifest:
+            self._manifest.close()
+        if self._owns_embedding:
+            await self._embedding.stop()
         self.logger.info("IngestionService is closing.")
 
     @with_observability(name="ingestion.run_pipeline")
     async def run_pipeline(
-        self, documents_path: str, entities_path: str, edges_path: str
+        self,
+        documents_path: str,
+        entities_path: str,
+        edges_path: str,
+        resume: bool = True,
+        ranges: Optional[Dict[str, Tuple[int, int]]] = None,
+        only: Optional[Sequence[str]] = None,
+        ensure_schemas: bool = True,
     ) -> None:
         """
         Executes the full ingestion pipeline: documents, entities, and their relationships.
+        Documents and entities are ingested concurrently; links wait for the
+        nodes they reference (per batch, or for both inputs to finish,
+        depending on `link_wait`). With checkpointing enabled, an interrupted
+        run resumes after the last committed batch of each input unless
+        `resume` is False. In incremental mode only new, changed and deleted
+        records are written.
+
+        `ranges` restricts inputs, keyed by pipeline name, to [start, end)
+        reader offsets, and `only` runs a subset of the pipelines; together
+        they let several processes ingest disjoint shards of the same files.
+        Such shards pass `ensure_schemas=False`; their parent creates the
+        schemas once, as concurrent creation races.
         """
         self.logger.info("Starting data ingestion pipeline.")
-        await self._ensure_schemas()
+        selected = set(only) if only else {"documents", "entities", "links"}
+        if self._checkpoints and not resume:
+            self._checkpoints.clear()
+        if self._manifest:
+            self._run_id = self._manifest.begin_run()
+        if ensure_schemas:
+            await self._ensure_schemas()
+
+        self._ranges = ranges or {}
+        self._commits = CommitTracker()
+        producers: List[str] = [
+            kind for kind in ("documents", "entities") if kind in selected
+        ]
+        link_dependencies: List[str] = []
+        if self.settings.link_wait == "batch":
+            for kind in producers:
+                self._commits.watch(kind)
+        else:
+            link_dependencies = producers
 
-        await self._ingest_documents(documents_path)
-        await self._ingest_entities(entities_path)
-        await self._link_document_entities(edges_path)
+        nodes = [
+            PipelineNode(
+                "documents",
+                self._producer("documents", self._ingest_documents, documents_path),
+            ),
+            PipelineNode(
+                "entities",
+                self._producer("entities", self._ingest_entities, entities_path),
+            ),
+            PipelineNode(
+                "links",
+                lambda: self._link_document_entities(edges_path),
+                depends_on=link_dependencies,
+            ),
+        ]
+        try:
+            await DagScheduler([node for node in nodes if node.name in selected]).run()
+        finally:
+            self._token_rate.reset()
+            # Even a failed run may have written part of its inputs.
+            await self._bump_epoch()
 
+        if self._manifest:
+            self._manifest.complete_run(self._run_id)
+        if self._checkpoints and only is None:
+            # The run is complete; the next one starts from scratch.
+            self._checkpoints.clear()
         self.logger.info("Data ingestion pipeline completed successfully.")
 
     # --- Private Methods ---
 
+    async def _bump_epoch(self) -> None:
+        if self._epoch is None:
+            return
+        try:
+            epoch = await self._epoch.bump()
+        except Exception:
+            # Cached responses then live until their TTL instead.
+            self.logger.exception("Failed to bump the ingestion epoch.")
+            return
+        self.logger.info(f"Started ingestion epoch {epoch}.")
+
+    def _reader(self, file_path: str) -> RecordReader:
+        return create_reader(
+            file_path,
+            reader=self.settings.reader,
+            json_decoder=self.settings.json_decoder,
+            embedding_column=self.settings.embedding_column,
+        )
+
     def _load_and_batch_data(
-        self, file_path: str
-    ) -> Generator[List[Dict[str, Any]], None, None]:
+        self,
+        reader: RecordReader,
+        file_path: str,
+        start_offset: int,
+        first_batch: int,
+        end_offset: Optional[int] = None,
+    ) -> Generator[IngestBatch, None, None]:
+        """
+        Returns the reader's lazy generator of numbered batches of the file,
+        so large files are never held in memory; decoding happens in the
+        parse stage so it overlaps with reading.
         """
-        Loads data from a .jsonl file and yields it in batches.
-        This generator approach is memory-efficient for large files.
+        return reader.batches(
+            file_path, self._read_batch_size, start_offset, first_batch, end_offset
+        )
+
+    async def _run_pipeline(
+        self, name: str, file_path: str, kind: _RecordKind, stages: Sequence[Stage]
+    ) -> None:
+        """
+        Streams a file through parse and the given stages. With checkpointing
+        or incremental mode, the last stage must return its batch so the
+        following bookkeeping stages can record it. The last stage writes to
+        the stores; with a dead-letter file, its failures are set aside.
         """
-        with open(file_path, "r") as f:
-            while True:
-                lines_iterator = islice(f, self._batch_size)
-                # The check below handles the end of the file gracefully.
-                first_line = next(lines_iterator, None)
-                if not first_line:
-                    break
+        checkpoint = None
+        if self._checkpoints:
+            # Offsets are only valid for the version of the file read now.
+            size, mtime_ns = source_version(file_path)
+            checkpoint = self._checkpoints.get(name, file_path)
+        if checkpoint and checkpoint.completed:
+            self.logger.info(f"Skipping '{name}': {file_path} was already ingested.")
+            return
+
+        start_offset, end_offset = self._ranges.get(name, (0, None))
+        first_batch = 0
+        if checkpoint:
+            start_offset, first_batch = checkpoint.offset, checkpoint.batch + 1
+            self.logger.info(
+                f"Resuming '{name}' at batch {first_batch} (offset {start_offset})."
+            )
+
+        if self._dead_letters:
+            *head, write = stages
+            stages = [
+                *head,
+                Stage(
+                    write.name,
+                    self._dead_lettering(name, file_path, write.handler),
+                    write.concurrency,
+                ),
+            ]
+
+        reader = self._reader(file_path)
+
+        async def decode(batch: IngestBatch) -> IngestBatch:
+            # Decoding is CPU work; in a thread it overlaps the other stages.
+            return await asyncio.to_thread(reader.decode, batch)
+
+        parse = Stage("parse", decode, self.settings.parse_concurrency)
+        chain = [parse, *stages]
+        if self._manifest:
+            chain = [
+                parse,
+                Stage("diff", self._differ(name, kind)),
+                *(
+                    Stage(s.name, self._skip_empty(s.handler), s.concurrency)
+                    for s in stages
+                ),
+                Stage("manifest", self._recorder(name, kind)),
+            ]
+        if self._checkpoints:
+            chain.append(
+                Stage(
+                    "checkpoint",
+                    self._committer(
+                        SourceCheckpoint(
+                            source=file_path,
+                            stage=stages[-1].name,
+                            size=size,
+                            mtime_ns=mtime_ns,
+                        ),
+                        name,
+                        first_batch,
+                    ),
+                )
+            )
+        await StagedPipeline(
+            name=name, stages=chain, queue_size=self.settings.queue_size
+        ).run(
+            self._load_and_batch_data(
+                reader, file_path, start_offset, first_batch, end_offset
+            )
+        )
+
+        if self._manifest and self.settings.snapshot:
+            await self._delete_missing(name, kind)
+        if self._checkpoints:
+            final = self._checkpoints.get(name, file_path) or SourceCheckpoint(
+                source=file_path, size=size, mtime_ns=mtime_ns
+            )
+            final.completed = True
+            self._checkpoints.save(name, final)
+
+    def _committer(
+        self, template: SourceCheckpoint, name: str, first_batch: int
+    ) -> Callable[[IngestBatch], Awaitable[None]]:
+        """
+        Builds the handler that persists the contiguous commit point as
+        copies of `template`. It runs as a single worker, so saves are
+        serialized.
+        """
+        watermark = CommitWatermark(next_batch=first_batch)
+
+        async def commit(batch: IngestBatch) -> None:
+            committed = watermark.complete(batch.number, batch.end_offset)
+            if committed is not None:
+                number, offset = committed
+                await asyncio.to_thread(
+                    self._checkpoints.save,
+                    name,
+                    replace(template, offset=offset, batch=number),
+                )
+
+        return commit
+
+    def _producer(
+        self, kind: str, ingest: Callable[[str], Awaitable[None]], file_path: str
+    ) -> Callable[[], Awaitable[None]]:
+        """Wraps a producer node so that finishing it releases waiting links."""
+
+        async def run() -> None:
+            try:
+                await ingest(file_path)
+            finally:
+                await self._commits.finish(kind)
+
+        return run
+
+    def _dead_lettering(
+        self,
+        name: str,
+        file_path: str,
+        handler: Callable[[IngestBatch], Awaitable[Optional[IngestBatch]]],
+    ) -> Callable[[IngestBatch], Awaitable[Optional[IngestBatch]]]:
+        """
+        Wraps the write stage so that a batch still failing after its retries
+        goes to the dead-letter file instead of aborting the whole run.
+        """
+
+        async def run(batch: IngestBatch) -> Optional[IngestBatch]:
+            try:
+                return await handler(batch)
+            except Exception as e:
+                letter = DeadLetter(
+                    pipeline=name,
+                    source=file_path,
+                    batch=batch.number,
+                    error=repr(e),
+                    records=batch.as_records(),
+                    # Chunk vectors are not kept; a replay chunks again.
+                    vectors=(
+                        None
+                        if batch.vectors is None or batch.chunks is not None
+                        else np.asarray(batch.vectors).tolist()
+                    ),
+                )
+                await asyncio.to_thread(self._dead_letters.append, letter)
+                INGESTION_DEAD_LETTER_BATCHES_TOTAL.labels(pipeline=name).inc()
+                self.logger.error(
+                    f"Batch {batch.number} of '{name}' was dead-lettered: {e!r}"
+                )
+                if self._manifest:
+                    # Keep the old hashes so the records still count as changed,
+                    # but mark them as seen so snapshot deletion spares them.
+                    unwritten = list(batch.metadata.get("hashes", {}))
+                    self._manifest.touch(name, unwritten, self._run_id)
+                    batch.metadata["hashes"] = {}
+                return batch
+
+        return run
+
+    @with_observability(name="ingestion.replay_dead_letters")
+    async def replay_dead_letters(self) -> int:
+        """
+        Writes every dead-lettered batch again, keeping only those that still
+        fail in the file. Must not run while a pipeline is ingesting. Returns
+        the number of batches replayed successfully.
+        """
+        if self._dead_letters is None:
+            raise RuntimeError("No dead-letter file is configured.")
+        letters = await asyncio.to_thread(self._dead_letters.read)
+        remaining = []
+        for letter in letters:
+            try:
+                await self._replay(letter)
+            except Exception as e:
+                self.logger.error(
+                    f"Replaying batch {letter.batch} of '{letter.pipeline}' "
+                    f"failed again: {e!r}"
+                )
+                letter.error, letter.attempts = repr(e), letter.attempts + 1
+                remaining.append(letter)
+        await asyncio.to_thread(self._dead_letters.rewrite, remaining)
+        replayed = len(letters) - len(remaining)
+        if replayed:
+            await self._bump_epoch()
+        self.logger.info(
+            f"Replayed {replayed} dead-lettered batches; {len(remaining)} remain."
+        )
+        return replayed
+
+    async def _replay(self, letter: DeadLetter) -> None:
+        records = letter.records
+        if letter.pipeline == "documents":
+            chunks = None
+            if letter.vectors is not None:
+                vectors = np.asarray(letter.vectors, dtype=np.float32)
+            elif self._chunker:
+                chunks = self._chunker.chunk(records)
+                vectors = await self._embed([c["text"] for c in chunks])
+            else:
+                vectors = await self._embed([r["text"] for r in records])
+            await self._write_documents(records, vectors, chunks)
+        elif letter.pipeline == "entities":
+            await self._write_entities(records)
+        elif letter.pipeline == "links":
+            await self._write_links([(r["doc_id"], r["entity_id"]) for r in records])
+        else:
+            raise ValueError(f"Unknown pipeline '{letter.pipeline}'.")
 
-                # Reconstruct the iterator with the first line included.
-                batch_lines = [first_line] + list(lines_iterator)
-                batch = [json.loads(line) for line in batch_lines]
-                yield batch
+    # --- Incremental mode ---
+
+    def _differ(
+        self, name: str, kind: _RecordKind
+    ) -> Callable[[IngestBatch], Awaitable[IngestBatch]]:
+        """
+        Builds the handler that drops unchanged records from a batch and sets
+        aside tombstones, so later stages only see new or changed records.
+        """
+        tombstone_field = self.settings.tombstone_field
+
+        async def diff(batch: IngestBatch) -> IngestBatch:
+            tombstones, live = [], {}
+            for row, r in enumerate(batch.as_records()):
+                if r.get(tombstone_field) is True:
+                    tombstones.append(kind.key(r))
+                else:
+                    # Later duplicates of a key win, as they would on write.
+                    live[kind.key(r)] = (row, record_hash(r))
+
+            stored = self._manifest.stored_hashes(name, list(live))
+            unchanged = [k for k, (_, h) in live.items() if stored.get(k) == h]
+            self._manifest.touch(name, unchanged, self._run_id)
+            # Unchanged records are already stored, so dependents may use them.
+            await self._commits.commit(name, unchanged)
+            for k in unchanged:
+                del live[k]
+
+            batch.select(sorted(row for row, _ in live.values()))
+            batch.metadata["hashes"] = {k: h for k, (_, h) in live.items()}
+            batch.metadata["tombstones"] = tombstones
+            return batch
+
+        return diff
+
+    def _recorder(
+        self, name: str, kind: _RecordKind
+    ) -> Callable[[IngestBatch], Awaitable[IngestBatch]]:
+        """
+        Builds the handler that runs after a batch was written: it stores the
+        new hashes and applies the batch's tombstones.
+        """
+
+        async def record(batch: IngestBatch) -> IngestBatch:
+            self._manifest.record(name, batch.metadata["hashes"], self._run_id)
+            tombstones = batch.metadata["tombstones"]
+            if tombstones:
+                await self._retrier.call(
+                    f"{name}.delete", lambda: kind.delete(tombstones)
+                )
+                self._manifest.remove(name, tombstones)
+                self.logger.info(f"Deleted {len(tombstones)} tombstoned {name}.")
+            return batch
+
+        return record
+
+    async def _delete_missing(self, name: str, kind: _RecordKind) -> None:
+        """Deletes previously ingested records that are absent from this snapshot."""
+        total = 0
+        while ids := self._manifest.missing(
+            name, self._run_id, self.settings.delete_batch_size
+        ):
+            await self._retrier.call(f"{name}.delete", lambda: kind.delete(ids))
+            self._manifest.remove(name, ids)
+            total += len(ids)
+        if total:
+            self.logger.info(f"Deleted {total} {name} missing from the snapshot.")
+
+    @staticmethod
+    def _skip_empty(
+        handler: Callable[[IngestBatch], Awaitable[Any]],
+    ) -> Callable[[IngestBatch], Awaitable[Any]]:
+        async def run(batch: IngestBatch) -> Any:
+            if not batch.size:
+                return batch
+            return await handler(batch)
+
+        return run
+
+    async def _delete_documents(self, doc_ids: List[str]) -> None:
+        vector_ids = doc_ids
+        if self._chunker and self._manifest:
+            # Ids of unchunked documents are kept in case chunking was only
+            # enabled after they were written.
+            previous = self._manifest.chunk_counts(doc_ids)
+            vector_ids = doc_ids + stale_chunk_ids(previous, {}, doc_ids)
+        await asyncio.gather(
+            self._vector_store.delete_documents(vector_ids),
+            self._graph_store.delete_documents(doc_ids),
+        )
+        if self._chunker and self._manifest:
+            self._manifest.remove_chunks(doc_ids)
+
+    async def _unlink(self, keys: List[str]) -> None:
+        await self._graph_store.unlink_doc_entities(
+            pairs=[tuple(json.loads(key)) for key in keys]
+        )
+
+    # --- Stages ---
+
+    async def _encode(self, texts: List[str]) -> np.ndarray:
+        # The embedding service answers from its caches where it can.
+        vectors = await self._embedding.encode(texts)
+        # Whitespace tokens approximate the model's tokens without paying
+        # for a second tokenization pass.
+        tokens = sum(len(text.split()) for text in texts)
+        INGESTION_EMBEDDED_TOKENS_TOTAL.inc(tokens)
+        self._token_rate.add(tokens)
+        return vectors
+
+    async def _embed(self, texts: List[str]) -> np.ndarray:
+        # Model calls pad every text to the longest one, so texts of similar
+        # length are embedded together and put back in order afterwards.
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        by_length = [texts[i] for i in order]
+        parts = await self._sizers["embed"].run(
+            len(by_length), lambda rows: self._encode(by_length[rows])
+        )
+        sorted_vectors = np.concatenate(parts)
+        vectors = np.empty_like(sorted_vectors)
+        vectors[order] = sorted_vectors
+        return vectors
+
+    async def _store_write(
+        self, operation: str, count: int, call: Callable[[slice], Awaitable[Any]]
+    ) -> None:
+        """
+        Writes `count` items in chunks sized for the operation, retrying each
+        chunk under the operation's retry policy. Writes are idempotent
+        upserts, so a retried chunk never duplicates data.
+        """
+        await self._sizers[operation].run(
+            count, lambda rows: self._retrier.call(operation, lambda: call(rows))
+        )
+
+    async def _write_documents(
+        self,
+        docs: List[Dict[str, Any]],
+        vectors: np.ndarray,
+        chunks: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        """
+        Writes document nodes to the graph store and, to the vector store,
+        either the documents or their chunks, whichever `vectors` belong to.
+        """
+        vector_docs = docs if chunks is None else chunks
+        await asyncio.gather(
+            self._store_write(
+                "vector.upsert_documents",
+                len(vector_docs),
+                lambda rows: self._vector_store.upsert_documents(
+                    docs=vector_docs[rows], vectors=vectors[rows]
+                ),
+            ),
+            self._store_write(
+                "graph.upsert_documents",
+                len(docs),
+                lambda rows: self._graph_store.upsert_documents(docs=docs[rows]),
+            ),
+        )
+        if chunks is not None and self._manifest:
+            # Documents that shrank leave chunks behind; only the manifest
+            # knows how many each document had before.
+            counts = chunk_counts(chunks)
+            stale = stale_chunk_ids(self._manifest.chunk_counts(list(counts)), counts)
+            if stale:
+                await self._retrier.call(
+                    "vector.delete_documents",
+                    lambda: self._vector_store.delete_documents(stale),
+                )
+            self._manifest.record_chunks(counts)
+
+    async def _write_entities(self, entities: List[Dict[str, Any]]) -> None:
+        await self._store_write(
+            "graph.upsert_entities",
+            len(entities),
+            lambda rows: self._graph_store.upsert_entities(entities=entities[rows]),
+        )
+
+    async def _write_links(self, pairs: List[Tuple[str, str]]) -> None:
+        await self._store_write(
+            "graph.link_doc_entities",
+            len(pairs),
+            lambda rows: self._graph_store.link_doc_entities(pairs=pairs[rows]),
+        )
 
     async def _ensure_schemas(self) -> None:
         self.logger.info("Ensuring storage schemas and indexes are in place.")
@@ -96,36 +676,99 @@ class IngestionService(BaseService):
     async def _ingest_documents(self, file_path: str) -> None:
         self.logger.info(f"Starting document ingestion from {file_path}...")
         total_docs = 0
-        for batch in self._load_and_batch_data(file_path):
-            texts = [doc["text"] for doc in batch]
-            vectors = self.embedding_model.encode(texts, show_progress_bar=False)
 
-            await asyncio.gather(
-                self._vector_store.upsert_documents(docs=batch, vectors=vectors),
-                self._graph_store.upsert_documents(docs=batch),
-            )
-            total_docs += len(batch)
+        async def chunk(batch: IngestBatch) -> IngestBatch:
+            # Precomputed vectors describe whole documents, so those stay whole.
+            if batch.vectors is None:
+                batch.chunks = await asyncio.to_thread(
+                    self._chunker.chunk, batch.as_records()
+                )
+            return batch
+
+        async def embed(batch: IngestBatch) -> IngestBatch:
+            if batch.vectors is None:
+                texts = (
+                    batch.column("text")
+                    if batch.chunks is None
+                    else [c["text"] for c in batch.chunks]
+                )
+                batch.vectors = await self._embed(texts)
+            return batch
+
+        async def write(batch: IngestBatch) -> IngestBatch:
+            nonlocal total_docs
+            await self._write_documents(batch.as_records(), batch.vectors, batch.chunks)
+            await self._commits.commit("documents", batch.column("id"))
+            total_docs += batch.size
             self.logger.info(f"Ingested {total_docs} documents...")
+            return batch
+
+        await self._run_pipeline(
+            "documents",
+            file_path,
+            _RecordKind(key=lambda doc: doc["id"], delete=self._delete_documents),
+            [
+                *(
+                    [Stage("chunk", chunk, self.settings.parse_concurrency)]
+                    if self._chunker
+                    else []
+                ),
+                Stage("embed", embed, self.settings.embed_concurrency),
+                Stage("write", write, self.settings.write_concurrency),
+            ],
+        )
         self.logger.success(f"Finished ingesting {total_docs} documents.")
 
     @with_observability(name="ingestion.ingest_entities")
     async def _ingest_entities(self, file_path: str) -> None:
         self.logger.info(f"Starting entity ingestion from {file_path}...")
         total_entities = 0
-        for batch in self._load_and_batch_data(file_path):
-            await self._graph_store.upsert_entities(entities=batch)
-            total_entities += len(batch)
+
+        async def write(batch: IngestBatch) -> IngestBatch:
+            nonlocal total_entities
+            await self._write_entities(batch.as_records())
+            await self._commits.commit("entities", batch.column("id"))
+            total_entities += batch.size
             self.logger.info(f"Ingested {total_entities} entities...")
+            return batch
+
+        await self._run_pipeline(
+            "entities",
+            file_path,
+            _RecordKind(
+                key=lambda entity: entity["id"],
+                delete=self._graph_store.delete_entities,
+            ),
+            [Stage("write", write, self.settings.write_concurrency)],
+        )
         self.logger.success(f"Finished ingesting {total_entities} entities.")
 
     @with_observability(name="ingestion.link_document_entities")
     async def _link_document_entities(self, file_path: str) -> None:
         self.logger.info(f"Starting to link documents and entities from {file_path}...")
         total_edges = 0
-        for batch in self._load_and_batch_data(file_path):
+
+        async def write(batch: IngestBatch) -> IngestBatch:
+            nonlocal total_edges
             # The protocol expects a list of tuples: (doc_id, entity_id)
-            pairs = [(edge["doc_id"], edge["entity_id"]) for edge in batch]
-            await self._graph_store.link_doc_entities(pairs=pairs)
-            total_edges += len(batch)
+            doc_ids, entity_ids = batch.column("doc_id"), batch.column("entity_id")
+            # MATCH silently skips missing nodes, so wait until they are written.
+            await asyncio.gather(
+                self._commits.wait_for("documents", doc_ids),
+                self._commits.wait_for("entities", entity_ids),
+            )
+            await self._write_links(list(zip(doc_ids, entity_ids)))
+            total_edges += batch.size
             self.logger.info(f"Linked {total_edges} relations...")
+            return batch
+
+        await self._run_pipeline(
+            "links",
+            file_path,
+            _RecordKind(
+                key=lambda edge: json.dumps([edge["doc_id"], edge["entity_id"]]),
+                delete=self._unlink,
+            ),
+            [Stage("write", write, self.settings.write_concurrency)],
+        )
         self.logger.success(f"Finished linking {total_edges} relations.")
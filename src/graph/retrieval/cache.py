@@ -0,0 +1,131 @@
+# src/graph/retrieval/cache.py
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from graph.infra.config import get_settings
+from graph.infra.config.schemas.retrieval import ResponseCacheSettings
+from graph.infra.context import ContextualKeyGenerator
+from graph.infra.observability.metrics.usage.retrieval_metrics import \
+    RETRIEVAL_CACHE_LOOKUPS_TOTAL
+from graph.infra.services.base import BaseService
+
+from .epoch import (IngestionEpochProtocol, create_ingestion_epoch,
+                    create_redis_client)
+
+Response = List[Dict[str, Any]]
+
+
+class ResponseCache(BaseService):
+    """
+    Caches the final, re-ranked documents of queries.
+
+    Keys are namespaced by `ContextualKeyGenerator`, so tenants never share
+    entries, and include the ingestion epoch, so every entry is invalidated
+    when ingestion bumps it. Lookups try the process's LRU first, then the
+    Redis-protocol tier when one is configured. A failing Redis tier only
+    costs cache misses; queries never fail because of the cache.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[ResponseCacheSettings] = None,
+        epoch: Optional[IngestionEpochProtocol] = None,
+        redis: Optional[Any] = None,
+        service_name: str = "response_cache",
+    ):
+        super().__init__(service_name=service_name)
+        self.settings = settings or get_settings().retrieval.cache
+        self._redis = redis
+        self._epoch = epoch or create_ingestion_epoch(self.settings, redis)
+        # Responses are scoped to the tenant even where stores do not filter
+        # by tenant, so one tenant's answers are never served to another.
+        self._keys = ContextualKeyGenerator(
+            namespace="query",
+            settings=get_settings().context.model_copy(
+                update={"multi_tenancy_enabled": True}
+            ),
+        )
+        self._memory: "OrderedDict[str, Tuple[float, Response]]" = OrderedDict()
+        self.logger = logger.bind(service=self.service_name)
+
+    @classmethod
+    def from_settings(cls, settings: ResponseCacheSettings) -> "ResponseCache":
+        redis = create_redis_client(settings.redis_url) if settings.redis_url else None
+        return cls(settings, redis=redis)
+
+    async def _connect(self) -> None:
+        tiers = "memory and redis" if self._redis is not None else "memory"
+        self.logger.info(f"Response cache is ready ({tiers}).")
+
+    async def _close(self) -> None:
+        self._memory.clear()
+        if self._redis is not None:
+            await self._redis.aclose()
+
+    async def key(self, *parts: Any) -> Optional[str]:
+        """
+        The key of a response in the current tenant and ingestion epoch, or
+        None when the epoch cannot be read and the cache must be bypassed.
+        """
+        try:
+            epoch = await self._epoch.current()
+        except Exception as e:
+            self.logger.warning(f"Cannot read the ingestion epoch: {e!r}")
+            return None
+        digest = hashlib.sha256(
+            json.dumps(parts, default=str).encode("utf-8")
+        ).hexdigest()
+        return self._keys.generate(epoch, digest)
+
+    async def get(self, key: str) -> Optional[Response]:
+        entry = self._memory.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._memory.move_to_end(key)
+            RETRIEVAL_CACHE_LOOKUPS_TOTAL.labels(tier="memory", result="hit").inc()
+            return entry[1]
+        if entry is not None:
+            del self._memory[key]
+        RETRIEVAL_CACHE_LOOKUPS_TOTAL.labels(tier="memory", result="miss").inc()
+        if self._redis is None:
+            return None
+
+        try:
+            payload = await self._redis.get(key)
+        except Exception as e:
+            self.logger.warning(f"Redis cache lookup failed: {e!r}")
+            RETRIEVAL_CACHE_LOOKUPS_TOTAL.labels(tier="redis", result="error").inc()
+            return None
+        if payload is None:
+            RETRIEVAL_CACHE_LOOKUPS_TOTAL.labels(tier="redis", result="miss").inc()
+            return None
+        RETRIEVAL_CACHE_LOOKUPS_TOTAL.labels(tier="redis", result="hit").inc()
+        docs = json.loads(payload)
+        self._remember(key, docs)
+        return docs
+
+    async def put(self, key: str, docs: Response) -> None:
+        self._remember(key, docs)
+        if self._redis is None:
+            return
+        try:
+            await self._redis.set(
+                key,
+                json.dumps(docs, default=float),
+                ex=max(1, int(self.settings.ttl_seconds)),
+            )
+        except Exception as e:
+            self.logger.warning(f"Redis cache write failed: {e!r}")
+
+    def _remember(self, key: str, docs: Response) -> None:
+        if self.settings.max_entries == 0:
+            return
+        self._memory[key] = (time.monotonic() + self.settings.ttl_seconds, docs)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.settings.max_entries:
+            self._memory.popitem(last=False)
@@ -0,0 +1,105 @@
+# src/graph/retrieval/epoch.py
+
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional, Protocol, runtime_checkable
+
+from graph.infra.config.schemas.retrieval import ResponseCacheSettings
+
+EPOCH_KEY = "graph:ingestion_epoch"
+
+
+def create_redis_client(url: str) -> Any:
+    """An asyncio client for a Redis-protocol server (the 'cache' extra)."""
+    try:
+        import redis.asyncio as redis
+    except ImportError as e:
+        raise ImportError(
+            "The Redis cache tier requires the redis package (the 'cache' extra)."
+        ) from e
+    return redis.from_url(url)
+
+
+@runtime_checkable
+class IngestionEpochProtocol(Protocol):
+    """
+    A counter that ingestion bumps whenever it has written to the stores.
+    Cached responses are keyed by the epoch they were computed in, so a bump
+    invalidates all of them at once.
+    """
+
+    async def current(self) -> int:
+        """The epoch, as last read within the refresh interval."""
+        ...
+
+    async def bump(self) -> int:
+        """Starts a new epoch and returns it."""
+        ...
+
+
+class FileIngestionEpoch:
+    """
+    Keeps the epoch in a small file, for a node whose ingestion jobs and API
+    processes share a disk.
+    """
+
+    def __init__(self, path: str, refresh_seconds: float = 1.0):
+        self._path = Path(path)
+        self._refresh_seconds = refresh_seconds
+        self._value: Optional[int] = None
+        self._read_at = 0.0
+
+    async def current(self) -> int:
+        now = time.monotonic()
+        if self._value is None or now - self._read_at >= self._refresh_seconds:
+            self._value, self._read_at = self._read(), now
+        return self._value
+
+    async def bump(self) -> int:
+        # Concurrent bumps may both write the same value; either way the
+        # epoch differs from the one the cached responses were stored under.
+        value = self._read() + 1
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self._path.with_name(f"{self._path.name}.{os.getpid()}.tmp")
+        temporary.write_text(str(value))
+        os.replace(temporary, self._path)
+        self._value, self._read_at = value, time.monotonic()
+        return value
+
+    def _read(self) -> int:
+        try:
+            return int(self._path.read_text() or 0)
+        except FileNotFoundError:
+            return 0
+
+
+class RedisIngestionEpoch:
+    """Keeps the epoch on the Redis-protocol server shared by the cache."""
+
+    def __init__(self, client: Any, refresh_seconds: float = 1.0):
+        self._client = client
+        self._refresh_seconds = refresh_seconds
+        self._value: Optional[int] = None
+        self._read_at = 0.0
+
+    async def current(self) -> int:
+        now = time.monotonic()
+        if self._value is None or now - self._read_at >= self._refresh_seconds:
+            value = await self._client.get(EPOCH_KEY)
+            self._value, self._read_at = int(value or 0), now
+        return self._value
+
+    async def bump(self) -> int:
+        self._value = int(await self._client.incr(EPOCH_KEY))
+        self._read_at = time.monotonic()
+        return self._value
+
+
+def create_ingestion_epoch(
+    settings: ResponseCacheSettings, redis: Optional[Any] = None
+) -> IngestionEpochProtocol:
+    """The Redis epoch when a Redis client is given, the file epoch otherwise."""
+    if redis is not None:
+        return RedisIngestionEpoch(redis, settings.epoch_refresh_seconds)
+    return FileIngestionEpoch(settings.epoch_path, settings.epoch_refresh_seconds)
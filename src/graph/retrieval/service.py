@@ -1,14 +1,27 @@
 # src/graph/retrieval/service.py
 
-from typing import Any, Dict, List, Set
+import asyncio
+from typing import Any, Awaitable, Dict, List, Optional, Set, TypeVar
 
+import numpy as np
 from loguru import logger
-from sentence_transformers import SentenceTransformer
 
+from graph.embedding import EmbeddingService
+from graph.infra.config import get_settings
+from graph.infra.context.context_vars import get_tenant_id
+from graph.infra.context.deadline import DeadlineExceeded, run_within_deadline
 from graph.infra.observability import with_observability
+from graph.infra.observability.metrics.usage.retrieval_metrics import \
+    RETRIEVAL_DEADLINE_EXCEEDED_TOTAL
 from graph.infra.store.graph.protocol import GraphStoreProtocol
+from graph.infra.store.ids import parent_id
 from graph.infra.store.vector.protocol import VectorStoreProtocol
 
+from .cache import ResponseCache
+from .single_flight import SingleFlight
+
+T = TypeVar("T")
+
 
 class RetrievalService:
     """
@@ -25,26 +38,108 @@ class RetrievalService:
         graph_hops: int = 2,
         graph_limit: int = 30,
         rerank_boost: float = 0.2,
+        search_ef: Optional[int] = None,
+        chunk_oversample: int = 1,
+        embedding_service: Optional[EmbeddingService] = None,
+        response_cache: Optional[ResponseCache] = None,
     ):
         self.logger = logger.bind(service="retrieval_service")
         self._vector_store = vector_store
         self._graph_store = graph_store
-        self.embedding_model = SentenceTransformer(embedding_model_name)
+        # The application injects its shared, started embedding service.
+        # Standalone, the service owns one and starts it on the first query.
+        self._owns_embedding = embedding_service is None
+        self._embedding = embedding_service or EmbeddingService(
+            get_settings().embedding.model_copy(
+                update={"model_name": embedding_model_name}
+            ),
+            workers=False,
+        )
+        self._embedding_start = asyncio.Lock()
 
         self._top_k = top_k
         self._graph_hops = graph_hops
         self._graph_limit = graph_limit
         self._rerank_boost = rerank_boost
+        self._search_ef = search_ef
+        # With chunked documents several hits may share a document, so more
+        # hits are fetched to still return `top_k` distinct documents.
+        self._chunk_oversample = chunk_oversample
+        self._flights = SingleFlight()
+        self._cache = response_cache
+        # Cached responses are only valid for the parameters they came from.
+        self._params = (
+            top_k,
+            graph_hops,
+            graph_limit,
+            rerank_boost,
+            chunk_oversample,
+        )
 
     @with_observability(name="retrieval.hybrid_query")
-    async def query(self, query_text: str) -> List[Dict[str, Any]]:
+    async def query(
+        self, query_text: str, ef: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Runs the hybrid retrieval pipeline. `ef` overrides the vector index
+        search breadth for this request, trading latency for recall.
+
+        Stages honor the request deadline (`timeout_deadline`). When graph
+        expansion cannot finish in time, documents are ranked by their dense
+        score alone and flagged `degraded`; when an earlier stage cannot,
+        `DeadlineExceeded` is raised. A coalesced query waits for the shared
+        run only until its own deadline, and runs again when the shared run
+        was cut short by an earlier deadline than its own.
+        """
         self.logger.info(f"Received query: '{query_text}'")
-
-        query_vector = self.embedding_model.encode(query_text).tolist()
-
-        vector_docs = await self._vector_store.vector_search(
-            query_vec=query_vector, top_k=self._top_k
+        params = (" ".join(query_text.split()), ef or self._search_ef)
+        cache_key = None
+        if self._cache is not None:
+            cache_key = await self._cache.key(*params, *self._params)
+
+        if cache_key is None:
+            # Identical concurrent queries of a tenant share one pipeline run.
+            docs = await self._flights.do(
+                (get_tenant_id(), *params), lambda: self._retrieve(query_text, ef)
+            )
+        else:
+            docs = await self._cache.get(cache_key)
+            if docs is None:
+                # The key already holds the tenant, so it also keys the run.
+                docs = await self._flights.do(
+                    cache_key,
+                    lambda: self._retrieve_and_cache(query_text, ef, cache_key),
+                )
+        # Callers sharing a result get the same documents; each gets copies.
+        return [dict(doc) for doc in docs]
+
+    async def _retrieve_and_cache(
+        self, query_text: str, ef: Optional[int], cache_key: str
+    ) -> List[Dict[str, Any]]:
+        docs = await self._retrieve(query_text, ef)
+        # Degraded results only stand in for the real ones under time pressure.
+        if not any(doc.get("degraded") for doc in docs):
+            await self._cache.put(cache_key, docs)
+        return docs
+
+    async def _retrieve(
+        self, query_text: str, ef: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        # Every stage is bounded by the request deadline. Without a vector
+        # there is nothing to return; without the graph, dense scores are.
+        query_vector = (
+            await self._within_deadline(self._embed_query(query_text), "embed")
+        ).tolist()
+
+        vector_hits = await self._within_deadline(
+            self._vector_store.vector_search(
+                query_vec=query_vector,
+                top_k=self._top_k * self._chunk_oversample,
+                ef=ef or self._search_ef,
+            ),
+            "vector_search",
         )
+        vector_docs = self._merge_chunks(vector_hits)[: self._top_k]
         self.logger.info(f"Retrieved {len(vector_docs)} documents from vector store.")
 
         if not vector_docs:
@@ -60,11 +155,21 @@ class RetrievalService:
                 doc["final_score"] = doc.get("dense_score", 0.0)
             return sorted(vector_docs, key=lambda d: d["final_score"], reverse=True)
 
-        expanded_entities = await self._graph_store.expand_entities(
-            start_entities=list(seed_entities),
-            hops=self._graph_hops,
-            limit=self._graph_limit,
-        )
+        try:
+            expanded_entities = await self._within_deadline(
+                self._graph_store.expand_entities(
+                    start_entities=list(seed_entities),
+                    hops=self._graph_hops,
+                    limit=self._graph_limit,
+                ),
+                "graph_expansion",
+            )
+        except DeadlineExceeded:
+            self.logger.warning("Graph expansion ran out of time; dense-only results.")
+            for doc in vector_docs:
+                doc["final_score"] = doc.get("dense_score", 0.0)
+                doc["degraded"] = True
+            return sorted(vector_docs, key=lambda d: d["final_score"], reverse=True)
         self.logger.info(
             f"Expanded to {len(expanded_entities)} related entities from graph."
         )
@@ -74,6 +179,39 @@ class RetrievalService:
 
         return reranked_docs
 
+    async def _within_deadline(self, awaitable: Awaitable[T], stage: str) -> T:
+        try:
+            return await run_within_deadline(awaitable, stage)
+        except DeadlineExceeded:
+            RETRIEVAL_DEADLINE_EXCEEDED_TOTAL.labels(stage=stage).inc()
+            raise
+
+    async def _embed_query(self, query_text: str) -> np.ndarray:
+        if self._owns_embedding and not self._embedding.is_ready():
+            async with self._embedding_start:
+                await self._embedding.start()
+        return (await self._embedding.encode([query_text]))[0]
+
+    def _merge_chunks(self, hits: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Maps chunk hits back to their documents, keeping the best-scoring
+        chunk of each as the document's passage and score.
+        """
+        best: Dict[str, Dict[str, Any]] = {}
+        for hit in hits:
+            doc_id = parent_id(hit["doc_id"])
+            current = best.get(doc_id)
+            if current is None or hit.get("dense_score", 0.0) > current.get(
+                "dense_score", 0.0
+            ):
+                merged = {**hit, "doc_id": doc_id}
+                if doc_id != hit["doc_id"]:
+                    merged["chunk_id"] = hit["doc_id"]
+                best[doc_id] = merged
+        return sorted(
+            best.values(), key=lambda d: d.get("dense_score", 0.0), reverse=True
+        )
+
     def _extract_entities_from_docs(self, docs: List[Dict[str, Any]]) -> Set[str]:
         entity_set = set()
         for doc in docs:
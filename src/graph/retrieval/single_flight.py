@@ -0,0 +1,116 @@
+# src/graph/retrieval/single_flight.py
+
+import asyncio
+import contextvars
+from typing import Any, Callable, Coroutine, Dict, Hashable, Optional
+
+from graph.infra.context.context_vars import (get_timeout_deadline,
+                                              is_timeout_cancelled,
+                                              set_timeout_cancelled)
+from graph.infra.context.deadline import DeadlineExceeded, run_within_deadline
+from graph.infra.observability.metrics.usage.retrieval_metrics import (
+    RETRIEVAL_DEADLINE_EXCEEDED_TOTAL, RETRIEVAL_SINGLE_FLIGHT_TOTAL)
+
+
+class _Flight:
+    def __init__(
+        self,
+        task: asyncio.Task,
+        deadline: Optional[float],
+        context: contextvars.Context,
+    ):
+        self.task = task
+        self.deadline = deadline
+        self.context = context
+        self.waiters = 0
+
+    def cut_short_for(self, deadline: Optional[float]) -> bool:
+        """
+        Whether a stage of the run gave up at the run's deadline while a
+        caller with `deadline` would still have had time.
+        """
+        return (
+            _later(deadline, self.deadline)
+            and self.task.done()
+            and self.context.run(is_timeout_cancelled)
+        )
+
+
+def _later(deadline: Optional[float], other: Optional[float]) -> bool:
+    """Whether `deadline` ends after `other`; None never ends."""
+    if other is None:
+        return False
+    return deadline is None or deadline > other
+
+
+class SingleFlight:
+    """
+    Runs one computation per key at a time; callers that arrive while it is
+    in flight await its result instead of starting their own.
+
+    The computation runs in its own task, so a caller that is cancelled,
+    including the one that started it, leaves it running for the others.
+    It is cancelled only once no caller is waiting for it any more.
+
+    The task runs under the request deadline of the caller that started it.
+    A caller with an earlier deadline stops waiting when its own deadline
+    expires. A caller with a later one runs the computation again, with its
+    own time, when the shared run was cut short by the earlier deadline.
+    """
+
+    def __init__(self) -> None:
+        self._flights: Dict[Hashable, _Flight] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    async def do(
+        self, key: Hashable, compute: Callable[[], Coroutine[Any, Any, Any]]
+    ) -> Any:
+        deadline = get_timeout_deadline()
+        flight = self._flights.get(key)
+        if flight is None:
+            # The run reports expired stages in its own context.
+            context = contextvars.copy_context()
+            context.run(set_timeout_cancelled, False)
+            task = asyncio.get_running_loop().create_task(compute(), context=context)
+            flight = _Flight(task, deadline, context)
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._land(key, flight))
+            RETRIEVAL_SINGLE_FLIGHT_TOTAL.labels(role="leader").inc()
+        else:
+            RETRIEVAL_SINGLE_FLIGHT_TOTAL.labels(role="coalesced").inc()
+
+        flight.waiters += 1
+        try:
+            try:
+                if _later(flight.deadline, deadline):
+                    result = await run_within_deadline(
+                        asyncio.shield(flight.task), "coalesced_wait"
+                    )
+                else:
+                    result = await asyncio.shield(flight.task)
+            except DeadlineExceeded as e:
+                if not flight.cut_short_for(deadline):
+                    if e.stage == "coalesced_wait":
+                        RETRIEVAL_DEADLINE_EXCEEDED_TOTAL.labels(stage=e.stage).inc()
+                    raise
+            else:
+                if not flight.cut_short_for(deadline):
+                    return result
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Every caller gave up; stop the backend calls as well.
+                flight.task.cancel()
+                self._land(key, flight)
+
+        # The run gave up at a deadline this caller is not bound by.
+        self._land(key, flight)
+        return await self.do(key, compute)
+
+    def _land(self, key: Hashable, flight: _Flight) -> None:
+        # A later flight may already run under the same key.
+        if self._flights.get(key) is flight:
+            del self._flights[key]
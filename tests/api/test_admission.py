@@ -0,0 +1,128 @@
+# tests/api/test_admission.py
+
+import asyncio
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from graph.api.admission import (AdmissionController, AdmissionMiddleware,
+                                 AdmissionRejected)
+from graph.infra.config.schemas.api import AdmissionSettings
+from graph.infra.context import context_var_manager
+from graph.infra.context.context_vars import set_tenant_id
+
+
+@pytest.mark.asyncio
+async def test_waiting_requests_get_freed_slots_by_priority():
+    controller = AdmissionController(1, max_queue=4, max_queue_seconds=1.0)
+    await controller.acquire()
+    order = []
+
+    async def wait(name, priority):
+        await controller.acquire(priority)
+        order.append(name)
+
+    waiters = [
+        asyncio.create_task(wait(name, priority))
+        for name, priority in (("low", 0), ("high", 5), ("low-2", 0))
+    ]
+    await asyncio.sleep(0)
+    assert controller.queued == 3
+
+    for _ in waiters:
+        controller.release()
+    await asyncio.gather(*waiters)
+
+    assert order == ["high", "low", "low-2"]
+    assert controller.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_a_full_queue_rejects_or_displaces_lower_priorities():
+    controller = AdmissionController(1, max_queue=1, max_queue_seconds=1.0)
+    await controller.acquire()
+    queued = asyncio.create_task(controller.acquire(0))
+    await asyncio.sleep(0)
+
+    with pytest.raises(AdmissionRejected, match="queue_full"):
+        await controller.acquire(0)
+    urgent = asyncio.create_task(controller.acquire(1))
+    await asyncio.sleep(0)
+
+    with pytest.raises(AdmissionRejected, match="displaced"):
+        await queued
+    controller.release()
+    await urgent
+    assert controller.in_flight == 1 and controller.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_requests_are_rejected_after_the_longest_queue_time():
+    controller = AdmissionController(1, max_queue=1, max_queue_seconds=0.01)
+    await controller.acquire()
+
+    with pytest.raises(AdmissionRejected, match="timeout"):
+        await controller.acquire()
+    controller.release()
+
+    assert controller.in_flight == 0 and controller.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_overload_is_answered_with_503_and_retry_after():
+    release = asyncio.Event()
+
+    async def query(request):
+        await release.wait()
+        return JSONResponse({"ok": True})
+
+    async def health(request):
+        return JSONResponse({"ok": True})
+
+    app = AdmissionMiddleware(
+        Starlette(routes=[Route("/query", query), Route("/health", health)]),
+        settings=AdmissionSettings(
+            max_concurrency=1, max_queue=0, retry_after_seconds=2
+        ),
+    )
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        running = asyncio.create_task(client.get("/query"))
+        while app.controller.in_flight == 0:
+            await asyncio.sleep(0)
+
+        shed = await client.get("/query")
+        uncontrolled = await client.get("/health")
+        release.set()
+        admitted = await running
+
+    assert shed.status_code == 503
+    assert shed.headers["Retry-After"] == "2"
+    assert uncontrolled.status_code == 200
+    assert admitted.status_code == 200
+    assert app.controller.in_flight == 0
+
+
+def test_tenant_and_route_priorities_take_the_highest_match():
+    middleware = AdmissionMiddleware(
+        None,
+        settings=AdmissionSettings(
+            route_priorities={"/query": 1, "/query/bulk": -1},
+            tenant_priorities={"gold": 5},
+        ),
+    )
+
+    def priority(path, tenant=None):
+        token = set_tenant_id(tenant)
+        try:
+            return middleware._priority({"type": "http", "path": path})
+        finally:
+            context_var_manager.reset("tenant_id", token)
+
+    assert priority("/query") == 1
+    assert priority("/query/bulk") == -1
+    assert priority("/query/bulk", "gold") == 5
+    assert priority("/other") == 0
@@ -0,0 +1,52 @@
+# tests/api/test_deadline.py
+
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from graph.api.deadline import DeadlineMiddleware
+from graph.infra.config.schemas.api import ApiSettings
+from graph.infra.context import remaining_seconds
+from graph.infra.context.context_vars import get_timeout_deadline
+
+
+async def budget(request):
+    return JSONResponse({"remaining": remaining_seconds()})
+
+
+def _client(**settings):
+    app = Starlette(routes=[Route("/query", budget)])
+    app.add_middleware(DeadlineMiddleware, settings=ApiSettings(**settings))
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    )
+
+
+@pytest.mark.asyncio
+async def test_requests_get_the_configured_budget():
+    async with _client(deadline_seconds=2.0) as client:
+        remaining = (await client.get("/query")).json()["remaining"]
+
+    assert 1.5 < remaining <= 2.0
+    assert get_timeout_deadline() is None
+
+
+@pytest.mark.asyncio
+async def test_the_header_can_only_shorten_the_budget():
+    async with _client(deadline_seconds=2.0) as client:
+        shorter = await client.get("/query", headers={"X-Request-Timeout": "0.5"})
+        longer = await client.get("/query", headers={"X-Request-Timeout": "60"})
+        invalid = await client.get("/query", headers={"X-Request-Timeout": "soon"})
+
+    assert shorter.json()["remaining"] <= 0.5
+    assert 1.5 < longer.json()["remaining"] <= 2.0
+    assert 1.5 < invalid.json()["remaining"] <= 2.0
+
+
+@pytest.mark.asyncio
+async def test_requests_without_a_budget_have_no_deadline():
+    async with _client(deadline_seconds=None) as client:
+        assert (await client.get("/query")).json()["remaining"] is None
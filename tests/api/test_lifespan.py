@@ -0,0 +1,70 @@
+# tests/api/test_lifespan.py
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+
+import graph.api.lifespan as lifespan_module
+
+
+class _FakeService:
+    def __init__(self, name, events, dependency=None):
+        self.name = name
+        self.events = events
+        self.dependency = dependency
+        self.ready = False
+
+    async def start(self):
+        # Stores check that the model was loaded and warmed before them.
+        if self.dependency is not None:
+            assert self.dependency.ready
+        await asyncio.sleep(0)
+        self.ready = True
+        self.events.append(f"{self.name} started")
+
+    async def stop(self):
+        self.events.append(f"{self.name} stopped")
+
+    def is_ready(self):
+        return self.ready
+
+
+@pytest.fixture
+def events(monkeypatch):
+    events = []
+    embedding = _FakeService("embedding", events)
+    monkeypatch.setattr(asyncio, "set_event_loop_policy", lambda policy: None)
+    monkeypatch.setattr(lifespan_module, "setup_tracing", lambda: None)
+    monkeypatch.setattr(
+        lifespan_module, "EmbeddingService", lambda *args, **kwargs: embedding
+    )
+    monkeypatch.setattr(
+        lifespan_module,
+        "Neo4jStoreProvider",
+        lambda settings: _FakeService("neo4j", events, embedding),
+    )
+    monkeypatch.setattr(
+        lifespan_module,
+        "WeaviateStore",
+        lambda settings: _FakeService("weaviate", events, embedding),
+    )
+    monkeypatch.setattr(
+        lifespan_module.ResponseCache,
+        "from_settings",
+        classmethod(lambda cls, settings: _FakeService("cache", events, embedding)),
+    )
+    return events
+
+
+@pytest.mark.asyncio
+async def test_the_embedding_model_is_ready_before_the_app_serves(events):
+    app = FastAPI()
+
+    async with lifespan_module.lifespan(app):
+        assert app.state.embedding_service.is_ready()
+        started = list(events)
+
+    assert started[0] == "embedding started"
+    assert all(event.endswith("started") for event in started)
+    assert events[-1] == "embedding stopped"
@@ -0,0 +1,94 @@
+# tests/api/test_tenant.py
+
+from unittest.mock import AsyncMock
+
+import httpx
+import numpy as np
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from graph.api.tenant import TenantMiddleware
+from graph.infra.config.schemas.api import ApiSettings
+from graph.infra.config.schemas.retrieval import ResponseCacheSettings
+from graph.infra.context.context_vars import get_tenant_id
+from src.graph.retrieval.cache import ResponseCache
+from src.graph.retrieval.service import RetrievalService
+
+HITS = [{"doc_id": "doc1", "text": "About apples.", "dense_score": 0.9}]
+
+
+def _client(service, trusted_proxies=("127.0.0.1",)):
+    async def query(request):
+        documents = await service.query(request.query_params["q"])
+        return JSONResponse({"tenant": get_tenant_id(), "documents": documents})
+
+    app = Starlette(routes=[Route("/query", query)])
+    settings = ApiSettings(tenant_trusted_proxies=list(trusted_proxies))
+    app.add_middleware(TenantMiddleware, settings=settings)
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    )
+
+
+@pytest.fixture
+def vector_store():
+    store = AsyncMock()
+    store.vector_search.side_effect = lambda **kwargs: [dict(hit) for hit in HITS]
+    return store
+
+
+@pytest.fixture
+def service(vector_store, tmp_path):
+    embedding_service = AsyncMock()
+    embedding_service.encode.return_value = np.array([[0.1, 0.2, 0.3]])
+    cache = ResponseCache(
+        ResponseCacheSettings(
+            epoch_path=str(tmp_path / "epoch"), epoch_refresh_seconds=0
+        )
+    )
+    return RetrievalService(
+        vector_store=vector_store,
+        graph_store=AsyncMock(),
+        embedding_service=embedding_service,
+        response_cache=cache,
+    )
+
+
+@pytest.mark.asyncio
+async def test_tenants_with_the_same_query_do_not_share_a_cache_entry(
+    service, vector_store
+):
+    async with _client(service) as client:
+        for tenant in ("tenant-a", "tenant-b", "tenant-a"):
+            response = await client.get(
+                "/query", params={"q": "apples"}, headers={"X-Tenant-ID": tenant}
+            )
+            assert response.json()["tenant"] == tenant
+
+    assert vector_store.vector_search.await_count == 2
+    assert get_tenant_id() is None
+
+
+@pytest.mark.asyncio
+async def test_requests_without_the_header_keep_the_default_tenant(service):
+    async with _client(service) as client:
+        response = await client.get("/query", params={"q": "apples"})
+
+    assert response.json()["tenant"] is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("trusted_proxies", [[], ["10.0.0.0/8"]])
+async def test_the_header_is_ignored_unless_a_trusted_proxy_sent_it(
+    service, vector_store, trusted_proxies
+):
+    async with _client(service, trusted_proxies) as client:
+        for tenant in ("tenant-a", "tenant-b"):
+            response = await client.get(
+                "/query", params={"q": "apples"}, headers={"X-Tenant-ID": tenant}
+            )
+            assert response.json()["tenant"] is None
+
+    assert vector_store.vector_search.await_count == 1
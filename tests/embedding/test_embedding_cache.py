@@ -0,0 +1,91 @@
+# tests/embedding/test_embedding_cache.py
+
+import multiprocessing as mp
+
+import numpy as np
+
+from graph.embedding import EmbeddingCache
+
+
+def _vectors(texts):
+    return np.array([[len(t), t.count("a"), 1.0] for t in texts], dtype=np.float32)
+
+
+def test_round_trip_across_segments_and_reopen(tmp_path):
+    texts = [f"text {'a' * i}" for i in range(7)]
+    cache = EmbeddingCache(str(tmp_path), "model-a", segment_rows=3)
+    cache.put_many(texts[:5], _vectors(texts[:5]))
+    cache.put_many(texts[3:], _vectors(texts[3:]))
+
+    reopened = EmbeddingCache(str(tmp_path), "model-a", segment_rows=3)
+    vectors, missing = reopened.get_many(texts + ["unseen"])
+
+    assert len(reopened) == 7
+    assert missing == [7]
+    np.testing.assert_array_equal(vectors[:7], _vectors(texts))
+
+
+def test_keys_include_the_model_name(tmp_path):
+    EmbeddingCache(str(tmp_path), "model-a").put_many(["x"], _vectors(["x"]))
+
+    vectors, missing = EmbeddingCache(str(tmp_path), "model-b").get_many(["x"])
+
+    assert vectors is None
+    assert missing == [0]
+
+
+def test_backends_of_one_model_do_not_share_vectors(tmp_path):
+    EmbeddingCache(str(tmp_path), "model-a").put_many(["x"], _vectors(["x"]))
+
+    vectors, missing = EmbeddingCache(
+        str(tmp_path), "model-a", backend="onnx_int8"
+    ).get_many(["x"])
+
+    assert vectors is None
+    assert missing == [0]
+
+
+def test_torn_tail_is_discarded_on_reopen(tmp_path):
+    cache = EmbeddingCache(str(tmp_path), "model-a")
+    cache.put_many(["x", "y"], _vectors(["x", "y"]))
+    index = next(tmp_path.glob("*/index.bin"))
+    with open(index, "ab") as f:
+        f.write(b"\x01\x02\x03")
+
+    reopened = EmbeddingCache(str(tmp_path), "model-a")
+    reopened.put_many(["z"], _vectors(["z"]))
+    vectors, missing = EmbeddingCache(str(tmp_path), "model-a").get_many(["x", "z"])
+
+    assert missing == []
+    np.testing.assert_array_equal(vectors, _vectors(["x", "z"]))
+
+
+def _write_cache(path, prefix, rounds):
+    cache = EmbeddingCache(path, "model-a", segment_rows=16)
+    for i in range(rounds):
+        texts = [f"{prefix} {i} {'a' * j}" for j in range(3)]
+        cache.put_many(texts, _vectors(texts))
+
+
+def test_processes_sharing_a_cache_never_mix_up_rows(tmp_path):
+    context = mp.get_context("spawn")
+    writers = [
+        context.Process(target=_write_cache, args=(str(tmp_path), prefix, 40))
+        for prefix in ("left", "right-hand")
+    ]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join()
+
+    texts = [
+        f"{prefix} {i} {'a' * j}"
+        for prefix in ("left", "right-hand")
+        for i in range(40)
+        for j in range(3)
+    ]
+    vectors, missing = EmbeddingCache(str(tmp_path), "model-a").get_many(texts)
+
+    assert [w.exitcode for w in writers] == [0, 0]
+    assert missing == []
+    np.testing.assert_array_equal(vectors, _vectors(texts))
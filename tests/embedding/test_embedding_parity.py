@@ -0,0 +1,138 @@
+# tests/embedding/test_embedding_parity.py
+
+import numpy as np
+import pytest
+
+from graph.embedding import (LocalEmbeddingBackend, check_parity,
+                             compare_embeddings)
+from graph.infra.config.schemas.embedding.embedding_config import \
+    EmbeddingSettings
+
+
+def test_identical_embeddings_pass():
+    vectors = np.random.default_rng(0).normal(size=(20, 8))
+
+    report = compare_embeddings(vectors, vectors * 3.0, top_k=5)
+
+    assert report.passed
+    assert report.mean_cosine == pytest.approx(1.0)
+    assert report.recall_at_k == 1.0
+    assert report.top_k == 5
+
+
+def test_scrambled_embeddings_fail_on_recall():
+    rng = np.random.default_rng(0)
+    reference = rng.normal(size=(50, 8))
+    candidate = reference + rng.normal(scale=2.0, size=reference.shape)
+
+    report = compare_embeddings(candidate, reference, top_k=5)
+
+    assert not report.passed
+    assert report.recall_at_k < 0.95
+    assert report.min_cosine < report.mean_cosine
+
+
+def test_top_k_is_capped_by_the_sample():
+    vectors = np.eye(3)
+
+    report = compare_embeddings(vectors, vectors, top_k=10)
+
+    assert report.top_k == 2
+
+
+@pytest.fixture(scope="module")
+def tiny_model_path(tmp_path_factory):
+    """A small random BERT sentence encoder saved locally, no download needed."""
+    import torch
+    from sentence_transformers import SentenceTransformer
+    from sentence_transformers.models import Pooling, Transformer
+    from transformers import BertConfig, BertModel, BertTokenizerFast
+
+    root = tmp_path_factory.mktemp("tiny_model")
+    vocab = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"] + [
+        f"w{i}" for i in range(100)
+    ]
+    (root / "vocab.txt").write_text("\n".join(vocab))
+    torch.manual_seed(0)
+    config = BertConfig(
+        vocab_size=len(vocab),
+        hidden_size=32,
+        num_hidden_layers=2,
+        num_attention_heads=2,
+        intermediate_size=64,
+        max_position_embeddings=64,
+    )
+    BertModel(config).save_pretrained(root / "hf")
+    BertTokenizerFast(str(root / "vocab.txt")).save_pretrained(root / "hf")
+    transformer = Transformer(str(root / "hf"), max_seq_length=48)
+    model = SentenceTransformer(modules=[transformer, Pooling(32)], device="cpu")
+    model.save(str(root / "model"))
+    return str(root / "model")
+
+
+@pytest.mark.asyncio
+async def test_int8_backend_keeps_parity_with_the_reference(tiny_model_path):
+    settings = EmbeddingSettings(
+        model_name=tiny_model_path, length_buckets=[8, 16, 64], warmup=True
+    )
+    candidate = LocalEmbeddingBackend(
+        settings.model_copy(update={"backend": "torch_int8"})
+    )
+    reference = LocalEmbeddingBackend(settings)
+    await candidate.start()
+    await reference.start()
+    rng = np.random.default_rng(1)
+    texts = [
+        " ".join(f"w{i}" for i in rng.integers(0, 100, size=rng.integers(1, 40)))
+        for _ in range(40)
+    ]
+
+    report = await check_parity(
+        candidate,
+        reference,
+        texts,
+        settings.model_copy(update={"parity_min_recall": 0.8}),
+    )
+
+    # Sequence length capped the largest bucket.
+    assert candidate._buckets == [8, 16, 48]
+    assert report.texts == 40
+    assert report.mean_cosine > 0.99
+    assert report.passed
+    await candidate.stop()
+    await reference.stop()
+
+
+@pytest.mark.asyncio
+async def test_bucketed_forward_matches_encode_and_tokenizes_once(tiny_model_path):
+    backend = LocalEmbeddingBackend(
+        EmbeddingSettings(
+            model_name=tiny_model_path,
+            length_buckets=[8, 16, 64],
+            max_batch_tokens=64,
+            warmup=False,
+        )
+    )
+    await backend.start()
+    preprocess = backend.model.preprocess
+    calls = []
+
+    def counting_preprocess(texts, **kwargs):
+        calls.append(len(texts))
+        return preprocess(texts, **kwargs)
+
+    backend.model.preprocess = counting_preprocess
+    rng = np.random.default_rng(2)
+    texts = [
+        " ".join(f"w{i}" for i in rng.integers(0, 100, size=rng.integers(1, 40)))
+        for _ in range(30)
+    ]
+
+    vectors = await backend.encode(texts)
+
+    assert calls == [30]
+    del backend.model.preprocess
+    np.testing.assert_allclose(
+        vectors, backend.model.encode(texts, batch_size=4), atol=1e-5
+    )
+    await backend.stop()
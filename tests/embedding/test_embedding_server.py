@@ -0,0 +1,119 @@
+# tests/embedding/test_embedding_server.py
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from graph.embedding import (EmbeddingBackendError, EmbeddingServer,
+                             EmbeddingServerError, EmbeddingService,
+                             RemoteEmbeddingBackend, create_embedding_backend)
+from graph.embedding.wire import pack_encode_request, unpack_encode_request
+from graph.infra.config.schemas.embedding.embedding_config import \
+    EmbeddingSettings
+
+
+def _vectors(texts):
+    return np.array([[len(t), t.count("a"), 1.0] for t in texts], dtype=np.float32)
+
+
+def _settings(tmp_path, **overrides):
+    values = {"server_socket": str(tmp_path / "e.sock"), "batch_wait_ms": 0}
+    values.update(overrides)
+    return EmbeddingSettings(**values)
+
+
+async def _start_server(settings, backends):
+    def create(model_settings):
+        backend = AsyncMock()
+        backend.encode.side_effect = lambda texts: _vectors(texts)
+        backend.dimension = 3
+        backends[model_settings.model_name] = backend
+        return backend
+
+    service = EmbeddingService(
+        settings.model_copy(update={"server_socket": None}), backend_factory=create
+    )
+    server = EmbeddingServer(settings, embedding_service=service)
+    await server.start()
+    return server
+
+
+def test_encode_requests_round_trip():
+    texts = ["", "plain", "ação — 文字"]
+
+    assert unpack_encode_request(pack_encode_request("m", texts)) == ("m", texts)
+
+
+def test_settings_with_a_socket_select_the_remote_backend(tmp_path):
+    backend = create_embedding_backend(_settings(tmp_path))
+
+    assert isinstance(backend, RemoteEmbeddingBackend)
+
+
+@pytest.mark.asyncio
+async def test_clients_receive_vectors_in_request_order(tmp_path):
+    settings = _settings(tmp_path)
+    server = await _start_server(settings, {})
+    client = RemoteEmbeddingBackend(settings)
+    await client.start()
+
+    texts = ["a", "bbb", "banana"]
+    vectors = await client.encode(texts)
+
+    assert client.dimension == 3
+    assert vectors.dtype == np.float32
+    np.testing.assert_array_equal(vectors, _vectors(texts))
+    assert (await client.encode([])).shape == (0, 3)
+    assert (await client.health())["models"] == [settings.model_name]
+    await client.stop()
+    await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_requests_of_several_clients_share_a_model_call(tmp_path):
+    settings = _settings(tmp_path, batch_wait_ms=20)
+    backends = {}
+    server = await _start_server(settings, backends)
+    clients = [RemoteEmbeddingBackend(settings) for _ in range(3)]
+    for client in clients:
+        await client.start()
+
+    results = await asyncio.gather(
+        *(client.encode([f"text {i}"]) for i, client in enumerate(clients))
+    )
+
+    assert backends[settings.model_name].encode.await_count == 1
+    for i, vectors in enumerate(results):
+        np.testing.assert_array_equal(vectors, _vectors([f"text {i}"]))
+    for client in clients:
+        await client.stop()
+    await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_server_errors_reach_the_client_which_stays_usable(tmp_path):
+    settings = _settings(tmp_path)
+    backends = {}
+    server = await _start_server(settings, backends)
+    client = RemoteEmbeddingBackend(settings)
+    await client.start()
+    model = backends[settings.model_name]
+
+    model.encode.side_effect = EmbeddingBackendError("model failed")
+    with pytest.raises(EmbeddingServerError, match="model failed"):
+        await client.encode(["a"])
+    model.encode.side_effect = lambda texts: _vectors(texts)
+
+    np.testing.assert_array_equal(await client.encode(["b"]), _vectors(["b"]))
+    await client.stop()
+    await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_start_fails_when_no_server_answers(tmp_path):
+    client = RemoteEmbeddingBackend(_settings(tmp_path, server_timeout_seconds=0.3))
+
+    with pytest.raises(EmbeddingServerError):
+        await client.start()
@@ -0,0 +1,130 @@
+# tests/embedding/test_embedding_service.py
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from graph.embedding import (EmbeddingBackendError, EmbeddingCache,
+                             EmbeddingService)
+from graph.infra.config.schemas.embedding.embedding_config import \
+    EmbeddingSettings
+
+
+def _vectors(texts):
+    return np.array([[len(t), t.count("a"), 1.0] for t in texts], dtype=np.float32)
+
+
+def _factory(backends):
+    """Backend factory handing out one fake backend per loaded model."""
+
+    def create(settings):
+        backend = AsyncMock()
+        backend.encode.side_effect = lambda texts: _vectors(texts)
+        backends[settings.model_name] = backend
+        return backend
+
+    return create
+
+
+@pytest.mark.asyncio
+async def test_models_are_loaded_on_start_and_registered_by_name():
+    backends = {}
+    service = EmbeddingService(
+        EmbeddingSettings(model_name="model-a"), backend_factory=_factory(backends)
+    )
+    assert backends == {}
+
+    await service.start()
+    await service.encode(["x"], model_name="model-b")
+    await service.encode(["y"], model_name="model-b")
+
+    assert sorted(backends) == ["model-a", "model-b"]
+    assert backends["model-b"].encode.await_count == 2
+    await service.stop()
+
+
+@pytest.mark.asyncio
+async def test_encode_requires_a_started_service():
+    service = EmbeddingService(EmbeddingSettings(), backend_factory=_factory({}))
+
+    with pytest.raises(EmbeddingBackendError):
+        await service.encode(["text"])
+
+
+@pytest.mark.asyncio
+async def test_only_cache_misses_reach_the_model(tmp_path):
+    backends = {}
+    service = EmbeddingService(
+        EmbeddingSettings(model_name="model-a", memory_cache_size=0),
+        cache=EmbeddingCache(str(tmp_path), "model-a"),
+        backend_factory=_factory(backends),
+    )
+    await service.start()
+
+    await service.encode(["a", "b"])
+    vectors = await service.encode(["b", "c", "a"])
+
+    assert backends["model-a"].encode.await_args_list[-1].args == (["c"],)
+    np.testing.assert_array_equal(vectors, _vectors(["b", "c", "a"]))
+    await service.stop()
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_keeps_the_most_recent_texts():
+    backends = {}
+    service = EmbeddingService(
+        EmbeddingSettings(memory_cache_size=2, batch_wait_ms=0),
+        backend_factory=_factory(backends),
+    )
+    await service.start()
+    model = backends[service.model_name]
+
+    for texts in (["a"], ["b"], ["a"], ["c"], ["a", "b"]):
+        await service.encode(texts)
+
+    # "b" was evicted by "c"; "a" stayed because it was used again.
+    assert [call.args[0] for call in model.encode.await_args_list] == [
+        ["a"],
+        ["b"],
+        ["c"],
+        ["b"],
+    ]
+    await service.stop()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_small_requests_share_a_model_call():
+    backends = {}
+    service = EmbeddingService(
+        EmbeddingSettings(batch_wait_ms=20, max_batch_size=64),
+        backend_factory=_factory(backends),
+    )
+    await service.start()
+    texts = [f"query {i} " + "a" * i for i in range(5)]
+
+    results = await asyncio.gather(*(service.encode([text]) for text in texts))
+
+    model = backends[service.model_name]
+    assert model.encode.await_count == 1
+    for text, vectors in zip(texts, results):
+        np.testing.assert_array_equal(vectors, _vectors([text]))
+    await service.stop()
+
+
+@pytest.mark.asyncio
+async def test_a_failed_shared_call_fails_every_request():
+    backends = {}
+    service = EmbeddingService(
+        EmbeddingSettings(batch_wait_ms=20), backend_factory=_factory(backends)
+    )
+    await service.start()
+    backends[service.model_name].encode.side_effect = EmbeddingBackendError("down")
+
+    results = await asyncio.gather(
+        service.encode(["a"]), service.encode(["b"]), return_exceptions=True
+    )
+
+    assert all(isinstance(result, EmbeddingBackendError) for result in results)
+    await service.stop()
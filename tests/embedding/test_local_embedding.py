@@ -0,0 +1,114 @@
+# tests/embedding/test_local_embedding.py
+
+import numpy as np
+import pytest
+
+from graph.embedding import (EmbeddingBackendError, EmbeddingModelLoader,
+                             LocalEmbeddingBackend)
+from graph.embedding.bucketing import bucket_batches
+from graph.infra.config.schemas.embedding.embedding_config import \
+    EmbeddingSettings
+
+
+class _FakeModel:
+    """Deterministic model without a tokenizer that records its batches."""
+
+    max_seq_length = 100
+
+    def __init__(self):
+        self.batches = []
+
+    def get_sentence_embedding_dimension(self):
+        return 2
+
+    def encode(self, texts, batch_size=32, show_progress_bar=False):
+        self.batches.append(list(texts))
+        return np.array(
+            [[len(text.split()), sum(map(ord, text)) % 97] for text in texts],
+            dtype=np.float32,
+        )
+
+
+def test_bucket_batches_groups_by_length_within_token_budget():
+    lengths = [3, 40, 5, 200, 31, 33, 90]
+
+    batches = bucket_batches(
+        lengths, buckets=[32, 64, 128], max_batch_size=8, max_batch_tokens=64
+    )
+
+    # Bucket 32 holds 2 texts per batch, 64 one, and 128 (also for longer
+    # texts) one.
+    assert batches == [[0, 2], [4], [1], [5], [3], [6]]
+
+
+@pytest.mark.asyncio
+async def test_encode_buckets_texts_and_preserves_order():
+    model = _FakeModel()
+    backend = LocalEmbeddingBackend(
+        EmbeddingSettings(length_buckets=[4, 16, 400], warmup=False),
+        model_loader=lambda name: model,
+    )
+    await backend.start()
+    texts = ["a b", "a " * 10, "c", "d " * 300, "e f g"]
+
+    vectors = await backend.encode(texts)
+
+    np.testing.assert_array_equal(vectors, _FakeModel().encode(texts))
+    assert model.batches == [["a b", "c", "e f g"], ["a " * 10], ["d " * 300]]
+    # Buckets above the model's sequence length collapse onto it.
+    assert backend._buckets == [4, 16, 100]
+    await backend.stop()
+
+
+@pytest.mark.asyncio
+async def test_warmup_embeds_a_batch_per_bucket():
+    model = _FakeModel()
+    backend = LocalEmbeddingBackend(
+        EmbeddingSettings(length_buckets=[8, 32], max_batch_tokens=64),
+        model_loader=lambda name: model,
+    )
+
+    await backend.start()
+
+    assert [len(batch) for batch in model.batches] == [8, 2]
+    assert len(model.batches[1][0].split()) == 30
+    await backend.stop()
+
+
+@pytest.mark.asyncio
+async def test_encode_requires_a_started_backend():
+    backend = LocalEmbeddingBackend(
+        EmbeddingSettings(), model_loader=lambda name: _FakeModel()
+    )
+
+    with pytest.raises(EmbeddingBackendError):
+        await backend.encode(["text"])
+
+
+@pytest.mark.asyncio
+async def test_failed_model_load_is_an_embedding_error():
+    def fail(name):
+        raise OSError("missing model")
+
+    backend = LocalEmbeddingBackend(EmbeddingSettings(), model_loader=fail)
+
+    with pytest.raises(EmbeddingBackendError):
+        await backend.start()
+    assert not backend.is_ready()
+
+
+def test_onnx_loader_explains_the_missing_extra(monkeypatch):
+    import builtins
+
+    real_import = builtins.__import__
+
+    def no_optimum(name, *args, **kwargs):
+        if name.startswith("optimum"):
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", no_optimum)
+    loader = EmbeddingModelLoader(EmbeddingSettings(backend="onnx_int8"))
+
+    with pytest.raises(ImportError, match="onnx"):
+        loader("any-model")
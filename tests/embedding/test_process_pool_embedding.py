@@ -0,0 +1,69 @@
+# tests/embedding/test_process_pool_embedding.py
+
+import os
+
+import numpy as np
+import pytest
+
+from graph.embedding import EmbeddingBackendError, ProcessPoolEmbeddingBackend
+from graph.infra.config.schemas.embedding.embedding_config import \
+    EmbeddingSettings
+
+
+class _FakeModel:
+    """Deterministic stand-in that also reports which process embedded a text."""
+
+    def get_sentence_embedding_dimension(self):
+        return 3
+
+    def encode(self, texts, show_progress_bar=False):
+        return np.array(
+            [[len(text), sum(map(ord, text)) % 97, os.getpid()] for text in texts],
+            dtype=np.float32,
+        )
+
+
+def _load_fake_model(model_name):
+    # Must be module-level so spawned workers can unpickle it.
+    return _FakeModel()
+
+
+@pytest.fixture
+async def backend():
+    backend = ProcessPoolEmbeddingBackend(
+        EmbeddingSettings(workers=2, max_batch_size=4), model_loader=_load_fake_model
+    )
+    await backend.start()
+    yield backend
+    await backend.stop()
+
+
+@pytest.mark.asyncio
+async def test_encode_preserves_order_across_workers(backend):
+    texts = [f"text number {i}" * (i % 3 + 1) for i in range(10)]
+
+    vectors = await backend.encode(texts)
+
+    expected = _FakeModel().encode(texts)
+    assert vectors.shape == (10, 3)
+    assert vectors.dtype == np.float32
+    np.testing.assert_array_equal(vectors[:, :2], expected[:, :2])
+    # Vectors were produced in worker processes, not in the test process.
+    assert os.getpid() not in set(vectors[:, 2].astype(int))
+
+
+@pytest.mark.asyncio
+async def test_encode_empty_batch(backend):
+    vectors = await backend.encode([])
+
+    assert vectors.shape == (0, 3)
+
+
+@pytest.mark.asyncio
+async def test_encode_requires_started_backend():
+    backend = ProcessPoolEmbeddingBackend(
+        EmbeddingSettings(workers=1), model_loader=_load_fake_model
+    )
+
+    with pytest.raises(EmbeddingBackendError):
+        await backend.encode(["text"])
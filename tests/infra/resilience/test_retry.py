@@ -0,0 +1,146 @@
+# tests/infra/resilience/test_retry.py
+
+import pytest
+from neo4j.exceptions import ConstraintError, ServiceUnavailable
+
+from graph.infra.config.schemas.resilience import (RetryPolicySettings,
+                                                   RetrySettings)
+from graph.infra.resilience import Retrier, RetryPolicy, resolve_exceptions
+from graph.infra.store.graph.exceptions import GraphDataError
+
+
+def _policy(attempts=3, exceptions=(ConnectionError,), waits=None, rng=None):
+    async def sleep(seconds):
+        waits.append(seconds)
+
+    return RetryPolicy(
+        attempts=attempts,
+        wait_min=0.5,
+        wait_max=5.0,
+        backoff=2.0,
+        exceptions=exceptions,
+        rng=rng or (lambda: 1.0),
+        sleep=sleep,
+    )
+
+
+def _flaky(failures, error=ConnectionError):
+    calls = []
+
+    async def call():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise error("transient")
+        return "ok"
+
+    return call, calls
+
+
+@pytest.mark.asyncio
+async def test_transient_failures_are_retried_with_growing_waits():
+    waits = []
+    call, calls = _flaky(failures=2)
+
+    assert await _policy(waits=waits).call("op", call) == "ok"
+    assert len(calls) == 3
+    assert waits == [0.5, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_last_failure_is_raised_after_all_attempts():
+    waits = []
+    call, calls = _flaky(failures=5)
+
+    with pytest.raises(ConnectionError):
+        await _policy(waits=waits).call("op", call)
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_unlisted_exceptions_are_not_retried():
+    call, calls = _flaky(failures=1, error=ValueError)
+
+    with pytest.raises(ValueError):
+        await _policy(waits=[]).call("op", call)
+    assert len(calls) == 1
+
+
+def test_waits_are_jittered_between_the_floor_and_the_capped_ceiling():
+    policy = _policy(waits=[], rng=lambda: 0.5)
+
+    assert policy.wait(0) == 0.5
+    assert policy.wait(2) == pytest.approx(0.5 + (2.0 - 0.5) * 0.5)
+    # 0.5 * 2**10 is capped at wait_max.
+    assert policy.wait(10) == pytest.approx(0.5 + (5.0 - 0.5) * 0.5)
+
+
+def test_exception_names_resolve_to_classes():
+    assert resolve_exceptions(["TimeoutError", "asyncio.CancelledError"]) == (
+        TimeoutError,
+        __import__("asyncio").CancelledError,
+    )
+    with pytest.raises(ValueError):
+        resolve_exceptions(["NotAnException"])
+
+
+@pytest.mark.asyncio
+async def test_retrier_uses_operation_policies_and_can_be_disabled():
+    settings = RetrySettings(
+        policies={"graph.write": RetryPolicySettings(attempts=1)},
+        default_policy=RetryPolicySettings(wait_min_seconds=0, wait_max_seconds=0),
+    )
+    retrier = Retrier(settings)
+
+    call, calls = _flaky(failures=1)
+    assert await retrier.call("vector.write", call) == "ok"
+    assert len(calls) == 2
+
+    call, calls = _flaky(failures=1)
+    with pytest.raises(ConnectionError):
+        await retrier.call("graph.write", call)
+
+    call, calls = _flaky(failures=1)
+    with pytest.raises(ConnectionError):
+        await Retrier(RetrySettings(enabled=False)).call("vector.write", call)
+    assert len(calls) == 1
+
+
+def _wrapped(error):
+    """Raises a store error from `error`, as the store providers do."""
+
+    def raise_wrapped(message):
+        try:
+            raise error(message)
+        except Exception as e:
+            raise GraphDataError("Failed to upsert.") from e
+
+    return raise_wrapped
+
+
+@pytest.mark.asyncio
+async def test_default_policy_only_retries_transient_failures():
+    retrier = Retrier(
+        RetrySettings(
+            default_policy=RetryPolicySettings(wait_min_seconds=0, wait_max_seconds=0)
+        )
+    )
+
+    call, calls = _flaky(failures=1, error=_wrapped(ServiceUnavailable))
+    assert await retrier.call("graph.write", call) == "ok"
+    assert len(calls) == 2
+
+    call, calls = _flaky(failures=1, error=_wrapped(ConstraintError))
+    with pytest.raises(GraphDataError):
+        await retrier.call("graph.write", call)
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_retrying_every_error_is_opt_in():
+    policy = RetryPolicySettings(
+        wait_min_seconds=0, wait_max_seconds=0, exceptions=["Exception"]
+    )
+    call, calls = _flaky(failures=1, error=ValueError)
+
+    assert await Retrier(RetrySettings(default_policy=policy)).call("op", call) == "ok"
+    assert len(calls) == 2
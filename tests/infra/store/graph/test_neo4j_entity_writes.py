@@ -0,0 +1,62 @@
+# tests/infra/store/graph/test_neo4j_entity_writes.py
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from neo4j.exceptions import ConstraintError
+
+from graph.infra.config.schemas.store.store_config import GraphSettings
+from graph.infra.store.graph.exceptions import GraphDataError
+from graph.infra.store.graph.providers import Neo4jStoreProvider
+
+
+def _provider(mode="merge", written=0):
+    provider = Neo4jStoreProvider(
+        GraphSettings(uri="bolt://x", user="u", password="p", entity_write_mode=mode)
+    )
+    result = AsyncMock()
+    result.single.return_value = {"written": written}
+    session = AsyncMock()
+    session.run.return_value = result
+    provider.driver = MagicMock()
+    provider.driver.session.return_value.__aenter__.return_value = session
+    return provider, session
+
+
+@pytest.mark.asyncio
+async def test_duplicate_ids_in_a_batch_are_written_once_with_the_last_row():
+    provider, session = _provider(written=2)
+
+    await provider._upsert_entities_impl(
+        [
+            {"id": "a", "name": "Old"},
+            {"id": "b", "name": "B", "label": "Ignored"},
+            {"id": "a", "name": "New"},
+        ]
+    )
+
+    query = session.run.await_args.args[0]
+    assert "MERGE" in query and "WHERE NOT coalesce(e.name = row.name" in query
+    assert session.run.await_args.kwargs["rows"] == [
+        {"id": "a", "name": "New"},
+        {"id": "b", "name": "B"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_create_only_mode_creates_without_merging():
+    provider, session = _provider(mode="create")
+
+    await provider._upsert_entities_impl([{"id": "a", "name": "A"}])
+
+    query = session.run.await_args.args[0]
+    assert "CREATE (:Entity" in query and "MERGE" not in query
+
+
+@pytest.mark.asyncio
+async def test_create_only_mode_reports_existing_ids():
+    provider, session = _provider(mode="create")
+    session.run.return_value.consume.side_effect = ConstraintError("exists")
+
+    with pytest.raises(GraphDataError, match="merge"):
+        await provider._upsert_entities_impl([{"id": "a", "name": "A"}])
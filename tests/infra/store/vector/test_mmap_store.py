@@ -0,0 +1,170 @@
+# tests/infra/store/vector/test_mmap_store.py
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from graph.infra.config.schemas.store.store_config import MmapVectorSettings
+from graph.infra.store.vector.providers.mmap_store import MmapVectorStore
+
+
+@pytest.fixture
+def settings(tmp_path):
+    """Small blocks so that a search spans several blocks and segments."""
+    return MmapVectorSettings(
+        path=str(tmp_path / "vectors"), dimension=4, block_size=2, search_threads=2
+    )
+
+
+@pytest.fixture
+async def mmap_store(settings):
+    store = MmapVectorStore(settings)
+    await store.start()
+    await store.ensure_schema()
+    yield store
+    await store.stop()
+
+
+def _docs(*ids):
+    return [{"id": i, "text": f"text of {i}", "entities": [i.upper()]} for i in ids]
+
+
+@pytest.mark.asyncio
+async def test_exact_search_across_segments_and_blocks(mmap_store):
+    await mmap_store.upsert_documents(
+        docs=_docs("a", "b", "c"),
+        vectors=[[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0]],
+    )
+    await mmap_store.upsert_documents(
+        docs=_docs("d", "e"), vectors=[[0.9, 0.1, 0, 0], [0, 0, 0, 1]]
+    )
+
+    hits = await mmap_store.vector_search(query_vec=[1, 0, 0, 0], top_k=2)
+
+    assert [h["doc_id"] for h in hits] == ["a", "d"]
+    assert hits[0]["dense_score"] == pytest.approx(1.0, abs=1e-3)
+    assert hits[0]["text"] == "text of a"
+    assert hits[0]["entities"] == ["A"]
+
+
+@pytest.mark.asyncio
+async def test_reupsert_supersedes_previous_row(mmap_store):
+    await mmap_store.upsert_documents(
+        docs=_docs("a", "b"), vectors=[[1, 0, 0, 0], [0, 1, 0, 0]]
+    )
+    await mmap_store.upsert_documents(docs=_docs("a"), vectors=[[0, 0, 1, 0]])
+
+    hits = await mmap_store.vector_search(query_vec=[1, 0, 0, 0], top_k=5)
+
+    assert sorted(h["doc_id"] for h in hits) == ["a", "b"]
+    a_hit = next(h for h in hits if h["doc_id"] == "a")
+    assert a_hit["dense_score"] == pytest.approx(0.0, abs=1e-3)
+
+
+@pytest.mark.asyncio
+async def test_segments_survive_reopen(mmap_store, settings):
+    vectors = np.eye(4, dtype=np.float32)
+    await mmap_store.upsert_documents(docs=_docs("a", "b", "c", "d"), vectors=vectors)
+    await mmap_store.stop()
+
+    reopened = MmapVectorStore(settings)
+    await reopened.start()
+    try:
+        hits = await reopened.vector_search(query_vec=[0, 0, 0, 1], top_k=1)
+    finally:
+        await reopened.stop()
+
+    assert [h["doc_id"] for h in hits] == ["d"]
+
+
+@pytest.mark.asyncio
+async def test_deletes_survive_reopen(mmap_store, settings):
+    await mmap_store.upsert_documents(
+        docs=_docs("a", "b", "c", "d"), vectors=np.eye(4, dtype=np.float32)
+    )
+    await mmap_store.delete_documents(["d", "unknown"])
+    await mmap_store.stop()
+
+    reopened = MmapVectorStore(settings)
+    await reopened.start()
+    try:
+        hits = await reopened.vector_search(query_vec=[0, 0, 0, 1], top_k=4)
+    finally:
+        await reopened.stop()
+
+    assert sorted(h["doc_id"] for h in hits) == ["a", "b", "c"]
+
+
+async def _open_store(settings):
+    store = MmapVectorStore(settings)
+    await store.start()
+    await store.ensure_schema()
+    return store
+
+
+@pytest.mark.asyncio
+async def test_small_segments_are_merged_without_losing_updates(settings):
+    settings = settings.model_copy(update={"merge_factor": 2})
+    store = await _open_store(settings)
+    try:
+        for i, doc_id in enumerate(["a", "b", "c", "a", "d"]):
+            await store.upsert_documents(
+                docs=_docs(doc_id), vectors=[np.eye(4, dtype=np.float32)[i % 4]]
+            )
+        await store.delete_documents(["b"])
+        await store.upsert_documents(docs=_docs("e"), vectors=[[0, 0, 0, 1]])
+        hits = await store.vector_search(query_vec=[1, 0, 0, 0], top_k=5)
+        entries = store._manifest.entries
+    finally:
+        await store.stop()
+
+    assert sorted(h["doc_id"] for h in hits) == ["a", "c", "d", "e"]
+    a_hit = next(h for h in hits if h["doc_id"] == "a")
+    assert a_hit["dense_score"] == pytest.approx(0.0, abs=1e-3)
+    # Six one-row writes end up in two segments and a tombstone.
+    assert len(entries) == 3
+
+
+@pytest.mark.asyncio
+async def test_readers_see_segments_committed_by_another_store(settings):
+    reader = await _open_store(settings)
+    writer = await _open_store(settings)
+    try:
+        assert await reader.vector_search(query_vec=[1, 0, 0, 0], top_k=1) == []
+        await writer.upsert_documents(docs=_docs("a"), vectors=[[1, 0, 0, 0]])
+        await writer.delete_documents(["a"])
+        await writer.upsert_documents(docs=_docs("b"), vectors=[[0, 1, 0, 0]])
+
+        hits = await reader.vector_search(query_vec=[1, 0, 0, 0], top_k=5)
+    finally:
+        await reader.stop()
+        await writer.stop()
+
+    assert [h["doc_id"] for h in hits] == ["b"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writers_do_not_overwrite_each_other(settings):
+    settings = settings.model_copy(update={"merge_factor": 3})
+    writers = [await _open_store(settings) for _ in range(2)]
+    try:
+        await asyncio.gather(
+            *(
+                writer.upsert_documents(
+                    docs=_docs(f"{w}-{i}"), vectors=[np.eye(4)[i % 4]]
+                )
+                for i in range(6)
+                for w, writer in enumerate(writers)
+            )
+        )
+        reader = await _open_store(settings)
+        hits = await reader.vector_search(query_vec=[1, 1, 1, 1], top_k=20)
+        await reader.stop()
+    finally:
+        for writer in writers:
+            await writer.stop()
+
+    assert sorted(h["doc_id"] for h in hits) == sorted(
+        f"{w}-{i}" for w in range(2) for i in range(6)
+    )
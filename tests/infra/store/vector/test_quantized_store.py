@@ -0,0 +1,151 @@
+# tests/infra/store/vector/test_quantized_store.py
+
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from graph.infra.config.schemas.store.store_config import \
+    QuantizedVectorSettings
+from graph.infra.store.vector.providers.quantized_store import \
+    QuantizedVectorStore
+from graph.infra.store.vector.quantization import (ProductQuantizer,
+                                                   ScalarQuantizer)
+
+DIM = 32
+
+
+@pytest.fixture
+def corpus():
+    rng = np.random.default_rng(7)
+    vectors = rng.normal(size=(600, DIM)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _docs(n):
+    return [{"id": f"doc{i}", "text": f"text {i}"} for i in range(n)]
+
+
+def test_scalar_quantizer_scores_close_to_exact(corpus):
+    codec = ScalarQuantizer(DIM)
+    codec.train(corpus)
+    codes = codec.encode(corpus)
+
+    assert codes.dtype == np.int8
+    assert codec.code_size * 4 == corpus[0].nbytes
+    np.testing.assert_allclose(
+        codec.score(corpus[0], codes), corpus @ corpus[0], atol=0.05
+    )
+
+
+def test_product_quantizer_asymmetric_scores_match_decoded(corpus):
+    codec = ProductQuantizer(DIM, subspaces=8, iterations=5)
+    codec.train(corpus)
+    codes = codec.encode(corpus)
+
+    assert codes.shape == (len(corpus), 8)
+    assert codec.code_size * 16 == corpus[0].nbytes
+    np.testing.assert_allclose(
+        codec.score(corpus[0], codes),
+        codec.decode(codes) @ corpus[0],
+        rtol=1e-4,
+        atol=1e-4,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("codec", ["int8", "pq"])
+async def test_search_with_rescore_returns_exact_top_k(tmp_path, corpus, codec):
+    store = QuantizedVectorStore(
+        QuantizedVectorSettings(
+            codec=codec,
+            dimension=DIM,
+            pq_subspaces=8,
+            pq_iterations=5,
+            training_size=500,
+            rescore_path=str(tmp_path / "full.f32"),
+            rescore_candidates=50,
+        )
+    )
+    await store.start()
+    try:
+        await store.upsert_documents(docs=_docs(300), vectors=corpus[:300])
+        await store.upsert_documents(docs=_docs(600)[300:], vectors=corpus[300:])
+        assert store.codec.is_trained
+
+        hits = await store.vector_search(query_vec=corpus[42], top_k=5)
+    finally:
+        await store.stop()
+
+    exact = np.argsort(-(corpus @ corpus[42]))[:5]
+    assert [h["doc_id"] for h in hits] == [f"doc{i}" for i in exact]
+    assert hits[0]["dense_score"] == pytest.approx(1.0, abs=1e-5)
+
+
+@pytest.mark.asyncio
+async def test_search_before_training_is_exact(corpus):
+    store = QuantizedVectorStore(
+        QuantizedVectorSettings(dimension=DIM, training_size=10_000)
+    )
+    await store.upsert_documents(docs=_docs(100), vectors=corpus[:100])
+
+    hits = await store.vector_search(query_vec=corpus[3], top_k=1)
+
+    assert not store.codec.is_trained
+    assert hits[0]["doc_id"] == "doc3"
+
+
+@pytest.mark.asyncio
+async def test_deleted_documents_are_not_returned(corpus):
+    store = QuantizedVectorStore(QuantizedVectorSettings(dimension=DIM))
+    await store.upsert_documents(docs=_docs(5), vectors=corpus[:5])
+
+    await store.delete_documents(["doc3"])
+    hits = await store.vector_search(query_vec=corpus[3], top_k=5)
+
+    assert sorted(h["doc_id"] for h in hits) == ["doc0", "doc1", "doc2", "doc4"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("codec", ["int8", "pq"])
+async def test_block_scoring_matches_scoring_the_whole_corpus(corpus, codec):
+    settings = QuantizedVectorSettings(
+        codec=codec,
+        dimension=DIM,
+        pq_subspaces=8,
+        pq_iterations=5,
+        training_size=500,
+        block_size=64,
+    )
+    store = QuantizedVectorStore(settings)
+    await store.upsert_documents(docs=_docs(600), vectors=corpus)
+    await store.delete_documents(["doc100", "doc200"])
+
+    hits = await store.vector_search(query_vec=corpus[100], top_k=10)
+
+    scores = store.codec.score(corpus[100], store._codes[:600])
+    scores[[100, 200]] = -np.inf
+    expected = np.argsort(-scores, kind="stable")[:10]
+    assert [h["doc_id"] for h in hits] == [f"doc{i}" for i in expected]
+
+
+@pytest.mark.asyncio
+async def test_scoring_leaves_the_event_loop_free(corpus):
+    store = QuantizedVectorStore(
+        QuantizedVectorSettings(dimension=DIM, training_size=100)
+    )
+    await store.upsert_documents(docs=_docs(200), vectors=corpus[:200])
+    release = threading.Event()
+    score = store.codec.score
+
+    def blocking_score(query, codes):
+        assert release.wait(5), "the search blocked the event loop"
+        return score(query, codes)
+
+    store.codec.score = blocking_score
+    search = asyncio.create_task(store.vector_search(query_vec=corpus[7], top_k=1))
+    await asyncio.sleep(0.05)
+    release.set()
+
+    assert (await search)[0]["doc_id"] == "doc7"
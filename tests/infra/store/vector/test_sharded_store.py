@@ -0,0 +1,94 @@
+# tests/infra/store/vector/test_sharded_store.py
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from graph.infra.config.schemas.store.store_config import ShardedVectorSettings
+from graph.infra.store.vector.exceptions import VectorQueryError
+from graph.infra.store.vector.providers.sharded_store import (
+    ShardedVectorStore, shard_for)
+
+
+def _hit(doc_id, score):
+    return {"doc_id": doc_id, "text": "", "entities": [], "dense_score": score}
+
+
+@pytest.fixture
+def shards():
+    """Three mocked VectorStoreProtocol shards."""
+    return [AsyncMock(), AsyncMock(), AsyncMock()]
+
+
+def _store(shards, **settings):
+    return ShardedVectorStore(shards=shards, settings=ShardedVectorSettings(**settings))
+
+
+@pytest.mark.asyncio
+async def test_upsert_routes_each_document_to_its_shard(shards):
+    store = _store(shards)
+    docs = [{"id": f"doc{i}", "text": "t"} for i in range(20)]
+    vectors = [[float(i)] for i in range(20)]
+
+    await store.upsert_documents(docs=docs, vectors=vectors)
+
+    routed = {}
+    for index, shard in enumerate(shards):
+        for call in shard.upsert_documents.await_args_list:
+            for doc, vec in zip(call.kwargs["docs"], call.kwargs["vectors"]):
+                routed[doc["id"]] = (index, float(vec[0]))
+    assert routed == {
+        d["id"]: (shard_for(d["id"], 3), float(i)) for i, d in enumerate(docs)
+    }
+
+
+@pytest.mark.asyncio
+async def test_search_merges_top_k_across_shards(shards):
+    shards[0].vector_search.return_value = [_hit("a", 0.9), _hit("b", 0.4)]
+    shards[1].vector_search.return_value = [_hit("c", 0.7)]
+    shards[2].vector_search.return_value = [_hit("d", 0.8), _hit("e", 0.1)]
+
+    hits = await _store(shards).vector_search(query_vec=[0.1], top_k=3)
+
+    assert [h["doc_id"] for h in hits] == ["a", "d", "c"]
+
+
+@pytest.mark.asyncio
+async def test_partial_results_allowed_when_a_shard_fails(shards):
+    shards[0].vector_search.return_value = [_hit("a", 0.9)]
+    shards[1].vector_search.side_effect = RuntimeError("shard down")
+    shards[2].vector_search.return_value = [_hit("d", 0.8)]
+
+    hits = await _store(shards, partial_results="allow").vector_search(
+        query_vec=[0.1], top_k=3
+    )
+
+    assert [h["doc_id"] for h in hits] == ["a", "d"]
+
+
+@pytest.mark.asyncio
+async def test_partial_results_rejected_by_fail_policy(shards):
+    shards[1].vector_search.side_effect = RuntimeError("shard down")
+
+    with pytest.raises(VectorQueryError):
+        await _store(shards, partial_results="fail").vector_search(
+            query_vec=[0.1], top_k=3
+        )
+
+
+@pytest.mark.asyncio
+async def test_slow_shard_times_out(shards):
+    async def slow_search(**kwargs):
+        await asyncio.sleep(1)
+        return [_hit("slow", 1.0)]
+
+    shards[0].vector_search.side_effect = slow_search
+    shards[1].vector_search.return_value = [_hit("b", 0.5)]
+    shards[2].vector_search.return_value = []
+
+    hits = await _store(shards, shard_timeout_seconds=0.05).vector_search(
+        query_vec=[0.1], top_k=3
+    )
+
+    assert [h["doc_id"] for h in hits] == ["b"]
@@ -0,0 +1,280 @@
+# tests/infra/store/vector/test_weaviate_store.py
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from graph.infra.config.schemas.embedding import EmbeddingSettings
+from graph.infra.config.schemas.store.store_config import VectorSettings
+from graph.infra.context.context_vars import set_timeout_deadline
+from graph.infra.context.deadline import DeadlineExceeded, run_within_deadline
+from graph.infra.store.vector.exceptions import VectorDataError
+from graph.infra.store.vector.providers.weaviate_store import (WeaviateStore,
+                                                               _content_hash,
+                                                               _document_uuid,
+                                                               _embedding_id)
+
+EMBEDDING = EmbeddingSettings(model_name="model-a", backend="torch")
+
+
+@pytest.fixture
+def collection():
+    """Fixture for a mocked Weaviate collection with a recording batch."""
+    col = MagicMock()
+    batch = MagicMock()
+    col.batch.dynamic.return_value.__enter__.return_value = batch
+    col.query.fetch_objects.return_value = SimpleNamespace(objects=[])
+    col.batch.failed_objects = []
+    return col
+
+
+@pytest.fixture
+def weaviate_store(collection):
+    """Fixture to create a WeaviateStore with a mocked client."""
+    store = WeaviateStore(
+        VectorSettings(url="http://localhost:8080"), embedding=EMBEDDING
+    )
+    store.client = MagicMock()
+    store.client.collections.get.return_value = collection
+    return store
+
+
+def _hash(doc, embedding=EMBEDDING):
+    return _content_hash(doc, _embedding_id(embedding))
+
+
+def _batch(collection):
+    return collection.batch.dynamic.return_value.__enter__.return_value
+
+
+@pytest.mark.asyncio
+async def test_upsert_uses_deterministic_uuids(weaviate_store, collection):
+    docs = [{"id": "doc1", "text": "About apples.", "entities": ["apple"]}]
+
+    await weaviate_store.upsert_documents(docs=docs, vectors=[[0.1, 0.2]])
+
+    call = _batch(collection).add_object.call_args
+    assert call.kwargs["uuid"] == _document_uuid("doc1", "Document")
+    assert call.kwargs["properties"]["content_hash"] == _hash(docs[0])
+
+
+@pytest.mark.asyncio
+async def test_upsert_skips_unchanged_documents(weaviate_store, collection):
+    unchanged = {"id": "doc1", "text": "About apples.", "entities": ["apple"]}
+    changed = {"id": "doc2", "text": "About pears, revised.", "entities": []}
+    collection.query.fetch_objects.return_value = SimpleNamespace(
+        objects=[
+            SimpleNamespace(
+                uuid=_document_uuid("doc1", "Document"),
+                properties={"content_hash": _hash(unchanged)},
+            ),
+            SimpleNamespace(
+                uuid=_document_uuid("doc2", "Document"),
+                properties={"content_hash": "stale"},
+            ),
+        ]
+    )
+
+    await weaviate_store.upsert_documents(
+        docs=[unchanged, changed], vectors=[[0.1], [0.2]]
+    )
+
+    written = [
+        c.kwargs["properties"]["doc_id"]
+        for c in _batch(collection).add_object.call_args_list
+    ]
+    assert written == ["doc2"]
+
+
+@pytest.mark.asyncio
+async def test_upsert_raises_when_the_batch_rejects_objects(weaviate_store, collection):
+    collection.batch.failed_objects = [
+        SimpleNamespace(message="vector length mismatch", original_uuid="u1")
+    ]
+    docs = [
+        {"id": "doc1", "text": "About apples."},
+        {"id": "doc2", "text": "About pears."},
+    ]
+
+    with pytest.raises(VectorDataError, match="1 of 2 documents"):
+        await weaviate_store.upsert_documents(docs=docs, vectors=[[0.1], [0.2]])
+
+
+@pytest.mark.asyncio
+async def test_upserts_leave_the_event_loop_free(weaviate_store, collection):
+    release = threading.Event()
+
+    def fetch_objects(**kwargs):
+        assert release.wait(5), "the upsert blocked the event loop"
+        return SimpleNamespace(objects=[])
+
+    collection.query.fetch_objects.side_effect = fetch_objects
+    upsert = asyncio.create_task(
+        weaviate_store.upsert_documents(
+            docs=[{"id": "doc1", "text": "About apples."}], vectors=[[0.1]]
+        )
+    )
+    await asyncio.sleep(0.05)
+    release.set()
+    await upsert
+
+    assert _batch(collection).add_object.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_upsert_with_nothing_changed_opens_no_batch(weaviate_store, collection):
+    doc = {"id": "doc1", "text": "About apples."}
+    collection.query.fetch_objects.return_value = SimpleNamespace(
+        objects=[
+            SimpleNamespace(
+                uuid=_document_uuid("doc1", "Document"),
+                properties={"content_hash": _hash(doc)},
+            )
+        ]
+    )
+
+    await weaviate_store.upsert_documents(docs=[doc], vectors=[[0.1]])
+
+    collection.batch.dynamic.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_upsert_rewrites_documents_embedded_by_another_model(
+    weaviate_store, collection
+):
+    doc = {"id": "doc1", "text": "About apples."}
+    previous = EmbeddingSettings(model_name="model-a", backend="onnx_int8")
+    collection.query.fetch_objects.return_value = SimpleNamespace(
+        objects=[
+            SimpleNamespace(
+                uuid=_document_uuid("doc1", "Document"),
+                properties={"content_hash": _hash(doc, previous)},
+            )
+        ]
+    )
+
+    await weaviate_store.upsert_documents(docs=[doc], vectors=[[0.1]])
+
+    assert _batch(collection).add_object.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_schema_applies_index_settings(weaviate_store):
+    weaviate_store.settings = VectorSettings(
+        url="http://localhost:8080",
+        class_name="RAGDocument",
+        distance="dot",
+        ef=64,
+        ef_construction=256,
+        max_connections=48,
+        compression="sq",
+        compression_rescore_limit=200,
+    )
+    weaviate_store.client.collections.list_all.return_value = {}
+
+    await weaviate_store.ensure_schema()
+
+    kwargs = weaviate_store.client.collections.create.call_args.kwargs
+    index = kwargs["vector_index_config"]
+    assert kwargs["name"] == "RAGDocument"
+    assert index.distance.value == "dot"
+    assert (index.ef, index.efConstruction, index.maxConnections) == (64, 256, 48)
+    assert index.quantizer.rescoreLimit == 200
+
+
+@pytest.mark.asyncio
+async def test_search_ef_widens_limit_and_truncates(weaviate_store, collection):
+    collection.query.near_vector.return_value = SimpleNamespace(
+        objects=[
+            SimpleNamespace(
+                properties={"doc_id": f"doc{i}"},
+                metadata=SimpleNamespace(distance=0.1 * i),
+            )
+            for i in range(5)
+        ]
+    )
+
+    hits = await weaviate_store.vector_search(query_vec=[0.1], top_k=2, ef=5)
+
+    assert collection.query.near_vector.call_args.kwargs["limit"] == 5
+    assert [h["doc_id"] for h in hits] == ["doc0", "doc1"]
+    assert hits[1]["dense_score"] == pytest.approx(0.9)
+
+
+@pytest.mark.asyncio
+async def test_a_blocked_search_is_abandoned_at_the_deadline(
+    weaviate_store, collection
+):
+    release = threading.Event()
+    collection.query.near_vector.side_effect = lambda **kwargs: release.wait(5)
+    set_timeout_deadline(time.time() + 0.05)
+    started = time.monotonic()
+
+    try:
+        with pytest.raises(DeadlineExceeded):
+            await run_within_deadline(
+                weaviate_store.vector_search(query_vec=[0.1], top_k=2), "dense"
+            )
+    finally:
+        release.set()
+
+    assert time.monotonic() - started < 1
+
+
+@pytest.mark.asyncio
+async def test_delete_documents_by_deterministic_uuid(weaviate_store, collection):
+    await weaviate_store.delete_documents(["doc1", "doc2"])
+
+    where = collection.data.delete_many.call_args.kwargs["where"]
+    assert set(where.value) == {
+        _document_uuid("doc1", "Document"),
+        _document_uuid("doc2", "Document"),
+    }
+
+
+@pytest.mark.asyncio
+async def test_schema_migration_moves_objects_off_random_uuids(
+    weaviate_store, collection
+):
+    weaviate_store.client.collections.list_all.return_value = {"Document": None}
+    collection.config.get.return_value = SimpleNamespace(
+        properties=[SimpleNamespace(name="doc_id"), SimpleNamespace(name="text")]
+    )
+    doc1_uuid = _document_uuid("doc1", "Document")
+    collection.iterator.return_value = [
+        SimpleNamespace(
+            uuid="00000000-0000-0000-0000-000000000001",
+            properties={"doc_id": "doc1", "text": "About apples."},
+            vector={"default": [0.1, 0.2]},
+        ),
+        SimpleNamespace(
+            uuid=doc1_uuid,
+            properties={"doc_id": "doc1", "text": "About apples."},
+            vector={"default": [0.1, 0.2]},
+        ),
+        SimpleNamespace(
+            uuid="00000000-0000-0000-0000-000000000002",
+            properties={"doc_id": "doc2", "text": "About pears."},
+            vector={"default": [0.3, 0.4]},
+        ),
+    ]
+    collection.query.fetch_objects.return_value = SimpleNamespace(
+        objects=[SimpleNamespace(uuid=doc1_uuid, properties={"content_hash": "h"})]
+    )
+
+    await weaviate_store.ensure_schema()
+
+    call = _batch(collection).add_object.call_args
+    assert _batch(collection).add_object.call_count == 1
+    assert call.kwargs["uuid"] == _document_uuid("doc2", "Document")
+    assert call.kwargs["vector"] == [0.3, 0.4]
+    where = collection.data.delete_many.call_args.kwargs["where"]
+    assert set(where.value) == {
+        "00000000-0000-0000-0000-000000000001",
+        "00000000-0000-0000-0000-000000000002",
+    }
+    assert collection.config.add_property.call_args.args[0].name == "content_hash"
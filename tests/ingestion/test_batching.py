@@ -0,0 +1,72 @@
+# tests/ingestion/test_batching.py
+
+import asyncio
+
+import pytest
+
+from graph.infra.config.schemas.ingestion.ingestion_config import \
+    IngestionSettings
+from graph.ingestion.batching import (AimdBatchSizer, FixedBatchSizer,
+                                      create_sizer)
+
+
+def _sizer(**overrides):
+    options = dict(
+        initial=8,
+        minimum=4,
+        maximum=16,
+        target_latency=0.02,
+        increase=4,
+        decrease_factor=0.5,
+    )
+    options.update(overrides)
+    return AimdBatchSizer("test", **options)
+
+
+def test_additive_increase_and_multiplicative_decrease_within_bounds():
+    sizer = _sizer()
+
+    for _ in range(5):
+        sizer.record(latency=0.001)
+    assert sizer.size == 16
+
+    sizer.record(latency=0.5)
+    assert sizer.size == 8
+    sizer.record(latency=0.001, failed=True)
+    sizer.record(latency=0.001, failed=True)
+    assert sizer.size == 4
+
+
+@pytest.mark.asyncio
+async def test_run_chunks_items_and_adapts_to_slow_calls():
+    sizer = _sizer()
+    seen = []
+
+    async def call(rows):
+        seen.append(rows.stop - rows.start)
+        if len(seen) == 2:
+            await asyncio.sleep(0.05)
+
+    await sizer.run(40, call)
+
+    assert sum(seen) == 40
+    assert seen[:3] == [8, 12, 6]
+
+
+@pytest.mark.asyncio
+async def test_failed_call_shrinks_and_reraises():
+    sizer = _sizer()
+
+    async def call(rows):
+        raise ConnectionError("store overloaded")
+
+    with pytest.raises(ConnectionError):
+        await sizer.run(10, call)
+    assert sizer.size == 4
+
+
+def test_fixed_sizer_when_adaptive_batching_is_disabled():
+    sizer = create_sizer("test", IngestionSettings(adaptive_batching=False), 32)
+
+    assert isinstance(sizer, FixedBatchSizer)
+    assert sizer.size == 32
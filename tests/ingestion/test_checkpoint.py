@@ -0,0 +1,112 @@
+# tests/ingestion/test_checkpoint.py
+
+import asyncio
+import json
+import os
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from graph.infra.config.schemas.ingestion.ingestion_config import \
+    IngestionSettings
+from graph.infra.config.schemas.resilience import RetrySettings
+from graph.ingestion.checkpoint import (CheckpointStore, CommitWatermark,
+                                        SourceCheckpoint, source_version)
+from graph.ingestion.service import IngestionService
+
+
+def test_watermark_only_advances_over_contiguous_batches():
+    watermark = CommitWatermark()
+
+    assert watermark.complete(1, 200) is None
+    assert watermark.complete(2, 300) is None
+    assert watermark.complete(0, 100) == (2, 300)
+    assert watermark.complete(3, 400) == (3, 400)
+
+
+def test_store_round_trips_and_rejects_other_sources(tmp_path):
+    source = tmp_path / "documents.jsonl"
+    source.write_text("x" * 50)
+    state = tmp_path / "state" / "checkpoint.json"
+    size, mtime_ns = source_version(str(source))
+    checkpoint = SourceCheckpoint(
+        str(source), offset=40, batch=3, stage="write", size=size, mtime_ns=mtime_ns
+    )
+
+    CheckpointStore(str(state)).save("documents", checkpoint)
+    reloaded = CheckpointStore(str(state))
+
+    assert reloaded.get("documents", str(source)) == checkpoint
+    assert reloaded.get("documents", str(tmp_path / "other.jsonl")) is None
+    source.write_text("x" * 10)
+    assert reloaded.get("documents", str(source)) is None
+
+
+def test_checkpoints_track_the_file_version_not_the_offset_unit(tmp_path):
+    source = tmp_path / "documents.arrow"
+    source.write_bytes(b"x" * 50)
+    state = tmp_path / "checkpoint.json"
+    size, mtime_ns = source_version(str(source))
+    store = CheckpointStore(str(state))
+
+    # A row index of a columnar file may exceed its byte size.
+    store.save(
+        "documents",
+        SourceCheckpoint(str(source), offset=500, size=size, mtime_ns=mtime_ns),
+    )
+    assert store.get("documents", str(source)).offset == 500
+
+    # A rewrite of the same size is a different file.
+    source.write_bytes(b"y" * 50)
+    os.utime(source, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+    assert store.get("documents", str(source)) is None
+
+
+@pytest.mark.asyncio
+async def test_interrupted_run_resumes_after_last_committed_batch(tmp_path):
+    docs = tmp_path / "documents.jsonl"
+    docs.write_text(
+        "".join(json.dumps({"id": f"d{i}", "text": f"t{i}"}) + "\n" for i in range(6))
+    )
+    empty = tmp_path / "empty.jsonl"
+    empty.write_text("")
+    state = tmp_path / "checkpoint.json"
+
+    graph_store, vector_store = AsyncMock(), AsyncMock()
+    graph_store.is_ready = MagicMock(return_value=True)
+    vector_store.is_ready = MagicMock(return_value=True)
+    written = []
+
+    async def upsert(docs, vectors):
+        if docs[0]["id"] == "d4" and not written.count("failed"):
+            written.append("failed")
+            # Give the checkpoint stage time to commit the earlier batches.
+            await asyncio.sleep(0.1)
+            raise ConnectionError("store went away")
+        written.extend(d["id"] for d in docs)
+
+    vector_store.upsert_documents.side_effect = upsert
+
+    embedder = AsyncMock()
+    embedder.encode.side_effect = lambda texts: np.ones((len(texts), 4))
+    service = IngestionService(
+        graph_store=graph_store,
+        vector_store=vector_store,
+        settings=IngestionSettings(
+            batch_size=2, write_concurrency=1, checkpoint_path=str(state)
+        ),
+        # The failure must interrupt the run rather than be retried.
+        retry_settings=RetrySettings(enabled=False),
+        embedding_service=embedder,
+    )
+
+    with pytest.raises(ConnectionError):
+        await service.run_pipeline(str(docs), str(empty), str(empty))
+    checkpoint = CheckpointStore(str(state)).get("documents", str(docs))
+    assert (checkpoint.batch, checkpoint.stage) == (1, "write")
+
+    await service.run_pipeline(str(docs), str(empty), str(empty))
+
+    assert written == ["d0", "d1", "d2", "d3", "failed", "d4", "d5"]
+    assert not state.exists()
@@ -0,0 +1,142 @@
+# tests/ingestion/test_chunking.py
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from graph.infra.config.schemas.ingestion.ingestion_config import \
+    IngestionSettings
+from graph.infra.store.ids import chunk_id, parent_id
+from graph.ingestion.chunking import TokenWindowChunker, stale_chunk_ids
+from graph.ingestion.service import IngestionService
+
+
+def test_windows_overlap_and_cover_the_whole_text():
+    chunker = TokenWindowChunker(window=4, overlap=1)
+    text = " ".join(f"w{i}" for i in range(10))
+
+    assert chunker.split(text) == ["w0 w1 w2 w3", "w3 w4 w5 w6", "w6 w7 w8 w9"]
+    assert chunker.split("short text") == ["short text"]
+    assert chunker.split("") == [""]
+
+
+def test_fast_tokenizer_offsets_define_the_windows():
+    tokenizer = MagicMock(is_fast=True)
+    # "unbelievable" is three word pieces; (0, 0) stands for a special token.
+    tokenizer.return_value = {
+        "offset_mapping": [[(0, 0), (0, 2), (2, 6), (6, 12), (13, 17)]]
+    }
+    chunker = TokenWindowChunker(window=2, overlap=0, tokenizer=tokenizer)
+
+    assert chunker.split("unbelievable news") == ["unbeli", "evable news"]
+
+
+def test_chunk_ids_map_back_to_documents():
+    assert parent_id(chunk_id("doc#1", 12)) == "doc#1"
+    assert parent_id("plain-doc") == "plain-doc"
+    assert parent_id("doc#chunk-x") == "doc#chunk-x"
+
+
+def test_stale_chunks_of_shrunk_and_deleted_documents():
+    stale = stale_chunk_ids({"a": 3, "b": 1, "c": 2}, {"a": 1, "b": 2}, ["c"])
+
+    assert stale == [
+        chunk_id("a", 1),
+        chunk_id("a", 2),
+        chunk_id("c", 0),
+        chunk_id("c", 1),
+    ]
+
+
+def test_overlap_must_be_smaller_than_the_window():
+    with pytest.raises(ValueError):
+        IngestionSettings(chunk_tokens=8, chunk_overlap=8)
+
+
+@pytest.mark.asyncio
+async def test_chunks_are_embedded_by_length_and_written_as_vectors(tmp_path):
+    graph_store, vector_store = AsyncMock(), AsyncMock()
+    graph_store.is_ready = MagicMock(return_value=True)
+    vector_store.is_ready = MagicMock(return_value=True)
+    docs = [
+        {"id": "long", "text": " ".join(f"w{i}" for i in range(7))},
+        {"id": "short", "text": "tiny"},
+    ]
+    paths = []
+    for name, rows in (("documents", docs), ("entities", []), ("edges", [])):
+        path = tmp_path / f"{name}.jsonl"
+        path.write_text("".join(json.dumps(r) + "\n" for r in rows))
+        paths.append(str(path))
+
+    encoded = []
+
+    def encode(texts, **kwargs):
+        encoded.append(list(texts))
+        return np.array([[len(t), 0.0] for t in texts], dtype=np.float32)
+
+    embedder = AsyncMock()
+    embedder.encode.side_effect = encode
+    # Without a fast tokenizer, windows are measured in words.
+    embedder.tokenizer = None
+    service = IngestionService(
+        graph_store=graph_store,
+        vector_store=vector_store,
+        settings=IngestionSettings(
+            batch_size=8, chunking=True, chunk_tokens=4, chunk_overlap=1
+        ),
+        embedding_service=embedder,
+    )
+    await service.run_pipeline(*paths)
+
+    # Embedded shortest first, to keep padding within a model call small.
+    assert [len(t) for t in encoded[0]] == sorted(len(t) for t in encoded[0])
+    call = vector_store.upsert_documents.await_args.kwargs
+    assert [d["id"] for d in call["docs"]] == [
+        chunk_id("long", 0),
+        chunk_id("long", 1),
+        chunk_id("short", 0),
+    ]
+    assert call["docs"][1]["text"] == "w3 w4 w5 w6"
+    # Vectors are put back in chunk order after the length sort.
+    assert [v[0] for v in call["vectors"]] == [len(d["text"]) for d in call["docs"]]
+    graph_docs = graph_store.upsert_documents.await_args.kwargs["docs"]
+    assert [d["id"] for d in graph_docs] == ["long", "short"]
+
+
+@pytest.mark.asyncio
+async def test_incremental_runs_delete_chunks_a_document_lost(tmp_path):
+    graph_store, vector_store = AsyncMock(), AsyncMock()
+    graph_store.is_ready = MagicMock(return_value=True)
+    vector_store.is_ready = MagicMock(return_value=True)
+    paths = [str(tmp_path / f"{n}.jsonl") for n in ("documents", "entities", "edges")]
+    for path in paths[1:]:
+        open(path, "w").close()
+
+    embedder = AsyncMock()
+    embedder.encode.side_effect = lambda texts: np.ones(
+        (len(texts), 2), dtype=np.float32
+    )
+    embedder.tokenizer = None
+    service = IngestionService(
+        graph_store=graph_store,
+        vector_store=vector_store,
+        settings=IngestionSettings(
+            chunking=True,
+            chunk_tokens=2,
+            chunk_overlap=0,
+            incremental=True,
+            manifest_path=str(tmp_path / "manifest.sqlite"),
+        ),
+        embedding_service=embedder,
+    )
+
+    for text in ("a b c d e f", "a b"):
+        with open(paths[0], "w") as f:
+            f.write(json.dumps({"id": "doc", "text": text}) + "\n")
+        await service.run_pipeline(*paths)
+
+    vector_store.delete_documents.assert_awaited_once_with(
+        [chunk_id("doc", 1), chunk_id("doc", 2)]
+    )
@@ -0,0 +1,128 @@
+# tests/ingestion/test_cli.py
+
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from graph.ingestion.cli import (PIPELINES, build_parser, dry_run,
+                                 job_from_args, main, split_job)
+from graph.ingestion.dead_letter import DeadLetter, DeadLetterQueue
+
+
+def _write_jsonl(path, rows):
+    path.write_text("".join(json.dumps(r) + "\n" for r in rows))
+    return str(path)
+
+
+@pytest.fixture
+def input_args(tmp_path):
+    return [
+        "--documents",
+        _write_jsonl(
+            tmp_path / "documents.jsonl",
+            [{"id": f"d{i}", "text": f"text {i}"} for i in range(10)],
+        ),
+        "--entities",
+        _write_jsonl(tmp_path / "entities.jsonl", [{"id": f"e{i}"} for i in range(4)]),
+        "--edges",
+        _write_jsonl(tmp_path / "edges.jsonl", [{"doc_id": "d0", "entity_id": "e0"}]),
+    ]
+
+
+def test_arguments_override_settings(input_args):
+    args = build_parser().parse_args(
+        input_args
+        + ["--batch-size", "7", "--write-concurrency", "3", "--embedding-workers", "2"]
+    )
+    job = job_from_args(args)
+
+    assert job.ingestion.batch_size == 7
+    assert job.ingestion.write_concurrency == 3
+    assert job.embedding.workers == 2
+    assert job.graph.entity_write_mode == "merge"
+    assert job.resume is True
+
+
+def test_create_only_selects_create_entity_writes(input_args):
+    job = job_from_args(build_parser().parse_args(input_args + ["--create-only"]))
+
+    assert job.graph.entity_write_mode == "create"
+
+
+def test_shards_split_inputs_without_overlap(input_args, tmp_path):
+    job = job_from_args(build_parser().parse_args(input_args))
+    job.ingestion = job.ingestion.model_copy(
+        update={"checkpoint_path": str(tmp_path / "checkpoint.json")}
+    )
+
+    shards = split_job(job, 3)
+
+    assert len({s.ingestion.checkpoint_path for s in shards}) == 3
+    totals = {pipeline: 0 for pipeline in PIPELINES}
+    for shard in shards:
+        for pipeline, count in dry_run(shard).items():
+            totals[pipeline] += count
+    assert totals == {"documents": 10, "entities": 4, "links": 1}
+
+
+def test_schemas_are_created_once_before_the_shards_start(input_args, monkeypatch):
+    calls = []
+
+    async def prepare(job):
+        calls.append(("prepare", job.ensure_schemas))
+
+    def run(jobs, interval, metrics):
+        calls.extend(("shard", shard.ensure_schemas) for shard in jobs)
+        return {}
+
+    monkeypatch.setattr("graph.ingestion.cli.prepare_stores", prepare)
+    monkeypatch.setattr("graph.ingestion.cli.run_sharded", run)
+
+    assert main(input_args + ["--shards", "2", "--no-metrics-server"]) == 0
+    assert calls == [("prepare", True), ("shard", False), ("shard", False)]
+
+
+def test_dry_run_does_not_touch_the_stores(input_args, monkeypatch):
+    async def fail(job):
+        raise AssertionError("dry run must not ingest")
+
+    monkeypatch.setattr("graph.ingestion.cli.run_job", fail)
+
+    assert main(input_args + ["--dry-run", "--shards", "2"]) == 0
+
+
+def test_runs_that_dead_letter_batches_exit_non_zero(input_args, tmp_path, monkeypatch):
+    queue = DeadLetterQueue(str(tmp_path / "dead_letter.jsonl"))
+    queue.append(DeadLetter("documents", "old.jsonl", 0, "earlier run", []))
+
+    async def run(job):
+        queue.append(DeadLetter("documents", job.documents_path, 3, "boom", []))
+
+    monkeypatch.setattr(
+        "graph.ingestion.cli.get_settings",
+        lambda: _settings(dead_letter_path=str(queue.path)),
+    )
+    monkeypatch.setattr("graph.ingestion.cli.run_job", run)
+
+    assert main(input_args + ["--no-metrics-server"]) == 3
+    monkeypatch.setattr("graph.ingestion.cli.run_job", AsyncMock())
+    assert main(input_args + ["--no-metrics-server"]) == 0
+
+
+def test_incremental_runs_cannot_be_sharded(input_args, monkeypatch):
+    monkeypatch.setattr(
+        "graph.ingestion.cli.get_settings",
+        lambda: _settings(incremental=True),
+    )
+
+    assert main(input_args + ["--shards", "2"]) == 2
+
+
+def _settings(**ingestion):
+    from graph.infra.config import get_settings
+
+    settings = get_settings()
+    return settings.model_copy(
+        update={"ingestion": settings.ingestion.model_copy(update=ingestion)}
+    )
@@ -0,0 +1,109 @@
+# tests/ingestion/test_dead_letter.py
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from graph.infra.config.schemas.ingestion.ingestion_config import \
+    IngestionSettings
+from graph.infra.config.schemas.resilience import (RetryPolicySettings,
+                                                   RetrySettings)
+from graph.ingestion.dead_letter import DeadLetter, DeadLetterQueue
+from graph.ingestion.service import IngestionService
+
+
+def _write_jsonl(path, rows):
+    path.write_text("".join(json.dumps(r) + "\n" for r in rows))
+    return str(path)
+
+
+@pytest.fixture
+def data_files(tmp_path):
+    docs = [{"id": f"d{i}", "text": f"text {i}"} for i in range(6)]
+    return (
+        _write_jsonl(tmp_path / "documents.jsonl", docs),
+        _write_jsonl(tmp_path / "entities.jsonl", [{"id": "e0"}]),
+        _write_jsonl(tmp_path / "edges.jsonl", [{"doc_id": "d0", "entity_id": "e0"}]),
+    )
+
+
+def _service(graph_store, vector_store, dead_letter_path):
+    embedder = AsyncMock()
+    embedder.encode.side_effect = lambda texts: np.ones(
+        (len(texts), 4), dtype=np.float32
+    )
+    return IngestionService(
+        graph_store=graph_store,
+        vector_store=vector_store,
+        settings=IngestionSettings(
+            batch_size=2, dead_letter_path=str(dead_letter_path)
+        ),
+        retry_settings=RetrySettings(
+            default_policy=RetryPolicySettings(
+                attempts=2, wait_min_seconds=0, wait_max_seconds=0
+            )
+        ),
+        embedding_service=embedder,
+    )
+
+
+def _stores():
+    graph_store, vector_store = AsyncMock(), AsyncMock()
+    graph_store.is_ready = MagicMock(return_value=True)
+    vector_store.is_ready = MagicMock(return_value=True)
+    return graph_store, vector_store
+
+
+@pytest.mark.asyncio
+async def test_failing_batch_is_dead_lettered_and_replayed(tmp_path, data_files):
+    graph_store, vector_store = _stores()
+    dead_letter_path = tmp_path / "dead_letter.jsonl"
+    outage = {"down": True}
+
+    async def upsert_documents(docs, vectors):
+        if outage["down"] and any(d["id"] == "d2" for d in docs):
+            raise ConnectionError("leader election")
+
+    vector_store.upsert_documents.side_effect = upsert_documents
+    service = _service(graph_store, vector_store, dead_letter_path)
+
+    await service.run_pipeline(*data_files)
+
+    letters = DeadLetterQueue(str(dead_letter_path)).read()
+    assert [(letter.pipeline, letter.batch) for letter in letters] == [("documents", 1)]
+    assert [r["id"] for r in letters[0].records] == ["d2", "d3"]
+    assert "leader election" in letters[0].error
+    # Two attempts for the failing batch, one for each of the others.
+    assert vector_store.upsert_documents.await_count == 4
+
+    outage["down"] = False
+    assert await service.replay_dead_letters() == 1
+    assert not dead_letter_path.exists()
+    replayed = vector_store.upsert_documents.await_args_list[-1].kwargs
+    assert [d["id"] for d in replayed["docs"]] == ["d2", "d3"]
+    assert len(replayed["vectors"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_batches_that_fail_again_stay_in_the_file(tmp_path):
+    graph_store, vector_store = _stores()
+    graph_store.upsert_entities.side_effect = ConnectionError("still down")
+    queue = DeadLetterQueue(str(tmp_path / "dead_letter.jsonl"))
+    queue.append(
+        DeadLetter(
+            pipeline="entities",
+            source="entities.jsonl",
+            batch=0,
+            error="ConnectionError()",
+            records=[{"id": "e0"}],
+        )
+    )
+    service = _service(graph_store, vector_store, queue.path)
+
+    assert await service.replay_dead_letters() == 0
+
+    (letter,) = queue.read()
+    assert letter.attempts == 2
+    assert "still down" in letter.error
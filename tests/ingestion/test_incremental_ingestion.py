@@ -0,0 +1,92 @@
+# tests/ingestion/test_incremental_ingestion.py
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from graph.infra.config.schemas.ingestion.ingestion_config import \
+    IngestionSettings
+from graph.ingestion.manifest import IngestionManifest, record_hash
+from graph.ingestion.service import IngestionService
+
+
+def _write_jsonl(path, rows):
+    path.write_text("".join(json.dumps(r) + "\n" for r in rows))
+    return str(path)
+
+
+def _written_ids(mock):
+    return sorted(d["id"] for call in mock.await_args_list for d in call.kwargs["docs"])
+
+
+@pytest.fixture
+def service(tmp_path):
+    graph_store, vector_store = AsyncMock(), AsyncMock()
+    graph_store.is_ready = MagicMock(return_value=True)
+    vector_store.is_ready = MagicMock(return_value=True)
+    embedder = AsyncMock()
+    embedder.encode.side_effect = lambda texts: np.ones((len(texts), 4))
+    yield IngestionService(
+        graph_store=graph_store,
+        vector_store=vector_store,
+        settings=IngestionSettings(
+            batch_size=2,
+            incremental=True,
+            manifest_path=str(tmp_path / "manifest.sqlite"),
+        ),
+        embedding_service=embedder,
+    )
+
+
+def test_record_hash_ignores_key_order():
+    assert record_hash({"id": "a", "text": "x"}) == record_hash(
+        {"text": "x", "id": "a"}
+    )
+
+
+def test_missing_lists_records_not_seen_in_run(tmp_path):
+    manifest = IngestionManifest(str(tmp_path / "manifest.sqlite"))
+    first = manifest.begin_run()
+    manifest.record("documents", {"a": "h1", "b": "h2"}, first)
+    manifest.complete_run(first)
+
+    second = manifest.begin_run()
+    manifest.touch("documents", ["a"], second)
+
+    assert second != first
+    assert manifest.missing("documents", second, limit=10) == ["b"]
+
+
+@pytest.mark.asyncio
+async def test_second_run_writes_only_the_delta(service, tmp_path):
+    graph_store, vector_store = service._graph_store, service._vector_store
+    docs = [{"id": f"d{i}", "text": f"text {i}"} for i in range(4)]
+    entities = [{"id": "e0", "name": "zero"}, {"id": "e1", "name": "one"}]
+    edges = [{"doc_id": "d0", "entity_id": "e0"}]
+    paths = (
+        _write_jsonl(tmp_path / "documents.jsonl", docs),
+        _write_jsonl(tmp_path / "entities.jsonl", entities),
+        _write_jsonl(tmp_path / "edges.jsonl", edges),
+    )
+    await service.run_pipeline(*paths)
+    assert _written_ids(vector_store.upsert_documents) == ["d0", "d1", "d2", "d3"]
+    vector_store.reset_mock()
+    graph_store.reset_mock()
+
+    docs[1]["text"] = "text 1, revised"
+    del docs[2]
+    docs.append({"id": "d4", "text": "text 4"})
+    entities[1] = {"id": "e1", "deleted": True}
+    _write_jsonl(tmp_path / "documents.jsonl", docs)
+    _write_jsonl(tmp_path / "entities.jsonl", entities)
+    await service.run_pipeline(*paths)
+
+    assert _written_ids(vector_store.upsert_documents) == ["d1", "d4"]
+    vector_store.delete_documents.assert_awaited_once_with(["d2"])
+    graph_store.delete_documents.assert_awaited_once_with(["d2"])
+    graph_store.delete_entities.assert_awaited_once_with(["e1"])
+    graph_store.upsert_entities.assert_not_awaited()
+    graph_store.link_doc_entities.assert_not_awaited()
+    graph_store.unlink_doc_entities.assert_not_awaited()
@@ -0,0 +1,170 @@
+# tests/ingestion/test_ingestion_service.py
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+from graph.infra.config.schemas.ingestion.ingestion_config import \
+    IngestionSettings
+from graph.ingestion.service import IngestionService
+from graph.retrieval.epoch import FileIngestionEpoch
+
+
+def _write_jsonl(path, rows):
+    path.write_text("".join(json.dumps(r) + "\n" for r in rows))
+    return str(path)
+
+
+@pytest.fixture
+def data_files(tmp_path):
+    docs = [{"id": f"d{i}", "text": f"text {i}"} for i in range(5)]
+    entities = [{"id": f"e{i}", "name": f"entity {i}"} for i in range(3)]
+    edges = [{"doc_id": "d0", "entity_id": "e0"}, {"doc_id": "d1", "entity_id": "e2"}]
+    return (
+        _write_jsonl(tmp_path / "documents.jsonl", docs),
+        _write_jsonl(tmp_path / "entities.jsonl", entities),
+        _write_jsonl(tmp_path / "edges.jsonl", edges),
+    )
+
+
+@pytest.fixture
+def stores():
+    graph_store, vector_store = AsyncMock(), AsyncMock()
+    graph_store.is_ready = MagicMock(return_value=True)
+    vector_store.is_ready = MagicMock(return_value=True)
+    return graph_store, vector_store
+
+
+@pytest.fixture
+def ingestion_service(stores):
+    """IngestionService with mocked stores and a fake embedding model."""
+    graph_store, vector_store = stores
+    embedder = AsyncMock()
+    embedder.encode.side_effect = lambda texts: np.ones(
+        (len(texts), 4), dtype=np.float32
+    )
+    yield IngestionService(
+        graph_store=graph_store,
+        vector_store=vector_store,
+        settings=IngestionSettings(batch_size=2, write_concurrency=2),
+        embedding_service=embedder,
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_pipeline_writes_every_record(ingestion_service, stores, data_files):
+    graph_store, vector_store = stores
+
+    await ingestion_service.run_pipeline(*data_files)
+
+    written_docs = [
+        d["id"]
+        for call in vector_store.upsert_documents.await_args_list
+        for d in call.kwargs["docs"]
+    ]
+    assert sorted(written_docs) == [f"d{i}" for i in range(5)]
+    assert all(
+        len(call.kwargs["vectors"]) == len(call.kwargs["docs"])
+        for call in vector_store.upsert_documents.await_args_list
+    )
+    assert graph_store.upsert_documents.await_count == 3
+    assert graph_store.upsert_entities.await_count == 2
+    linked = [
+        pair
+        for call in graph_store.link_doc_entities.await_args_list
+        for pair in call.kwargs["pairs"]
+    ]
+    assert linked == [("d0", "e0"), ("d1", "e2")]
+
+
+@pytest.mark.asyncio
+async def test_a_run_starts_a_new_ingestion_epoch(stores, data_files, tmp_path):
+    graph_store, vector_store = stores
+    embedder = AsyncMock()
+    embedder.encode.side_effect = lambda texts: np.ones((len(texts), 4))
+    epoch = FileIngestionEpoch(str(tmp_path / "epoch"))
+    service = IngestionService(
+        graph_store=graph_store,
+        vector_store=vector_store,
+        settings=IngestionSettings(),
+        embedding_service=embedder,
+        epoch=epoch,
+    )
+
+    await service.run_pipeline(*data_files)
+
+    assert await epoch.current() == 1
+
+
+@pytest.mark.asyncio
+async def test_owned_embedding_service_loads_the_model_on_start(stores):
+    graph_store, vector_store = stores
+
+    with patch("graph.ingestion.service.EmbeddingService") as service_cls:
+        embedding = service_cls.return_value
+        embedding.start, embedding.stop = AsyncMock(), AsyncMock()
+        embedding.is_ready = MagicMock(return_value=True)
+        service = IngestionService(
+            graph_store=graph_store,
+            vector_store=vector_store,
+            embedding_model_name="model-b",
+            settings=IngestionSettings(),
+        )
+        # Nothing is loaded while the services are being wired.
+        embedding.start.assert_not_awaited()
+
+        await service.start()
+        await service.stop()
+
+    assert service_cls.call_args.args[0].model_name == "model-b"
+    embedding.start.assert_awaited_once()
+    embedding.stop.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_links_wait_for_referenced_documents(
+    ingestion_service, stores, data_files
+):
+    graph_store, _ = stores
+    events = []
+
+    async def slow_upsert_documents(docs):
+        await asyncio.sleep(0.05)
+        events.extend(f"doc {d['id']}" for d in docs)
+
+    async def link(pairs):
+        events.extend(f"link {doc_id}" for doc_id, _ in pairs)
+
+    graph_store.upsert_documents.side_effect = slow_upsert_documents
+    graph_store.link_doc_entities.side_effect = link
+
+    await ingestion_service.run_pipeline(*data_files)
+
+    assert events.index("link d1") > events.index("doc d1")
+    assert events.index("link d0") > events.index("doc d0")
+
+
+@pytest.mark.asyncio
+async def test_ranges_and_only_cover_disjoint_shards(
+    ingestion_service, stores, data_files
+):
+    graph_store, vector_store = stores
+    documents_path = data_files[0]
+    reader = ingestion_service._reader(documents_path)
+
+    for start, end in reader.split(documents_path, 2):
+        await ingestion_service.run_pipeline(
+            *data_files, ranges={"documents": (start, end)}, only=["documents"]
+        )
+
+    written_docs = [
+        d["id"]
+        for call in vector_store.upsert_documents.await_args_list
+        for d in call.kwargs["docs"]
+    ]
+    assert sorted(written_docs) == [f"d{i}" for i in range(5)]
+    graph_store.upsert_entities.assert_not_awaited()
+    graph_store.link_doc_entities.assert_not_awaited()
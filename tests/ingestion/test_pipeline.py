@@ -0,0 +1,146 @@
+# tests/ingestion/test_pipeline.py
+
+import asyncio
+import time
+
+import pytest
+from prometheus_client import REGISTRY, Gauge
+
+from graph.ingestion.pipeline import (IngestBatch, RateMeter, Stage,
+                                      StagedPipeline)
+
+
+def _source(n):
+    return (IngestBatch(number=i, records=[{"id": i}]) for i in range(n))
+
+
+@pytest.mark.asyncio
+async def test_stages_overlap_instead_of_adding_up():
+    async def slow(batch):
+        await asyncio.sleep(0.05)
+        return batch
+
+    seen = []
+
+    async def sink(batch):
+        seen.append(batch.number)
+
+    pipeline = StagedPipeline(
+        "test", [Stage("a", slow), Stage("b", slow), Stage("sink", sink)]
+    )
+
+    start = time.perf_counter()
+    await pipeline.run(_source(6))
+    elapsed = time.perf_counter() - start
+
+    assert seen == list(range(6))
+    # Sequential processing would take 6 * 2 * 0.05 = 0.6s.
+    assert elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_concurrent_workers_share_a_stage():
+    active = 0
+    peak = 0
+
+    async def work(batch):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.02)
+        active -= 1
+
+    await StagedPipeline("test", [Stage("work", work, concurrency=3)]).run(_source(9))
+
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_bounded_queues_apply_backpressure():
+    produced = 0
+
+    def source():
+        nonlocal produced
+        for i in range(50):
+            produced += 1
+            yield IngestBatch(number=i)
+
+    release = asyncio.Event()
+
+    async def blocked(batch):
+        await release.wait()
+
+    task = asyncio.create_task(
+        StagedPipeline("test", [Stage("blocked", blocked)], queue_size=2).run(source())
+    )
+    await asyncio.sleep(0.1)
+
+    # One batch in the worker, two in the queue and one waiting to be put.
+    assert produced <= 4
+    release.set()
+    await task
+    assert produced == 50
+
+
+@pytest.mark.asyncio
+async def test_stage_failure_cancels_pipeline():
+    async def fail(batch):
+        if batch.number == 2:
+            raise ValueError("bad batch")
+        return batch
+
+    async def sink(batch):
+        return None
+
+    with pytest.raises(ValueError, match="bad batch"):
+        await StagedPipeline("test", [Stage("fail", fail), Stage("sink", sink)]).run(
+            _source(100)
+        )
+
+
+def _sample(name, pipeline, stage):
+    return REGISTRY.get_sample_value(name, {"pipeline": pipeline, "stage": stage}) or 0
+
+
+@pytest.mark.asyncio
+async def test_stage_metrics_count_read_skipped_and_failed_records():
+    async def keep_even(batch):
+        if batch.number % 2:
+            return None
+        return batch
+
+    async def fail_last(batch):
+        if batch.number == 4:
+            raise ValueError("boom")
+        return batch
+
+    pipeline = StagedPipeline(
+        "metrics-test",
+        [Stage("filter", keep_even), Stage("write", fail_last), Stage("sink", _noop)],
+    )
+    with pytest.raises(ValueError):
+        await pipeline.run(_source(5))
+
+    assert _sample("ingestion_stage_records_total", "metrics-test", "read") == 5
+    assert (
+        _sample("ingestion_stage_skipped_records_total", "metrics-test", "filter") == 2
+    )
+    assert _sample("ingestion_stage_failed_records_total", "metrics-test", "write") == 1
+
+
+async def _noop(batch):
+    return None
+
+
+def test_rate_meter_only_counts_the_window():
+    now = [0.0]
+    gauge = Gauge("test_rate_meter_rate", "Rate used by the rate meter test")
+    meter = RateMeter(gauge, window=10.0, clock=lambda: now[0])
+
+    now[0] = 10.0
+    assert meter.add(100) == 10.0
+    now[0] = 25.0
+    # The first sample left the window; only the new one counts.
+    assert meter.add(50) == 5.0
+    meter.reset()
+    assert REGISTRY.get_sample_value("test_rate_meter_rate") == 0
@@ -0,0 +1,108 @@
+# tests/ingestion/test_readers.py
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from graph.infra.config.schemas.ingestion.ingestion_config import \
+    IngestionSettings
+from graph.ingestion.readers import ArrowReader, JsonlReader, create_reader
+from graph.ingestion.service import IngestionService
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+@pytest.fixture
+def parquet_docs(tmp_path):
+    path = tmp_path / "documents.parquet"
+    table = pa.table(
+        {
+            "id": [f"d{i}" for i in range(5)],
+            "text": [f"text {i}" for i in range(5)],
+            "embedding": pa.array(
+                [[float(i), 1.0] for i in range(5)], type=pa.list_(pa.float32(), 2)
+            ),
+        }
+    )
+    pq.write_table(table, path, row_group_size=2)
+    return str(path)
+
+
+def test_reader_is_picked_by_extension(parquet_docs):
+    assert isinstance(create_reader(parquet_docs), ArrowReader)
+    assert isinstance(create_reader("documents.jsonl"), JsonlReader)
+
+
+def test_jsonl_precomputed_embeddings_become_vectors(tmp_path):
+    path = tmp_path / "documents.jsonl"
+    rows = [
+        {"id": "a", "text": "x", "vec": [1, 2]},
+        {"id": "b", "text": "y", "vec": [3, 4]},
+    ]
+    path.write_text("".join(json.dumps(r) + "\n" for r in rows))
+    reader = JsonlReader(decoder="auto", embedding_column="vec")
+
+    [batch] = [reader.decode(b) for b in reader.batches(str(path), batch_size=10)]
+
+    assert batch.records == [{"id": "a", "text": "x"}, {"id": "b", "text": "y"}]
+    np.testing.assert_array_equal(batch.vectors, [[1, 2], [3, 4]])
+
+
+def test_parquet_batches_are_columnar_and_resumable(parquet_docs):
+    reader = ArrowReader("parquet", embedding_column="embedding")
+
+    batches = list(reader.batches(parquet_docs, batch_size=2, start_offset=3))
+
+    assert [(b.start_offset, b.end_offset) for b in batches] == [(3, 4), (4, 5)]
+    assert batches[0].column("text") == ["text 3"]
+    assert "embedding" not in batches[0].columns
+    np.testing.assert_array_equal(batches[1].vectors, [[4.0, 1.0]])
+    decoded = reader.decode(batches[0])
+    assert decoded.records == []
+    assert decoded.as_records() == [{"id": "d3", "text": "text 3"}]
+
+
+@pytest.mark.parametrize("parts", [1, 2, 3, 7])
+def test_split_ranges_cover_every_record_once(tmp_path, parquet_docs, parts):
+    jsonl_path = tmp_path / "documents.jsonl"
+    jsonl_path.write_text(
+        "".join(json.dumps({"id": f"d{i}", "text": "x" * i}) + "\n" for i in range(9))
+    )
+    for path, expected in ((str(jsonl_path), 9), (parquet_docs, 5)):
+        reader = create_reader(path)
+        ids = [
+            record["id"]
+            for start, end in reader.split(path, parts)
+            for batch in reader.batches(path, 2, start, 0, end)
+            for record in reader.decode(batch).as_records()
+        ]
+        assert len(ids) == expected
+        assert len(set(ids)) == expected
+
+
+@pytest.mark.asyncio
+async def test_precomputed_vectors_bypass_the_model(parquet_docs, tmp_path):
+    empty = tmp_path / "empty.jsonl"
+    empty.write_text("")
+    graph_store, vector_store = AsyncMock(), AsyncMock()
+    graph_store.is_ready = MagicMock(return_value=True)
+    vector_store.is_ready = MagicMock(return_value=True)
+
+    embedder = AsyncMock()
+    embedder.encode.side_effect = lambda texts: np.ones((len(texts), 4))
+    service = IngestionService(
+        graph_store=graph_store,
+        vector_store=vector_store,
+        settings=IngestionSettings(batch_size=2, embedding_column="embedding"),
+        embedding_service=embedder,
+    )
+    await service.run_pipeline(parquet_docs, str(empty), str(empty))
+
+    embedder.encode.assert_not_called()
+    vectors = np.concatenate(
+        [c.kwargs["vectors"] for c in vector_store.upsert_documents.await_args_list]
+    )
+    assert sorted(vectors[:, 0].tolist()) == [0.0, 1.0, 2.0, 3.0, 4.0]
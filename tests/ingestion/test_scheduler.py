@@ -0,0 +1,83 @@
+# tests/ingestion/test_scheduler.py
+
+import asyncio
+
+import pytest
+
+from graph.ingestion.scheduler import CommitTracker, DagScheduler, PipelineNode
+
+
+@pytest.mark.asyncio
+async def test_independent_nodes_overlap_and_dependents_wait():
+    events = []
+
+    def node(name, delay, depends_on=()):
+        async def run():
+            events.append(f"start {name}")
+            await asyncio.sleep(delay)
+            events.append(f"end {name}")
+
+        return PipelineNode(name, run, list(depends_on))
+
+    await DagScheduler(
+        [
+            node("docs", 0.05),
+            node("entities", 0.02),
+            node("links", 0, ["docs", "entities"]),
+        ]
+    ).run()
+
+    assert events[:2] == ["start docs", "start entities"]
+    assert events.index("start links") > events.index("end docs")
+
+
+def test_cycles_and_unknown_dependencies_are_rejected():
+    async def noop():
+        pass
+
+    with pytest.raises(ValueError, match="cycle"):
+        DagScheduler([PipelineNode("a", noop, ["b"]), PipelineNode("b", noop, ["a"])])
+    with pytest.raises(ValueError, match="unknown"):
+        DagScheduler([PipelineNode("a", noop, ["missing"])])
+
+
+@pytest.mark.asyncio
+async def test_failure_cancels_other_nodes():
+    cancelled = asyncio.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def broken():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await DagScheduler(
+            [PipelineNode("slow", slow), PipelineNode("b", broken)]
+        ).run()
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_tracker_releases_waits_on_commit_or_finish():
+    tracker = CommitTracker()
+    tracker.watch("documents")
+
+    committed = asyncio.create_task(tracker.wait_for("documents", ["d1", "d2"]))
+    never_committed = asyncio.create_task(tracker.wait_for("documents", ["d9"]))
+    await tracker.commit("documents", ["d1"])
+    await asyncio.sleep(0)
+    assert not committed.done()
+
+    await tracker.commit("documents", ["d2"])
+    await asyncio.wait_for(committed, timeout=1)
+    assert not never_committed.done()
+
+    await tracker.finish("documents")
+    await asyncio.wait_for(never_committed, timeout=1)
+    # Kinds nobody watches never block.
+    await asyncio.wait_for(tracker.wait_for("entities", ["e1"]), timeout=1)
@@ -0,0 +1,41 @@
+# tests/retrieval/test_chunk_retrieval.py
+
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from graph.infra.store.ids import chunk_id
+from graph.retrieval.service import RetrievalService
+
+
+@pytest.mark.asyncio
+async def test_chunk_hits_are_merged_into_their_documents():
+    vector_store, graph_store = AsyncMock(), AsyncMock()
+    embedding_service = AsyncMock()
+    embedding_service.encode.return_value = np.array([[0.1, 0.2]])
+    service = RetrievalService(
+        vector_store=vector_store,
+        graph_store=graph_store,
+        top_k=2,
+        chunk_oversample=3,
+        embedding_service=embedding_service,
+    )
+    vector_store.vector_search.return_value = [
+        {"doc_id": doc_id, "text": text, "entities": [], "dense_score": score}
+        for doc_id, text, score in (
+            (chunk_id("d1", 2), "best", 0.9),
+            (chunk_id("d2", 0), "two", 0.8),
+            (chunk_id("d1", 0), "worse", 0.7),
+            ("d3", "plain", 0.6),
+        )
+    ]
+
+    results = await service.query("question")
+
+    assert vector_store.vector_search.await_args.kwargs["top_k"] == 6
+    assert [(r["doc_id"], r["text"]) for r in results] == [
+        ("d1", "best"),
+        ("d2", "two"),
+    ]
+    assert results[0]["chunk_id"] == chunk_id("d1", 2)
@@ -0,0 +1,142 @@
+# tests/retrieval/test_response_cache.py
+
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from graph.infra.config.schemas.retrieval import ResponseCacheSettings
+from graph.infra.context.context_vars import set_tenant_id
+from src.graph.retrieval.cache import ResponseCache
+from src.graph.retrieval.epoch import FileIngestionEpoch, RedisIngestionEpoch
+from src.graph.retrieval.service import RetrievalService
+
+HITS = [{"doc_id": "doc1", "text": "About apples.", "dense_score": 0.9}]
+
+
+class LocalRedis:
+    """In-process stand-in for the few Redis commands the cache uses."""
+
+    def __init__(self):
+        self.data = {}
+        self.fail = False
+
+    async def get(self, key):
+        if self.fail:
+            raise ConnectionError("redis down")
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.data[key] = value.encode("utf-8")
+
+    async def incr(self, key):
+        self.data[key] = int(self.data.get(key) or 0) + 1
+        return self.data[key]
+
+    async def aclose(self):
+        pass
+
+
+def _settings(tmp_path, **overrides):
+    values = {"epoch_path": str(tmp_path / "epoch"), "epoch_refresh_seconds": 0}
+    values.update(overrides)
+    return ResponseCacheSettings(**values)
+
+
+def _service(cache):
+    vector_store = AsyncMock()
+    vector_store.vector_search.side_effect = lambda **kwargs: [
+        dict(hit) for hit in HITS
+    ]
+    embedding_service = AsyncMock()
+    embedding_service.encode.return_value = np.array([[0.1, 0.2, 0.3]])
+    service = RetrievalService(
+        vector_store=vector_store,
+        graph_store=AsyncMock(),
+        embedding_service=embedding_service,
+        response_cache=cache,
+    )
+    return service, vector_store
+
+
+@pytest.mark.asyncio
+async def test_repeated_queries_are_served_from_the_cache(tmp_path):
+    service, vector_store = _service(ResponseCache(_settings(tmp_path)))
+
+    first = await service.query("apples")
+    second = await service.query(" apples ")
+
+    assert vector_store.vector_search.await_count == 1
+    assert second == first and second[0] is not first[0]
+
+
+@pytest.mark.asyncio
+async def test_an_ingestion_epoch_bump_invalidates_cached_responses(tmp_path):
+    settings = _settings(tmp_path)
+    service, vector_store = _service(ResponseCache(settings))
+
+    await service.query("apples")
+    await FileIngestionEpoch(settings.epoch_path).bump()
+    await service.query("apples")
+
+    assert vector_store.vector_search.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_tenants_do_not_share_cached_responses(tmp_path):
+    service, vector_store = _service(ResponseCache(_settings(tmp_path)))
+
+    for tenant in ("tenant-a", "tenant-b", "tenant-a"):
+        set_tenant_id(tenant)
+        await service.query("apples")
+    set_tenant_id(None)
+
+    assert vector_store.vector_search.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_processes_share_responses_through_the_redis_tier(tmp_path):
+    redis = LocalRedis()
+    settings = _settings(tmp_path, max_entries=0)
+    service_a, store_a = _service(ResponseCache(settings, redis=redis))
+    service_b, store_b = _service(ResponseCache(settings, redis=redis))
+
+    await service_a.query("apples")
+    result = await service_b.query("apples")
+
+    assert store_a.vector_search.await_count == 1
+    assert store_b.vector_search.await_count == 0
+    assert result[0]["doc_id"] == "doc1"
+
+    await RedisIngestionEpoch(redis).bump()
+    await service_b.query("apples")
+    assert store_b.vector_search.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_a_failing_redis_tier_only_costs_cache_misses(tmp_path):
+    redis = LocalRedis()
+    redis.fail = True
+    service, vector_store = _service(
+        ResponseCache(_settings(tmp_path, max_entries=0), redis=redis)
+    )
+
+    assert (await service.query("apples"))[0]["doc_id"] == "doc1"
+    assert (await service.query("apples"))[0]["doc_id"] == "doc1"
+    assert vector_store.vector_search.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_the_memory_tier_evicts_least_recently_used_responses(tmp_path):
+    cache = ResponseCache(_settings(tmp_path, max_entries=2))
+    keys = [await cache.key(f"query {i}") for i in range(3)]
+
+    await cache.put(keys[0], [{"doc_id": "0"}])
+    await cache.put(keys[1], [{"doc_id": "1"}])
+    await cache.get(keys[0])
+    await cache.put(keys[2], [{"doc_id": "2"}])
+
+    assert await cache.get(keys[1]) is None
+    assert await cache.get(keys[0]) == [{"doc_id": "0"}]
@@ -0,0 +1,116 @@
+# tests/retrieval/test_retrieval_deadline.py
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from graph.infra.config.schemas.retrieval import ResponseCacheSettings
+from graph.infra.context import DeadlineExceeded, run_within_deadline
+from graph.infra.context.context_vars import (is_timeout_cancelled,
+                                              set_timeout_deadline)
+from src.graph.retrieval.cache import ResponseCache
+from src.graph.retrieval.service import RetrievalService
+
+HITS = [
+    {
+        "doc_id": "doc1",
+        "text": "About apples.",
+        "dense_score": 0.5,
+        "entities": ["apple"],
+    },
+    {
+        "doc_id": "doc2",
+        "text": "About pears.",
+        "dense_score": 0.9,
+        "entities": ["pear"],
+    },
+]
+
+
+def _service(graph_seconds=0.0, vector_seconds=0.0, cache=None):
+    async def vector_search(**kwargs):
+        await asyncio.sleep(vector_seconds)
+        return [dict(hit) for hit in HITS]
+
+    async def expand_entities(**kwargs):
+        await asyncio.sleep(graph_seconds)
+        return [{"id": "apple"}]
+
+    vector_store = AsyncMock()
+    vector_store.vector_search.side_effect = vector_search
+    graph_store = AsyncMock()
+    graph_store.expand_entities.side_effect = expand_entities
+    embedding_service = AsyncMock()
+    embedding_service.encode.return_value = np.array([[0.1, 0.2, 0.3]])
+    service = RetrievalService(
+        vector_store=vector_store,
+        graph_store=graph_store,
+        embedding_service=embedding_service,
+        rerank_boost=1.0,
+        response_cache=cache,
+    )
+    return service, vector_store
+
+
+@pytest.mark.asyncio
+async def test_queries_within_the_deadline_use_the_graph():
+    service, _ = _service()
+    set_timeout_deadline(time.time() + 5)
+
+    docs = await service.query("fruit")
+
+    assert [doc["doc_id"] for doc in docs] == ["doc1", "doc2"]
+    assert not any(doc.get("degraded") for doc in docs)
+
+
+@pytest.mark.asyncio
+async def test_a_slow_graph_degrades_to_dense_only_results():
+    service, _ = _service(graph_seconds=1.0)
+    set_timeout_deadline(time.time() + 0.1)
+
+    docs = await service.query("fruit")
+
+    assert [doc["doc_id"] for doc in docs] == ["doc2", "doc1"]
+    assert all(doc["degraded"] for doc in docs)
+    assert docs[0]["final_score"] == docs[0]["dense_score"]
+
+
+@pytest.mark.asyncio
+async def test_degraded_results_are_not_cached(tmp_path):
+    cache = ResponseCache(
+        ResponseCacheSettings(
+            epoch_path=str(tmp_path / "epoch"), epoch_refresh_seconds=0
+        )
+    )
+    service, vector_store = _service(graph_seconds=1.0, cache=cache)
+
+    set_timeout_deadline(time.time() + 0.1)
+    assert (await service.query("fruit"))[0]["degraded"]
+    set_timeout_deadline(time.time() + 0.1)
+    await service.query("fruit")
+
+    assert vector_store.vector_search.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_an_expired_vector_search_raises():
+    service, _ = _service(vector_seconds=1.0)
+    set_timeout_deadline(time.time() + 0.1)
+
+    with pytest.raises(DeadlineExceeded) as e:
+        await service.query("fruit")
+
+    assert e.value.stage == "vector_search"
+
+
+@pytest.mark.asyncio
+async def test_an_expired_stage_marks_the_context_cancelled():
+    set_timeout_deadline(time.time() + 0.05)
+
+    with pytest.raises(DeadlineExceeded):
+        await run_within_deadline(asyncio.sleep(1), "stage")
+
+    assert is_timeout_cancelled() is True
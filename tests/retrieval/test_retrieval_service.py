@@ -1,7 +1,8 @@
 # tests/retrieval/test_retrieval_service.py
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
+import numpy as np
 import pytest
 
 from src.graph.retrieval.service import RetrievalService
@@ -22,12 +23,14 @@ def mock_graph_store():
 @pytest.fixture
 def retrieval_service(mock_vector_store, mock_graph_store):
     """Fixture to create a RetrievalService instance with mocked dependencies."""
-    service = RetrievalService(
-        vector_store=mock_vector_store, graph_store=mock_graph_store, rerank_boost=0.5
+    embedding_service = AsyncMock()
+    embedding_service.encode.return_value = np.array([[0.1, 0.2, 0.3]])
+    return RetrievalService(
+        vector_store=mock_vector_store,
+        graph_store=mock_graph_store,
+        rerank_boost=0.5,
+        embedding_service=embedding_service,
     )
-    service.embedding_model = MagicMock()
-    service.embedding_model.encode.return_value.tolist.return_value = [0.1, 0.2, 0.3]
-    return service
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,178 @@
+# tests/retrieval/test_single_flight.py
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from graph.infra.context.context_vars import (set_tenant_id,
+                                              set_timeout_deadline)
+from graph.infra.context.deadline import DeadlineExceeded, run_within_deadline
+from src.graph.retrieval.service import RetrievalService
+from src.graph.retrieval.single_flight import SingleFlight
+
+HITS = [{"doc_id": "doc1", "text": "About apples.", "dense_score": 0.9}]
+
+
+def _service(vector_store):
+    embedding_service = AsyncMock()
+    embedding_service.encode.return_value = np.array([[0.1, 0.2, 0.3]])
+    return RetrievalService(
+        vector_store=vector_store,
+        graph_store=AsyncMock(),
+        embedding_service=embedding_service,
+    )
+
+
+def _slow_search(release: asyncio.Event):
+    async def search(**kwargs):
+        await release.wait()
+        return [dict(hit) for hit in HITS]
+
+    return search
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_queries_share_one_pipeline_run():
+    release = asyncio.Event()
+    vector_store = AsyncMock()
+    vector_store.vector_search.side_effect = _slow_search(release)
+    service = _service(vector_store)
+
+    tasks = [
+        asyncio.create_task(service.query(text))
+        for text in ("apples", "apples", "  apples ")
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert vector_store.vector_search.await_count == 1
+    assert all(result[0]["doc_id"] == "doc1" for result in results)
+    assert results[0][0] is not results[1][0]
+
+
+@pytest.mark.asyncio
+async def test_queries_of_different_tenants_are_not_coalesced():
+    release = asyncio.Event()
+    vector_store = AsyncMock()
+    vector_store.vector_search.side_effect = _slow_search(release)
+    service = _service(vector_store)
+
+    async def query_as(tenant):
+        set_tenant_id(tenant)
+        return await service.query("apples")
+
+    tasks = [asyncio.create_task(query_as(t)) for t in ("tenant-a", "tenant-b")]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert vector_store.vector_search.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_a_cancelled_leader_leaves_the_computation_to_the_others():
+    flights = SingleFlight()
+    release = asyncio.Event()
+
+    async def compute():
+        await release.wait()
+        return "result"
+
+    leader = asyncio.create_task(flights.do("key", compute))
+    follower = asyncio.create_task(flights.do("key", compute))
+    await asyncio.sleep(0)
+    leader.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await follower == "result"
+    assert leader.cancelled()
+    assert flights.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_the_computation_stops_when_every_caller_is_cancelled():
+    flights = SingleFlight()
+    started, stopped = asyncio.Event(), asyncio.Event()
+
+    async def compute():
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            stopped.set()
+
+    callers = [asyncio.create_task(flights.do("key", compute)) for _ in range(2)]
+    await started.wait()
+    for caller in callers:
+        caller.cancel()
+    await asyncio.gather(*callers, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert stopped.is_set()
+    assert flights.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_a_failure_reaches_every_waiting_caller():
+    flights = SingleFlight()
+
+    async def compute():
+        await asyncio.sleep(0)
+        raise ConnectionError("vector store down")
+
+    results = await asyncio.gather(
+        flights.do("key", compute), flights.do("key", compute), return_exceptions=True
+    )
+
+    assert all(isinstance(result, ConnectionError) for result in results)
+
+
+async def _within_budget(budget, call):
+    set_timeout_deadline(time.time() + budget)
+    return await call()
+
+
+@pytest.mark.asyncio
+async def test_a_caller_with_a_shorter_budget_stops_waiting_at_its_deadline():
+    flights = SingleFlight()
+
+    async def compute():
+        await asyncio.sleep(0.3)
+        return "result"
+
+    leader = asyncio.create_task(_within_budget(5, lambda: flights.do("key", compute)))
+    await asyncio.sleep(0)
+    started = time.monotonic()
+
+    with pytest.raises(DeadlineExceeded):
+        await _within_budget(0.05, lambda: flights.do("key", compute))
+
+    assert time.monotonic() - started < 0.2
+    assert await leader == "result"
+
+
+@pytest.mark.asyncio
+async def test_a_caller_with_a_longer_budget_does_not_share_a_cut_short_run():
+    flights = SingleFlight()
+    runs = []
+
+    async def compute():
+        runs.append(1)
+        try:
+            return await run_within_deadline(asyncio.sleep(0.2, "full"), "graph")
+        except DeadlineExceeded:
+            return "degraded"
+
+    results = await asyncio.gather(
+        _within_budget(0.05, lambda: flights.do("key", compute)),
+        _within_budget(5, lambda: flights.do("key", compute)),
+        _within_budget(5, lambda: flights.do("key", compute)),
+    )
+
+    assert results == ["degraded", "full", "full"]
+    assert len(runs) == 2